@@ -6,7 +6,6 @@
 """
 
 import asyncio
-import json
 import logging
 import re
 import subprocess
@@ -114,13 +113,16 @@ async def _execute_tool_discovery(
 
     result = results[0]
 
+    # stdout is read from the tool's output file on every access; read it once
+    stdout = result.stdout
+
     # Build result summary
     summary = {
         "name": result.name,
         "command": result.command,
         "exit_code": result.exit_code,
         "duration": result.duration_seconds,
-        "stdout_lines": len(result.stdout.split("\n")) if result.stdout else 0,
+        "stdout_lines": stdout.count("\n") + 1 if stdout else 0,
         "success": result.success,
         "tasks_created": 0,
         "error": result.error_message,
@@ -143,7 +145,7 @@ async def _execute_tool_discovery(
         return summary
 
     # Check if tool produced output to analyze
-    if not result.has_output:
+    if not (stdout.strip() or result.stderr.strip()):
         summary["error"] = "No output from tool"
         return summary
 
@@ -172,9 +174,8 @@ async def _execute_tool_discovery(
         click.echo(f"   📝 [DRY-RUN] Output file size: {output_size} bytes")
         # Show tool output content
         if result.output_path and result.output_path.exists():
-            tool_output = result.output_path.read_text()
             click.echo(f"   📝 [DRY-RUN] Tool output:")
-            for line in tool_output.strip().split("\n"):
+            for line in stdout.strip().split("\n"):
                 click.echo(f"      {line}")
         click.echo(f"   📝 [DRY-RUN] Prompt preview (first 500 chars):")
         click.echo(f"      {prompt[:500]}...")
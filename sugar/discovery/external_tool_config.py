@@ -17,10 +17,13 @@
 import os
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
+# Matches $VAR or ${VAR}; compiled once since every tool run expands its command
+_ENV_VAR_RE = re.compile(r"\$\{?([A-Za-z_][A-Za-z0-9_]*)\}?")
+
 
 class ExternalToolConfigError(Exception):
     """Raised when external tool configuration is invalid"""
@@ -28,9 +31,13 @@ class ExternalToolConfigError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExternalToolConfig:
-    """Configuration for a single external code quality tool"""
+    """Configuration for a single external code quality tool
+
+    Immutable once validated; build instances via validate_external_tool for
+    config input, since the dataclass itself performs no checks.
+    """
 
     name: str
     command: str
@@ -42,7 +49,7 @@ def get_expanded_command(self) -> str:
         return expand_env_vars(self.command)
 
 
-def expand_env_vars(command: str) -> str:
+def expand_env_vars(command: str, environ: Optional[Mapping[str, str]] = None) -> str:
     """
     Expand environment variables in a command string.
 
@@ -51,16 +58,21 @@ def expand_env_vars(command: str) -> str:
 
     Args:
         command: Command string potentially containing environment variables
+        environ: Environment to read variables from (defaults to os.environ)
 
     Returns:
         Command string with environment variables expanded
     """
-    # Pattern to match $VAR or ${VAR}
-    pattern = r"\$\{?([A-Za-z_][A-Za-z0-9_]*)\}?"
+    # Most commands reference no variables at all
+    if "$" not in command:
+        return command
+
+    if environ is None:
+        environ = os.environ
 
     def replace_var(match):
         var_name = match.group(1)
-        value = os.environ.get(var_name)
+        value = environ.get(var_name)
         if value is None:
             logger.warning(
                 f"Environment variable '{var_name}' is not set, "
@@ -69,7 +81,7 @@ def replace_var(match):
             return match.group(0)
         return value
 
-    return re.sub(pattern, replace_var, command)
+    return _ENV_VAR_RE.sub(replace_var, command)
 
 
 def validate_external_tool(
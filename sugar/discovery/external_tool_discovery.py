@@ -7,6 +7,7 @@
 """
 
 import logging
+import re
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -20,6 +21,12 @@
 
 logger = logging.getLogger(__name__)
 
+# Matches: sugar add "title" --type=X --priority=Y --description="Z"
+_SUGAR_ADD_RE = re.compile(
+    r'sugar\s+add\s+"([^"]+)"(?:\s+--type[=\s]+(\w+))?(?:\s+--priority[=\s]+(\d+))?(?:\s+--description[=\s]+"([^"]*)")?',
+    re.IGNORECASE,
+)
+
 
 class ExternalToolDiscovery:
     """
@@ -101,8 +108,10 @@ async def discover(self) -> List[Dict[str, Any]]:
         )
 
         try:
-            # Execute all tools
-            results = orchestrator.execute_all(timeout_per_tool=self.default_timeout)
+            # Execute all tools off the event loop
+            results = await orchestrator.execute_all_async(
+                timeout_per_tool=self.default_timeout
+            )
 
             # Process results and create work items
             for result in results:
@@ -112,8 +121,8 @@ async def discover(self) -> List[Dict[str, Any]]:
         except Exception as e:
             logger.error(f"Error executing external tools: {e}")
         finally:
-            # Clean up temp files
-            orchestrator.cleanup()
+            # Output has been processed; remove temp files in the background
+            orchestrator.cleanup(wait=False)
 
         logger.debug(
             f"🔍 ExternalToolDiscovery discovered {len(work_items)} work items"
@@ -199,16 +208,19 @@ async def _parse_tool_output(self, result: ToolResult) -> List[Dict[str, Any]]:
         """
         work_items = []
 
+        # stdout is read from the tool's output file on every access; read it once
+        stdout = result.stdout
+
         # Generate a hash to avoid duplicate work items
-        output_hash = hash(f"{result.name}:{result.stdout[:1000]}")
+        output_hash = hash(f"{result.name}:{stdout[:1000]}")
         if output_hash in self._processed_hashes:
             logger.debug(f"Skipping duplicate work item for {result.name}")
             return work_items
         self._processed_hashes.add(output_hash)
 
         # Create a summary work item for this tool's findings
-        stdout_preview = result.stdout[:500] if result.stdout else ""
-        if len(result.stdout) > 500:
+        stdout_preview = stdout[:500]
+        if len(stdout) > 500:
             stdout_preview += "..."
 
         # Use output hash in source_file to ensure uniqueness across different tool runs
@@ -217,7 +229,7 @@ async def _parse_tool_output(self, result: ToolResult) -> List[Dict[str, Any]]:
             "id": str(uuid.uuid4()),
             "type": "refactor",
             "title": f"Fix issues found by {result.name}",
-            "description": self._generate_description(result),
+            "description": self._generate_description(result, stdout),
             "priority": 3,  # Medium priority for linting/quality issues
             "status": "pending",
             "source": self.SOURCE_EXTERNAL_TOOLS,
@@ -237,8 +249,17 @@ async def _parse_tool_output(self, result: ToolResult) -> List[Dict[str, Any]]:
         work_items.append(work_item)
         return work_items
 
-    def _generate_description(self, result: ToolResult) -> str:
-        """Generate a description for the work item based on tool output."""
+    def _generate_description(
+        self, result: ToolResult, stdout: Optional[str] = None
+    ) -> str:
+        """Generate a description for the work item based on tool output.
+
+        Pass ``stdout`` when it has already been read to avoid re-reading the
+        tool's output file.
+        """
+        if stdout is None:
+            stdout = result.stdout
+
         lines = []
         lines.append(f"External tool '{result.name}' found issues that need attention.")
         lines.append("")
@@ -248,12 +269,12 @@ def _generate_description(self, result: ToolResult) -> str:
         lines.append("")
 
         # Include a preview of the output
-        if result.stdout:
+        if stdout:
             lines.append("**Output Preview:**")
             lines.append("```")
-            preview_lines = result.stdout.split("\n")[:20]
-            lines.extend(preview_lines)
-            if len(result.stdout.split("\n")) > 20:
+            stdout_lines = stdout.split("\n")
+            lines.extend(stdout_lines[:20])
+            if len(stdout_lines) > 20:
                 lines.append("... (truncated)")
             lines.append("```")
 
@@ -261,9 +282,9 @@ def _generate_description(self, result: ToolResult) -> str:
             lines.append("")
             lines.append("**Stderr:**")
             lines.append("```")
-            stderr_lines = result.stderr.split("\n")[:10]
-            lines.extend(stderr_lines)
-            if len(result.stderr.split("\n")) > 10:
+            stderr_lines = result.stderr.split("\n")
+            lines.extend(stderr_lines[:10])
+            if len(stderr_lines) > 10:
                 lines.append("... (truncated)")
             lines.append("```")
 
@@ -362,15 +383,9 @@ def _parse_sugar_add_commands(
         Returns:
             List of work item dictionaries
         """
-        import re
-
         work_items = []
 
-        # Pattern to match sugar add commands
-        # Matches: sugar add "title" --type=X --priority=Y --description="Z"
-        pattern = r'sugar\s+add\s+"([^"]+)"(?:\s+--type[=\s]+(\w+))?(?:\s+--priority[=\s]+(\d+))?(?:\s+--description[=\s]+"([^"]*)")?'
-
-        matches = re.findall(pattern, claude_output, re.IGNORECASE)
+        matches = _SUGAR_ADD_RE.findall(claude_output)
 
         for idx, match in enumerate(matches):
             title, task_type, priority, description = match
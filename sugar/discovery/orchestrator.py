@@ -5,33 +5,226 @@
 via subprocess and capturing their stdout/stderr without any parsing or modification.
 """
 
+import asyncio
 import atexit
+import functools
 import json
 import logging
+import mmap
+import os
+import shlex
 import shutil
 import signal
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from types import FrameType
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 
-from .external_tool_config import ExternalToolConfig
+from .external_tool_config import ExternalToolConfig, expand_env_vars
+
+# Optional jiter import: a Rust JSON parser used to speed up output validation
+try:
+    import jiter
+
+    JITER_AVAILABLE = True
+except ImportError:
+    JITER_AVAILABLE = False
+
+# Optional orjson import: a C JSON parser, used for validation without jiter
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 # Default timeout for tool execution (5 minutes)
 DEFAULT_TIMEOUT_SECONDS = 300
 
+# Characters that need a shell to interpret: pipes, lists, redirection,
+# substitution, globbing, grouping, escapes and comments
+_SHELL_METACHARACTERS = frozenset("|&;<>()$`\\*?[]{}~#!\n")
+
+# From this many tools up, execute_all lists each PATH directory once instead
+# of searching PATH per executable; below it the listing costs more than it saves
+PATH_INDEX_MIN_TOOLS = 8
+
+# Output files larger than this are memory-mapped for JSON validation, so the
+# text is decoded straight from the page cache without a bytes copy first
+MMAP_MIN_BYTES = 64 * 1024
+
+# Bytes read first when validating an output file; if that prefix already
+# cannot start a JSON value, the rest of the file is never read
+JSON_PREFIX_BYTES = 4096
+
+# ToolResult.stdout keeps output files up to this size in memory between reads;
+# larger outputs are re-read each time, since the file exists to keep them out
+STDOUT_CACHE_MAX_BYTES = 1024 * 1024
+
+# Single background worker for cleanup(wait=False); at interpreter exit
+# concurrent.futures joins it, so queued removals still finish
+_cleanup_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="sugar-cleanup"
+)
+
+
+# Shared stdlib decoder for validation; raw_decode skips json.loads' type
+# checks, and _check_json handles the surrounding whitespace itself
+_JSON_DECODER = json.JSONDecoder()
+_skip_whitespace = json.decoder.WHITESPACE.match
+
+# Characters a JSON value can start with, including json's NaN and Infinity
+_JSON_START = frozenset('{["-0123456789tfnNI')
+
+# Outputs up to this length are checked for a bare literal or integer first
+_SHORT_JSON_MAX_CHARS = 32
+_JSON_LITERALS = frozenset(("true", "false", "null"))
+_JSON_WHITESPACE = " \t\n\r"
+
+
+def _read_for_validation(path: Path) -> str:
+    """Read an output file as UTF-8 text for JSON validation.
+
+    Files longer than JSON_PREFIX_BYTES are probed first: when the prefix
+    cannot start a JSON value, only the prefix is returned, since validating
+    it fails with the same error as the whole file would. Large files are
+    decoded directly from a memory map, which avoids holding the raw bytes and
+    the decoded text in memory at the same time. Unlike Path.read_text,
+    newlines are not translated; JSON treats them all as whitespace either way.
+
+    Raises:
+        OSError: If the file cannot be opened or mapped
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > JSON_PREFIX_BYTES:
+            prefix = f.read(JSON_PREFIX_BYTES).decode("utf-8", errors="replace")
+            if _cannot_start_json(prefix):
+                return prefix
+            f.seek(0)
+        if size <= MMAP_MIN_BYTES:
+            return f.read().decode("utf-8", errors="replace")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, "utf-8", "replace")
+
+
+def _cannot_start_json(prefix: str) -> bool:
+    """Check whether a prefix of some output already rules out JSON.
+
+    Only an "Expecting value" error at the first non-whitespace character is
+    conclusive; anything later, such as an unterminated string, may just be
+    the prefix boundary. The prefix must also cover the warning preview.
+    """
+    start = _skip_whitespace(prefix, 0).end()
+    try:
+        _JSON_DECODER.raw_decode(prefix, start)
+    except json.JSONDecodeError as e:
+        conclusive = e.msg == "Expecting value" and e.pos == start
+        return conclusive and start + 100 < len(prefix)
+    return False
+
+
+def _is_json_scalar(token: str) -> bool:
+    """Check for a bare true/false/null or integer without running a parser.
+
+    Integers follow JSON's grammar: ASCII digits only, no leading zeros.
+    Anything else, including floats, is left to the parser.
+    """
+    if token in _JSON_LITERALS:
+        return True
+    digits = token[1:] if token[:1] == "-" else token
+    if not (digits.isascii() and digits.isdigit()):
+        return False
+    return digits == "0" or digits[0] != "0"
+
+
+def _check_json(text: str) -> None:
+    """Check that text is a single valid JSON document.
+
+    Uses jiter when it is installed, otherwise orjson. Anything the fast parser
+    rejects is re-parsed with the stdlib so callers always see json's own
+    error messages and rules (e.g. NaN and big integers stay valid).
+
+    Args:
+        text: The text to validate; surrounding whitespace is allowed
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    start = _skip_whitespace(text, 0).end()
+    if text[start : start + 1] not in _JSON_START:
+        # Plain text, tables, XML...: the error json.loads raises, without a parse
+        raise json.JSONDecodeError("Expecting value", text, start)
+    if len(text) <= _SHORT_JSON_MAX_CHARS and _is_json_scalar(
+        text.strip(_JSON_WHITESPACE)
+    ):
+        return
+    if JITER_AVAILABLE:
+        try:
+            jiter.from_json(
+                text.encode(), partial_mode=False, catch_duplicate_keys=False
+            )
+            return
+        except ValueError:
+            pass
+    elif ORJSON_AVAILABLE:
+        try:
+            orjson.loads(text)
+            return
+        except orjson.JSONDecodeError:
+            pass
+    # Mirrors json.loads: skip whitespace on both sides without copying text
+    _, end = _JSON_DECODER.raw_decode(text, start)
+    end = _skip_whitespace(text, end).end()
+    if end != len(text):
+        raise json.JSONDecodeError("Extra data", text, end)
+
+
+@functools.lru_cache(maxsize=256)
+def _split_command(command: str) -> Optional[Tuple[str, ...]]:
+    """Split a command into an argument tuple if it can run without a shell.
 
-@dataclass
+    Cached process-wide: the result depends only on the expanded command, and
+    discovery builds a new orchestrator for every run (or every tool).
+
+    Args:
+        command: The expanded command string
+
+    Returns:
+        The arguments, or None if the command uses shell features or the
+        platform has no POSIX shell quoting
+    """
+    if os.name != "posix" or not _SHELL_METACHARACTERS.isdisjoint(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        # Unbalanced quotes: leave it to the shell to report
+        return None
+    # Leading VAR=value assignments are shell syntax as well
+    if not argv or "=" in argv[0]:
+        return None
+    return tuple(argv)
+
+
+@dataclass(slots=True)
 class ToolResult:
     """Result of executing a single external tool.
 
     Output is stored in a temporary file to avoid memory issues with large outputs.
     The stdout property provides backward-compatible access by reading from the file.
+    Callers that already hold the output in memory can pass ``_stdout_override``
+    instead, which skips the file round-trip entirely.
+
+    Slotted to keep per-result allocation small when many tools are run. Not
+    frozen, since JSON validation is cached on the instance on first access.
     """
 
     name: str
@@ -45,54 +238,110 @@ class ToolResult:
     timed_out: bool = False
     tool_not_found: bool = False
 
-    # Private cached fields for JSON validation (set after first access)
-    _json_validated: bool = field(default=False, repr=False, compare=False)
-    _is_json_output: bool = field(default=False, repr=False, compare=False)
-    _json_parse_error: Optional[str] = field(default=None, repr=False, compare=False)
+    # In-memory stdout, used in place of output_path when set
+    _stdout_override: Optional[str] = field(default=None, repr=False, compare=False)
+
+    # (st_mtime_ns, st_size, text) of the last stdout read from output_path
+    _stdout_cache: Optional[Tuple[int, int, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Cached (is_json_output, json_parse_error), set on first access
+    _json_validation: Optional[Tuple[bool, Optional[str]]] = field(
+        default=None, repr=False, compare=False
+    )
 
     @property
     def stdout(self) -> str:
         """Read stdout from the output file.
 
+        Repeat reads of an unchanged file (same mtime and size) are served from
+        memory, as long as it is no larger than STDOUT_CACHE_MAX_BYTES.
+
+        Returns:
+            The in-memory override if set, otherwise the contents of the output
+            file, or empty string if no file exists.
+        """
+        if self._stdout_override is not None:
+            return self._stdout_override
+        if not self.output_path:
+            return ""
+        # A missing file surfaces as OSError, so no separate exists() stat
+        try:
+            st = os.stat(self.output_path)
+            cached = self._stdout_cache
+            if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+                return cached[2]
+            text = self.output_path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return ""
+        if st.st_size <= STDOUT_CACHE_MAX_BYTES:
+            self._stdout_cache = (st.st_mtime_ns, st.st_size, text)
+        return text
+
+    def invalidate_stdout_cache(self) -> None:
+        """Forget the cached stdout, e.g. after rewriting the output file in place."""
+        self._stdout_cache = None
+
+    @property
+    def stdout_size(self) -> int:
+        """Size of the output file in bytes, from a single stat without reading it.
+
         Returns:
-            The contents of the output file, or empty string if no file exists.
+            The output file size, or 0 if no file exists.
         """
-        if self.output_path and self.output_path.exists():
+        if self._stdout_override is not None:
+            return len(self._stdout_override.encode("utf-8"))
+        if self.output_path:
             try:
-                return self.output_path.read_text(encoding="utf-8", errors="replace")
+                return os.stat(self.output_path).st_size
             except OSError:
-                return ""
-        return ""
+                return 0
+        return 0
 
-    def _validate_json(self) -> None:
+    def _validate_json(self) -> Tuple[bool, Optional[str]]:
         """Validate if stdout is valid JSON and cache the result.
 
         This is a non-blocking operation - it logs warnings but never raises exceptions.
+
+        Returns:
+            Whether stdout is valid JSON, and the parse error if it is not
         """
-        if self._json_validated:
-            return
+        if self._json_validation is not None:
+            return self._json_validation
 
-        self._json_validated = True
-        output = self.stdout.strip()
+        if self._stdout_override is not None or not self.output_path:
+            output = self.stdout
+        else:
+            try:
+                output = _read_for_validation(self.output_path)
+            except OSError:
+                output = ""
 
-        if not output:
-            self._is_json_output = False
-            self._json_parse_error = None
-            return
+        # isspace() answers "anything here?" without allocating a stripped copy
+        if not output or output.isspace():
+            self._json_validation = (False, None)
+            return self._json_validation
 
         try:
-            json.loads(output)
-            self._is_json_output = True
-            self._json_parse_error = None
+            _check_json(output)
         except json.JSONDecodeError as e:
-            self._is_json_output = False
-            self._json_parse_error = str(e)
-            logger.warning(
-                "Tool '%s' output is not valid JSON: %s (first 100 chars: %s)",
-                self.name,
-                e,
-                output[:100] + "..." if len(output) > 100 else output,
-            )
+            self._json_validation = (False, str(e))
+            # The preview is only worth building if the warning will be emitted
+            if logger.isEnabledFor(logging.WARNING):
+                # Only the preview is trimmed, so at most 100 chars are copied
+                start = _skip_whitespace(output, 0).end()
+                preview = output[start : start + 100].rstrip()
+                logger.warning(
+                    "Tool '%s' output is not valid JSON: %s (first 100 chars: %s)",
+                    self.name,
+                    e,
+                    preview + "..." if len(output) - start > 100 else preview,
+                )
+            return self._json_validation
+
+        self._json_validation = (True, None)
+        return self._json_validation
 
     @property
     def is_json_output(self) -> bool:
@@ -101,8 +350,7 @@ def is_json_output(self) -> bool:
         Returns:
             True if stdout can be parsed as valid JSON, False otherwise.
         """
-        self._validate_json()
-        return self._is_json_output
+        return self._validate_json()[0]
 
     @property
     def json_parse_error(self) -> Optional[str]:
@@ -112,8 +360,7 @@ def json_parse_error(self) -> Optional[str]:
             Error message string if JSON parsing failed, None if parsing succeeded
             or if output is empty.
         """
-        self._validate_json()
-        return self._json_parse_error
+        return self._validate_json()[1]
 
     @property
     def has_output(self) -> bool:
@@ -122,6 +369,8 @@ def has_output(self) -> bool:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
+        # Spelled out rather than looped over with getattr: direct attribute
+        # loads build the dict in about half the time
         return {
             "name": self.name,
             "command": self.command,
@@ -149,22 +398,47 @@ class ToolOrchestrator:
 
     def __init__(
         self,
-        external_tools: List[ExternalToolConfig],
+        external_tools: Sequence[ExternalToolConfig],
         working_dir: Optional[Path] = None,
         default_timeout: int = DEFAULT_TIMEOUT_SECONDS,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize the orchestrator with tool configurations.
 
         Args:
-            external_tools: List of validated ExternalToolConfig objects
+            external_tools: Validated ExternalToolConfig objects, stored as a tuple
             working_dir: Working directory for tool execution (defaults to cwd)
             default_timeout: Default timeout in seconds for tool execution
+            max_workers: Maximum tools run concurrently by execute_all
+                (None uses the thread pool default, 1 runs tools sequentially)
         """
-        self.external_tools = external_tools
+        # Fixed for the orchestrator's lifetime, so the names are computed once
+        self.external_tools: Tuple[ExternalToolConfig, ...] = tuple(external_tools)
+        self._tool_names = tuple(tool.name for tool in self.external_tools)
         self.working_dir = Path(working_dir) if working_dir else Path.cwd()
         self.default_timeout = default_timeout
+        self.max_workers = max_workers
         self.temp_dir: Optional[Path] = None
+        # Serializes temp dir creation when tools run on worker threads
+        self._temp_lock = threading.Lock()
+        # Thread pool for execute_all, created on first use and reused across calls
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # shutil.which results by executable name, kept until cleanup()
+        self._which_cache: Dict[str, Optional[str]] = {}
+        # Expanded commands by (command, environment fingerprint), kept until cleanup()
+        self._expand_cache: Dict[Tuple[str, int], str] = {}
+        # Fingerprint of the environment snapshot for the execute_all run in progress
+        self._env_key: Optional[int] = None
+        # Executable names on PATH for the execute_all run in progress, if indexed
+        self._path_index: Optional[FrozenSet[str]] = None
+        # Running tool processes by tool name, so stragglers can be killed
+        self._processes: Dict[str, "subprocess.Popen[bytes]"] = {}
+        # Straggler timeout by tool name for tools reaped in the current run
+        self._stragglers: Dict[str, float] = {}
+        self._process_lock = threading.Lock()
+        # Pending background temp dir removal from cleanup(wait=False)
+        self._cleanup_future: Optional[Future] = None
         # Signal handlers can be callable, int (SIG_DFL/SIG_IGN), or None
         self._original_sigint_handler: Any = None
         self._original_sigterm_handler: Any = None
@@ -173,7 +447,7 @@ def __init__(
         self._setup_cleanup_handlers()
 
         logger.info(
-            f"ToolOrchestrator initialized with {len(external_tools)} tools, "
+            f"ToolOrchestrator initialized with {len(self.external_tools)} tools, "
             f"working_dir={self.working_dir}"
         )
 
@@ -221,29 +495,58 @@ def _ensure_temp_dir(self) -> Path:
         Returns:
             Path to the temp directory
         """
-        if not self.temp_dir or not self.temp_dir.exists():
-            # Create temp dir under .sugar/temp/ for Claude Code accessibility
-            sugar_temp_base = self.working_dir / ".sugar" / "temp"
-            sugar_temp_base.mkdir(parents=True, exist_ok=True)
-            self.temp_dir = Path(
-                tempfile.mkdtemp(prefix="discover_", dir=sugar_temp_base)
-            )
-            logger.debug(f"Created temp directory: {self.temp_dir}")
-        return self.temp_dir
+        with self._temp_lock:
+            if not self.temp_dir or not self.temp_dir.exists():
+                # Create temp dir under .sugar/temp/ for Claude Code accessibility
+                sugar_temp_base = self.working_dir / ".sugar" / "temp"
+                sugar_temp_base.mkdir(parents=True, exist_ok=True)
+                self.temp_dir = Path(
+                    tempfile.mkdtemp(prefix="discover_", dir=sugar_temp_base)
+                )
+                logger.debug(f"Created temp directory: {self.temp_dir}")
+            return self.temp_dir
+
+    def cleanup(self, wait: bool = True) -> None:
+        """Shut down the worker pool and remove temp directory and all contents.
+
+        Safe to call multiple times. ``temp_dir`` is reset immediately either way.
 
-    def cleanup(self) -> None:
-        """Remove temp directory and all contents.
-
-        Safe to call multiple times.
+        Args:
+            wait: Remove the directory before returning. With False the removal
+                runs on a background thread, tracked by ``_cleanup_future``, so
+                callers that are done with the output files don't pay for it.
         """
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        self._which_cache.clear()
+        self._expand_cache.clear()
+
         if self.temp_dir and self.temp_dir.exists():
-            try:
-                shutil.rmtree(self.temp_dir)
-                logger.debug(f"Cleaned up temp directory: {self.temp_dir}")
-            except OSError as e:
-                logger.warning(f"Failed to clean up temp directory: {e}")
-            finally:
-                self.temp_dir = None
+            temp_dir, self.temp_dir = self.temp_dir, None
+            if not wait:
+                try:
+                    self._cleanup_future = _cleanup_executor.submit(
+                        self._remove_temp_dir, temp_dir
+                    )
+                    return
+                except RuntimeError:
+                    # Interpreter is shutting down; remove it inline instead
+                    pass
+            self._remove_temp_dir(temp_dir)
+
+    @staticmethod
+    def _remove_temp_dir(temp_dir: Path) -> None:
+        """Delete a temp directory tree, logging rather than raising on failure.
+
+        Args:
+            temp_dir: The directory to remove
+        """
+        try:
+            shutil.rmtree(temp_dir)
+            logger.debug(f"Cleaned up temp directory: {temp_dir}")
+        except OSError as e:
+            logger.warning(f"Failed to clean up temp directory: {e}")
 
     @staticmethod
     def _decode_stderr(stderr: Any) -> str:
@@ -265,6 +568,7 @@ def execute_tool(
         self,
         tool_config: ExternalToolConfig,
         timeout: Optional[int] = None,
+        env: Optional[Dict[str, str]] = None,
     ) -> ToolResult:
         """
         Execute a single tool and return its raw output.
@@ -272,12 +576,14 @@ def execute_tool(
         Args:
             tool_config: Configuration for the tool to execute
             timeout: Optional timeout override in seconds
+            env: Environment snapshot to expand the command with and run it in
+                (None reads os.environ and lets the tool inherit it)
 
         Returns:
             ToolResult containing raw stdout/stderr and execution metadata
         """
         timeout = timeout or self.default_timeout
-        command = tool_config.get_expanded_command()
+        command = self._expand_command(tool_config.command, env)
 
         logger.info(f"Executing tool '{tool_config.name}': {command}")
 
@@ -293,7 +599,9 @@ def execute_tool(
         start_time = datetime.now()
 
         try:
-            result = self._run_subprocess(command, timeout, output_path)
+            result = self._run_subprocess(
+                tool_config.name, command, timeout, output_path, env
+            )
             duration = (datetime.now() - start_time).total_seconds()
             return self._create_success_result(
                 tool_config.name, command, result, duration, output_path
@@ -301,8 +609,9 @@ def execute_tool(
 
         except subprocess.TimeoutExpired as e:
             duration = (datetime.now() - start_time).total_seconds()
+            # e.timeout is the straggler timeout if execute_all reaped the tool
             return self._handle_timeout_error(
-                tool_config.name, command, timeout, e, duration, output_path
+                tool_config.name, command, e.timeout, e, duration, output_path
             )
 
         except OSError as e:
@@ -316,28 +625,81 @@ def execute_tool(
     def execute_all(
         self,
         timeout_per_tool: Optional[int] = None,
+        straggler_timeout: Optional[float] = None,
+        straggler_limit: int = 0,
     ) -> List[ToolResult]:
         """
         Execute all configured tools and return their results.
 
         Args:
             timeout_per_tool: Optional timeout override per tool in seconds
+            straggler_timeout: Once only ``straggler_limit`` tools are still
+                running, give them this many more seconds before killing them
+                and reporting them as timed out (None disables straggler reaping)
+            straggler_limit: How many slow tools may remain when the straggler
+                timer starts; 0 waits for every tool as usual
 
         Returns:
             List of ToolResult objects, one per configured tool
         """
-        results: List[ToolResult] = []
-
+        # Nothing to run: return before any temp dir, pool or result bookkeeping
         if not self.external_tools:
-            logger.info("No external tools configured, nothing to execute")
-            return results
+            logger.debug("No external tools configured, nothing to execute")
+            return []
 
         logger.info(f"Executing {len(self.external_tools)} configured tools")
 
-        for tool_config in self.external_tools:
-            result = self.execute_tool(tool_config, timeout=timeout_per_tool)
-            results.append(result)
-
+        # Snapshot the environment once per run: every tool sees the same
+        # variables, and the fingerprint lets repeated commands reuse their
+        # expansion until a variable changes
+        env = dict(os.environ)
+        self._env_key = hash(frozenset(env.items()))
+        if len(self.external_tools) >= PATH_INDEX_MIN_TOOLS:
+            self._path_index = self._build_path_index(env)
+        try:
+            if straggler_timeout is not None or (
+                self.max_workers != 1 and len(self.external_tools) > 1
+            ):
+                # Tools are independent subprocesses, so run them side by side.
+                # One mkdtemp up front serves every worker; the lock in
+                # _ensure_temp_dir keeps solo execute_tool callers safe too.
+                self._ensure_temp_dir()
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="sugar-tool"
+                    )
+                if straggler_timeout is None:
+                    # map() yields results in configured tool order
+                    results = list(
+                        self._pool.map(
+                            lambda tool_config: self.execute_tool(
+                                tool_config, timeout=timeout_per_tool, env=env
+                            ),
+                            self.external_tools,
+                        )
+                    )
+                else:
+                    # Dicts keep insertion order, so results stay in tool order
+                    futures = {
+                        self._pool.submit(
+                            self.execute_tool, tool_config, timeout_per_tool, env
+                        ): tool_config.name
+                        for tool_config in self.external_tools
+                    }
+                    self._reap_stragglers(futures, straggler_timeout, straggler_limit)
+                    results = [future.result() for future in futures]
+            else:
+                results = [
+                    self.execute_tool(tool_config, timeout=timeout_per_tool, env=env)
+                    for tool_config in self.external_tools
+                ]
+        finally:
+            self._env_key = None
+            self._path_index = None
+            with self._process_lock:
+                self._stragglers.clear()
+
+        for result in results:
             # Log summary for each tool
             if result.success:
                 status = "completed"
@@ -351,7 +713,7 @@ def execute_all(
             logger.info(
                 f"Tool '{result.name}' {status}: "
                 f"exit_code={result.exit_code}, "
-                f"stdout_len={len(result.stdout)}, "
+                f"stdout_bytes={result.stdout_size}, "
                 f"stderr_len={len(result.stderr)}"
             )
 
@@ -362,6 +724,92 @@ def execute_all(
 
         return results
 
+    async def execute_all_async(
+        self,
+        timeout_per_tool: Optional[int] = None,
+        straggler_timeout: Optional[float] = None,
+        straggler_limit: int = 0,
+    ) -> List[ToolResult]:
+        """
+        Execute all configured tools without blocking the event loop.
+
+        Runs execute_all on a worker thread, so the tools still run side by
+        side on the orchestrator's pool while other coroutines keep going.
+
+        Args:
+            timeout_per_tool: Optional timeout override per tool in seconds
+            straggler_timeout: See execute_all
+            straggler_limit: See execute_all
+
+        Returns:
+            List of ToolResult objects, one per configured tool
+        """
+        return await asyncio.to_thread(
+            self.execute_all, timeout_per_tool, straggler_timeout, straggler_limit
+        )
+
+    def _reap_stragglers(
+        self,
+        futures: Dict[Future, str],
+        straggler_timeout: float,
+        straggler_limit: int,
+    ) -> None:
+        """
+        Kill tools still running once the rest of an execute_all run is done.
+
+        Waits until at most ``straggler_limit`` tools remain, then gives them
+        ``straggler_timeout`` seconds before killing their process groups.
+        Reaped tools (including any that never got a worker) report as timed out.
+
+        Args:
+            futures: Pending execute_tool futures mapped to their tool names
+            straggler_timeout: Seconds the remaining tools get to finish
+            straggler_limit: Number of remaining tools that starts the timer
+        """
+        pending = set(futures)
+        while len(pending) > straggler_limit:
+            _, pending = wait(pending, return_when=FIRST_COMPLETED)
+        if not pending:
+            return
+
+        _, pending = wait(pending, timeout=straggler_timeout)
+        for future in pending:
+            name = futures[future]
+            logger.warning(
+                f"Tool '{name}' still running {straggler_timeout}s after the "
+                f"rest of the run finished, killing it"
+            )
+            with self._process_lock:
+                self._stragglers[name] = straggler_timeout
+                process = self._processes.get(name)
+            if process is not None:
+                self._kill_process_group(process)
+
+    def _expand_command(
+        self, command: str, env: Optional[Dict[str, str]] = None
+    ) -> str:
+        """
+        Expand environment variables in a command, reusing earlier expansions.
+
+        Only calls made during execute_all are cached, since that is where the
+        environment is fingerprinted; a solo execute_tool call expands afresh.
+
+        Args:
+            command: The command as configured
+            env: Environment snapshot to read variables from (defaults to os.environ)
+
+        Returns:
+            The command with environment variables expanded
+        """
+        env_key = self._env_key
+        if env_key is None:
+            return expand_env_vars(command, env)
+
+        key = (command, env_key)
+        if key not in self._expand_cache:
+            self._expand_cache[key] = expand_env_vars(command, env)
+        return self._expand_cache[key]
+
     def _check_executable_exists(self, executable: str) -> bool:
         """
         Check if an executable exists in PATH or as an absolute path.
@@ -386,36 +834,138 @@ def _check_executable_exists(self, executable: str) -> bool:
         if Path(executable).is_absolute():
             return Path(executable).exists()
 
-        # Check if it's in PATH
-        return shutil.which(executable) is not None
+        # During a large execute_all run, one listing of PATH answers most lookups;
+        # shutil.which stays the fallback (PATHEXT, entries added since the scan)
+        if self._path_index is not None and executable in self._path_index:
+            return True
+
+        # Check if it's in PATH, walking PATH only once per executable
+        if executable not in self._which_cache:
+            self._which_cache[executable] = shutil.which(executable)
+        return self._which_cache[executable] is not None
+
+    @staticmethod
+    def _build_path_index(env: Optional[Dict[str, str]] = None) -> FrozenSet[str]:
+        """
+        List every directory on PATH once and collect the file names found.
+
+        Args:
+            env: Environment whose PATH to scan (defaults to os.environ)
+
+        Returns:
+            Names of all entries in the PATH directories
+        """
+        names: Set[str] = set()
+        for directory in os.get_exec_path(env):
+            try:
+                names.update(os.listdir(directory))
+            except OSError:
+                # Missing or unreadable PATH entries are common; skip them
+                continue
+        return frozenset(names)
 
     def _run_subprocess(
-        self, command: str, timeout: int, output_path: Path
-    ) -> "subprocess.CompletedProcess[str]":
+        self,
+        name: str,
+        command: str,
+        timeout: int,
+        output_path: Path,
+        env: Optional[Dict[str, str]] = None,
+    ) -> "subprocess.CompletedProcess[bytes]":
         """
         Execute a subprocess command with the configured settings.
 
         Writes stdout directly to the output file to avoid memory issues
-        with large outputs.
+        with large outputs. The file is opened in binary mode so the tool's
+        bytes land on disk untouched; stderr is returned as bytes and decoded
+        once when the result is built.
+
+        The command runs in its own session so a timeout can kill the whole
+        process group. subprocess.run would only kill the shell and leave
+        anything it spawned running.
+
+        Commands without shell syntax are split into argv and run directly,
+        skipping the intermediate /bin/sh exec; anything else still goes
+        through the shell.
+
+        The process is registered under the tool name while it runs so
+        execute_all can kill it as a straggler.
 
         Args:
+            name: Tool name
             command: The command to execute
             timeout: Timeout in seconds
             output_path: Path to write stdout to
+            env: Environment for the command (None inherits os.environ)
 
         Returns:
-            CompletedProcess result from subprocess.run
+            CompletedProcess with the exit code and captured stderr
+
+        Raises:
+            subprocess.TimeoutExpired: If the command runs longer than timeout,
+                or was reaped as a straggler (with the straggler timeout)
         """
-        with open(output_path, "w", encoding="utf-8") as stdout_file:
-            return subprocess.run(
-                command,
-                shell=True,
+        argv = _split_command(command)
+        with self._process_lock:
+            straggler_timeout = self._stragglers.get(name)
+        if straggler_timeout is not None:
+            # Reaped before it got to start
+            raise subprocess.TimeoutExpired(command, straggler_timeout)
+
+        with open(output_path, "wb") as stdout_file:
+            process = subprocess.Popen(
+                command if argv is None else argv,
+                shell=argv is None,
                 cwd=self.working_dir,
                 stdout=stdout_file,
                 stderr=subprocess.PIPE,
-                text=True,
-                timeout=timeout,
+                env=env,
+                start_new_session=True,
             )
+            with self._process_lock:
+                self._processes[name] = process
+                reaped = name in self._stragglers
+            try:
+                if reaped:
+                    # Reaped between the check above and Popen
+                    self._kill_process_group(process)
+                _, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired as e:
+                self._kill_process_group(process)
+                _, e.stderr = process.communicate()
+                raise
+            except BaseException:
+                self._kill_process_group(process)
+                process.wait()
+                raise
+            finally:
+                with self._process_lock:
+                    self._processes.pop(name, None)
+                    straggler_timeout = self._stragglers.get(name)
+
+        if straggler_timeout is not None:
+            raise subprocess.TimeoutExpired(command, straggler_timeout, stderr=stderr)
+        return subprocess.CompletedProcess(command, process.returncode, stderr=stderr)
+
+    @staticmethod
+    def _kill_process_group(process: "subprocess.Popen[bytes]") -> None:
+        """
+        Kill a process started in its own session along with its children.
+
+        Args:
+            process: The process to kill
+        """
+        if hasattr(os, "killpg"):
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+                return
+            except ProcessLookupError:
+                # The whole group has already exited
+                return
+            except OSError as e:
+                logger.warning(f"Failed to kill process group {process.pid}: {e}")
+        # No process groups (Windows) or killpg failed: kill the shell itself
+        process.kill()
 
     def _create_not_found_result(
         self, name: str, command: str, executable: str
@@ -447,7 +997,7 @@ def _create_success_result(
         self,
         name: str,
         command: str,
-        result: "subprocess.CompletedProcess[str]",
+        result: "subprocess.CompletedProcess[bytes]",
         duration: float,
         output_path: Path,
     ) -> ToolResult:
@@ -474,7 +1024,7 @@ def _create_success_result(
             name=name,
             command=command,
             output_path=output_path,
-            stderr=result.stderr or "",
+            stderr=self._decode_stderr(result.stderr),
             exit_code=result.returncode,
             success=True,  # Execution succeeded even if exit code is non-zero
             duration_seconds=duration,
@@ -484,7 +1034,7 @@ def _handle_timeout_error(
         self,
         name: str,
         command: str,
-        timeout: int,
+        timeout: float,
         error: subprocess.TimeoutExpired,
         duration: float,
         output_path: Path,
@@ -572,7 +1122,7 @@ def _handle_unexpected_error(
 
     def get_tool_names(self) -> List[str]:
         """Return list of configured tool names"""
-        return [tool.name for tool in self.external_tools]
+        return list(self._tool_names)
 
     def get_tool_count(self) -> int:
         """Return count of configured tools"""
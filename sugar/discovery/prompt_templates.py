@@ -4,6 +4,11 @@
 Sugar has NO knowledge of tool output formats. Claude Code does ALL interpretation.
 This module provides configurable prompt templates that instruct Claude Code
 to interpret raw output from code quality tools and generate sugar add commands.
+
+Built-in templates keep all static instruction text as a literal prefix and put
+the ${tool_name}/${command}/${output_file_path} section last, so consecutive
+interpretation prompts share the longest possible prefix for provider-side
+prompt caching. Custom templates should follow the same layout.
 """
 
 import logging
@@ -33,12 +38,6 @@
   --urgent                  Mark as urgent (priority 5)
   --status [pending|hold]   Initial task status
 
-## Tool: ${tool_name}
-## Command (already executed): ${command}
-## Output File: ${output_file_path}
-
-Read the file at ${output_file_path} to analyze the tool output. DO NOT run the command.
-
 ## Your Responsibilities
 1. Read and parse the raw tool output from the file (any format: JSON, XML, plain text)
 2. Group related issues into logical tasks (NOT one task per warning!)
@@ -72,6 +71,12 @@
 - Keep descriptions concise but informative (max 200 chars)
 - Include file paths and line numbers in descriptions when relevant
 - Group by logical categories (security, performance, style, etc.)
+
+## Tool: ${tool_name}
+## Command (already executed): ${command}
+## Output File: ${output_file_path}
+
+Read the file at ${output_file_path} to analyze the tool output. DO NOT run the command.
 """
 
 
@@ -92,12 +97,6 @@
   --urgent                  Mark as urgent (priority 5)
   --status [pending|hold]   Initial task status
 
-## Security Tool: ${tool_name}
-## Command (already executed): ${command}
-## Output File: ${output_file_path}
-
-Read the file at ${output_file_path} to analyze the security scan output. DO NOT run the command.
-
 ## Security Priority Mapping
 | Severity      | CVSS Score | Priority |
 |---------------|------------|----------|
@@ -122,6 +121,12 @@
 - Include CVE IDs when available
 - Reference affected files/functions in description
 - For dependency vulnerabilities, include upgrade path if known
+
+## Security Tool: ${tool_name}
+## Command (already executed): ${command}
+## Output File: ${output_file_path}
+
+Read the file at ${output_file_path} to analyze the security scan output. DO NOT run the command.
 """
 
 
@@ -142,12 +147,6 @@
   --urgent                  Mark as urgent (priority 5)
   --status [pending|hold]   Initial task status
 
-## Coverage Tool: ${tool_name}
-## Command (already executed): ${command}
-## Output File: ${output_file_path}
-
-Read the file at ${output_file_path} to analyze the coverage report. DO NOT run the command.
-
 ## Coverage Priority Mapping
 | Coverage Level | Priority |
 |----------------|----------|
@@ -170,6 +169,12 @@
 - Focus on files with business logic, not boilerplate
 - Mention specific uncovered functions/methods
 - Consider complexity when prioritizing
+
+## Coverage Tool: ${tool_name}
+## Command (already executed): ${command}
+## Output File: ${output_file_path}
+
+Read the file at ${output_file_path} to analyze the coverage report. DO NOT run the command.
 """
 
 
@@ -190,12 +195,6 @@
   --urgent                  Mark as urgent (priority 5)
   --status [pending|hold]   Initial task status
 
-## Linter: ${tool_name}
-## Command (already executed): ${command}
-## Output File: ${output_file_path}
-
-Read the file at ${output_file_path} to analyze the linter output. DO NOT run the command.
-
 ## Lint Priority Mapping
 | Category                    | Priority |
 |-----------------------------|----------|
@@ -219,6 +218,12 @@
 - Mention affected directories, not every file
 - Consider using --status hold for low-priority style issues
 - For auto-fixable issues, mention that in description
+
+## Linter: ${tool_name}
+## Command (already executed): ${command}
+## Output File: ${output_file_path}
+
+Read the file at ${output_file_path} to analyze the linter output. DO NOT run the command.
 """
 
 
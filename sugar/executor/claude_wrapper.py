@@ -64,7 +64,9 @@ def __init__(self, config: dict):
             "agent_selection", self.agent_selection_fallback
         )
 
-        # Initialize TaskTypeManager if database path is available
+        # Initialize TaskTypeManager if database path is available. It is never
+        # entered or closed, so each lookup uses a short-lived connection and
+        # reads the current table, picking up task-type edits made while running
         self.db_path = config.get("database_path")
         self.task_type_manager = TaskTypeManager(self.db_path) if self.db_path else None
 
@@ -340,7 +342,12 @@ def _create_task_prompt(
     async def _execute_claude_cli(
         self, prompt: str, context: Dict[str, Any], continue_session: bool = False
     ) -> Dict[str, Any]:
-        """Execute the Claude CLI command with the given prompt and optional continuation"""
+        """Execute the Claude CLI command with the given prompt and optional continuation
+
+        The prompt is sent verbatim via stdin. Callers that issue many similar
+        prompts should place static instruction text first and per-call values
+        last, so the provider can serve the shared prefix from its prompt cache.
+        """
         start_time = datetime.utcnow()
 
         if continue_session:
@@ -64,8 +64,8 @@ async def get_types():
             with open(config_file, "r") as f:
                 config = yaml.safe_load(f)
             db_path = config["sugar"]["storage"]["database"]
-            manager = TaskTypeManager(db_path)
-            return await manager.get_task_type_ids()
+            async with TaskTypeManager(db_path) as manager:
+                return await manager.get_task_type_ids()
 
         # Get available task types
         valid_choices = asyncio.run(get_types())
@@ -2625,32 +2625,31 @@ async def _list_task_types():
 
         # Initialize TaskTypeManager
         db_path = config["sugar"]["storage"]["database"]
-        manager = TaskTypeManager(db_path)
+        async with TaskTypeManager(db_path) as manager:
+            # Get all task types
+            task_types = await manager.get_all_task_types()
 
-        # Get all task types
-        task_types = await manager.get_all_task_types()
-
-        if format == "json":
-            click.echo(json.dumps(task_types, indent=2))
-        else:
-            if not task_types:
-                click.echo("No task types found.")
-                return
-
-            # Table format
-            click.echo("Task Types:")
-            click.echo("-" * 80)
-            for task_type in task_types:
-                default_marker = " (default)" if task_type["is_default"] else ""
-                emoji = task_type.get("emoji", "")
-                click.echo(f"{emoji} {task_type['id']}{default_marker}")
-                click.echo(f"   Name: {task_type['name']}")
-                if task_type.get("description"):
-                    click.echo(f"   Description: {task_type['description']}")
-                click.echo(f"   Agent: {task_type.get('agent', 'general-purpose')}")
-                if task_type.get("commit_template"):
-                    click.echo(f"   Commit: {task_type['commit_template']}")
-                click.echo()
+            if format == "json":
+                click.echo(json.dumps(task_types, indent=2))
+            else:
+                if not task_types:
+                    click.echo("No task types found.")
+                    return
+
+                # Table format
+                click.echo("Task Types:")
+                click.echo("-" * 80)
+                for task_type in task_types:
+                    default_marker = " (default)" if task_type["is_default"] else ""
+                    emoji = task_type.get("emoji", "")
+                    click.echo(f"{emoji} {task_type['id']}{default_marker}")
+                    click.echo(f"   Name: {task_type['name']}")
+                    if task_type.get("description"):
+                        click.echo(f"   Description: {task_type['description']}")
+                    click.echo(f"   Agent: {task_type.get('agent', 'general-purpose')}")
+                    if task_type.get("commit_template"):
+                        click.echo(f"   Commit: {task_type['commit_template']}")
+                    click.echo()
 
     try:
         import asyncio
@@ -2684,23 +2683,23 @@ async def _add_task_type():
 
         # Initialize TaskTypeManager
         db_path = config["sugar"]["storage"]["database"]
-        manager = TaskTypeManager(db_path)
-
-        # Use type_id as display_name if name not provided
-        display_name = name if name else type_id.replace("_", " ").title()
+        async with TaskTypeManager(db_path) as manager:
+            # Use type_id as display_name if name not provided
+            display_name = name if name else type_id.replace("_", " ").title()
 
-        success = await manager.add_task_type(
-            type_id, display_name, description, agent, commit_template, emoji
-        )
-
-        if success:
-            emoji_display = f"{emoji} " if emoji else ""
-            click.echo(f"✅ Added task type: {emoji_display}{type_id}")
-        else:
-            click.echo(
-                f"❌ Failed to add task type '{type_id}' (may already exist)", err=True
+            success = await manager.add_task_type(
+                type_id, display_name, description, agent, commit_template, emoji
             )
-            sys.exit(1)
+
+            if success:
+                emoji_display = f"{emoji} " if emoji else ""
+                click.echo(f"✅ Added task type: {emoji_display}{type_id}")
+            else:
+                click.echo(
+                    f"❌ Failed to add task type '{type_id}' (may already exist)",
+                    err=True,
+                )
+                sys.exit(1)
 
     try:
         import asyncio
@@ -2732,19 +2731,18 @@ async def _edit_task_type():
 
         # Initialize TaskTypeManager
         db_path = config["sugar"]["storage"]["database"]
-        manager = TaskTypeManager(db_path)
-
-        success = await manager.update_task_type(
-            type_id, name, description, agent, commit_template, emoji
-        )
-
-        if success:
-            click.echo(f"✅ Updated task type: {type_id}")
-        else:
-            click.echo(
-                f"❌ Failed to update task type '{type_id}' (not found?)", err=True
+        async with TaskTypeManager(db_path) as manager:
+            success = await manager.update_task_type(
+                type_id, name, description, agent, commit_template, emoji
             )
-            sys.exit(1)
+
+            if success:
+                click.echo(f"✅ Updated task type: {type_id}")
+            else:
+                click.echo(
+                    f"❌ Failed to update task type '{type_id}' (not found?)", err=True
+                )
+                sys.exit(1)
 
     try:
         import asyncio
@@ -2772,33 +2770,33 @@ async def _remove_task_type():
 
         # Initialize TaskTypeManager
         db_path = config["sugar"]["storage"]["database"]
-        manager = TaskTypeManager(db_path)
+        async with TaskTypeManager(db_path) as manager:
+            # Check if task type exists
+            task_type = await manager.get_task_type(type_id)
+            if not task_type:
+                click.echo(f"❌ Task type '{type_id}' not found", err=True)
+                sys.exit(1)
 
-        # Check if task type exists
-        task_type = await manager.get_task_type(type_id)
-        if not task_type:
-            click.echo(f"❌ Task type '{type_id}' not found", err=True)
-            sys.exit(1)
+            if task_type["is_default"]:
+                click.echo(f"❌ Cannot remove default task type '{type_id}'", err=True)
+                sys.exit(1)
 
-        if task_type["is_default"]:
-            click.echo(f"❌ Cannot remove default task type '{type_id}'", err=True)
-            sys.exit(1)
+            # Confirmation prompt unless --force
+            if not force:
+                if not click.confirm(f"Remove task type '{type_id}'?"):
+                    click.echo("Operation cancelled")
+                    return
 
-        # Confirmation prompt unless --force
-        if not force:
-            if not click.confirm(f"Remove task type '{type_id}'?"):
-                click.echo("Operation cancelled")
-                return
-
-        success = await manager.remove_task_type(type_id)
+            success = await manager.remove_task_type(type_id)
 
-        if success:
-            click.echo(f"✅ Removed task type: {type_id}")
-        else:
-            click.echo(
-                f"❌ Failed to remove task type '{type_id}' (active tasks?)", err=True
-            )
-            sys.exit(1)
+            if success:
+                click.echo(f"✅ Removed task type: {type_id}")
+            else:
+                click.echo(
+                    f"❌ Failed to remove task type '{type_id}' (active tasks?)",
+                    err=True,
+                )
+                sys.exit(1)
 
     try:
         import asyncio
@@ -2825,30 +2823,29 @@ async def _show_task_type():
 
         # Initialize TaskTypeManager
         db_path = config["sugar"]["storage"]["database"]
-        manager = TaskTypeManager(db_path)
-
-        task_type = await manager.get_task_type(type_id)
-
-        if not task_type:
-            click.echo(f"❌ Task type '{type_id}' not found", err=True)
-            sys.exit(1)
-
-        # Display details
-        default_marker = " (default)" if task_type["is_default"] else ""
-        emoji = task_type.get("emoji", "")
-
-        click.echo(f"{emoji} {task_type['name']}{default_marker}")
-        click.echo(f"ID: {task_type['id']}")
-        if task_type.get("description"):
-            click.echo(f"Description: {task_type['description']}")
-        click.echo(f"Agent: {task_type.get('agent', 'general-purpose')}")
-        if task_type.get("commit_template"):
-            click.echo(f"Commit Template: {task_type['commit_template']}")
-        if task_type.get("file_patterns"):
-            click.echo(f"File Patterns: {', '.join(task_type['file_patterns'])}")
-        click.echo(f"Created: {task_type['created_at']}")
-        if task_type["updated_at"] != task_type["created_at"]:
-            click.echo(f"Updated: {task_type['updated_at']}")
+        async with TaskTypeManager(db_path) as manager:
+            task_type = await manager.get_task_type(type_id)
+
+            if not task_type:
+                click.echo(f"❌ Task type '{type_id}' not found", err=True)
+                sys.exit(1)
+
+            # Display details
+            default_marker = " (default)" if task_type["is_default"] else ""
+            emoji = task_type.get("emoji", "")
+
+            click.echo(f"{emoji} {task_type['name']}{default_marker}")
+            click.echo(f"ID: {task_type['id']}")
+            if task_type.get("description"):
+                click.echo(f"Description: {task_type['description']}")
+            click.echo(f"Agent: {task_type.get('agent', 'general-purpose')}")
+            if task_type.get("commit_template"):
+                click.echo(f"Commit Template: {task_type['commit_template']}")
+            if task_type.get("file_patterns"):
+                click.echo(f"File Patterns: {', '.join(task_type['file_patterns'])}")
+            click.echo(f"Created: {task_type['created_at']}")
+            if task_type["updated_at"] != task_type["created_at"]:
+                click.echo(f"Updated: {task_type['updated_at']}")
 
     try:
         import asyncio
@@ -2875,24 +2872,23 @@ async def _export_task_types():
 
         # Initialize TaskTypeManager
         db_path = config["sugar"]["storage"]["database"]
-        manager = TaskTypeManager(db_path)
-
-        task_types = await manager.export_task_types()
+        async with TaskTypeManager(db_path) as manager:
+            task_types = await manager.export_task_types()
 
-        export_data = {
-            "task_types": task_types,
-            "exported_at": datetime.now().isoformat(),
-            "sugar_version": _get_version(),
-        }
+            export_data = {
+                "task_types": task_types,
+                "exported_at": datetime.now().isoformat(),
+                "sugar_version": _get_version(),
+            }
 
-        output = json.dumps(export_data, indent=2)
+            output = json.dumps(export_data, indent=2)
 
-        if file:
-            with open(file, "w") as f:
-                f.write(output)
-            click.echo(f"✅ Exported {len(task_types)} custom task types to {file}")
-        else:
-            click.echo(output)
+            if file:
+                with open(file, "w") as f:
+                    f.write(output)
+                click.echo(f"✅ Exported {len(task_types)} custom task types to {file}")
+            else:
+                click.echo(output)
 
     try:
         import asyncio
@@ -2920,19 +2916,18 @@ async def _import_task_types():
 
         # Initialize TaskTypeManager
         db_path = config["sugar"]["storage"]["database"]
-        manager = TaskTypeManager(db_path)
-
-        # Parse import file
-        try:
-            import_data = json.load(file)
-            task_types = import_data.get("task_types", [])
-        except json.JSONDecodeError as e:
-            click.echo(f"❌ Invalid JSON file: {e}", err=True)
-            sys.exit(1)
+        async with TaskTypeManager(db_path) as manager:
+            # Parse import file
+            try:
+                import_data = json.load(file)
+                task_types = import_data.get("task_types", [])
+            except json.JSONDecodeError as e:
+                click.echo(f"❌ Invalid JSON file: {e}", err=True)
+                sys.exit(1)
 
-        imported_count = await manager.import_task_types(task_types, overwrite)
+            imported_count = await manager.import_task_types(task_types, overwrite)
 
-        click.echo(f"✅ Imported {imported_count}/{len(task_types)} task types")
+            click.echo(f"✅ Imported {imported_count}/{len(task_types)} task types")
 
     try:
         import asyncio
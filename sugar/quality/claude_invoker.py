@@ -30,21 +30,78 @@
 """
 
 import asyncio
+import hashlib
 import logging
 import re
 import shlex
 import subprocess
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from ..executor.claude_wrapper import ClaudeWrapper
 from ..discovery.prompt_templates import create_tool_interpretation_prompt
+from ..storage.task_type_manager import TaskTypeManager
+from ..storage.work_queue import WorkQueue
 
 logger = logging.getLogger(__name__)
 
+# Minimal work item used to prepare the wrapper context for interpretation
+_INTERPRETER_WORK_ITEM = {
+    "id": "interpreter-task",
+    "type": "interpretation",
+    "title": "Tool Output Interpretation",
+    "description": "",
+    "priority": 3,
+    "source": "tool_interpreter",
+}
+
+# Most recently used interpretations kept per interpreter
+INTERPRETATION_CACHE_MAX_ENTRIES = 32
+
+# Matches a `sugar add` command on its own line, ignoring leading whitespace
+_SUGAR_ADD_LINE_RE = re.compile(r"^[ \t]*(sugar add [^\n]*)", re.MULTILINE)
+
+# `sugar add` options emitted by execute_commands, in CLI order:
+# (ParsedCommand attribute, option, is_flag, value that suppresses the option).
+# Falsy values are always suppressed.
+_ADD_OPTION_SPEC = (
+    ("task_type", "--type", False, None),
+    ("priority", "--priority", False, None),
+    ("description", "--description", False, None),
+    ("urgent", "--urgent", True, None),
+    ("status", "--status", False, "pending"),
+)
+
+# Task types `sugar add` accepts when the task_types table can't be read
+_FALLBACK_TASK_TYPES = frozenset(
+    ["bug_fix", "feature", "test", "refactor", "documentation"]
+)
+
+
+def _output_file_digest(output_file_path: Path) -> str:
+    """
+    Hash a tool output file without reading it into memory.
+
+    hashlib.file_digest streams the file through a small fixed-size buffer,
+    so memory use stays constant regardless of output size.
+
+    Args:
+        output_file_path: Path to the tool output file.
+
+    Returns:
+        Hex-encoded BLAKE2b digest of the file contents.
 
-@dataclass
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    with open(output_file_path, "rb") as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()
+
+
+@dataclass(slots=True)
 class ParsedCommand:
     """
     A parsed `sugar add` command extracted from Claude's response.
@@ -89,7 +146,7 @@ class ParsedCommand:
     validation_error: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class InterpretationResult:
     """
     Result of Claude's interpretation of external tool output.
@@ -121,6 +178,47 @@ class InterpretationResult:
     execution_time: float = 0.0
 
 
+def _copy_interpretation(result: InterpretationResult) -> InterpretationResult:
+    """Copy a result deeply enough that changing the copy leaves the original intact"""
+    return replace(result, commands=[replace(cmd) for cmd in result.commands])
+
+
+def _set_type(parsed: ParsedCommand, value: str) -> None:
+    parsed.task_type = value
+
+
+def _set_priority(parsed: ParsedCommand, value: str) -> None:
+    try:
+        parsed.priority = int(value)
+    except ValueError:
+        raise ValueError(f"Priority must be an integer, got: {value}") from None
+
+
+def _set_description(parsed: ParsedCommand, value: str) -> None:
+    parsed.description = value
+
+
+def _set_status(parsed: ParsedCommand, value: str) -> None:
+    if value not in ("pending", "hold"):
+        raise ValueError(f"Status must be 'pending' or 'hold', got: {value}")
+    parsed.status = value
+
+
+def _set_urgent(parsed: ParsedCommand, value: Optional[str]) -> None:
+    parsed.urgent = True
+
+
+# `sugar add` option name -> (takes_value, handler). Handlers raise ValueError
+# with the validation message when a value is rejected.
+_OPTION_HANDLERS: Dict[str, Tuple[bool, Callable[[ParsedCommand, Any], None]]] = {
+    "urgent": (False, _set_urgent),
+    "type": (True, _set_type),
+    "priority": (True, _set_priority),
+    "description": (True, _set_description),
+    "status": (True, _set_status),
+}
+
+
 class ToolOutputInterpreter:
     """
     Interprets external tool output using Claude Code to generate actionable tasks.
@@ -142,6 +240,10 @@ class ToolOutputInterpreter:
     Attributes:
         wrapper: ClaudeWrapper instance for Claude Code communication.
         custom_template: User-provided prompt template, or None to use defaults.
+        interpretation_cache: The most recent successful results (at most
+            INTERPRETATION_CACHE_MAX_ENTRIES), keyed by prompt and output file
+            digest, so identical tool output is only interpreted once. Callers
+            always get a copy, never the cached object.
 
     Example:
         >>> interpreter = ToolOutputInterpreter()
@@ -166,6 +268,8 @@ def __init__(
         Args:
             prompt_template: Custom prompt template string with placeholders.
                 Supported placeholders: ${tool_name}, ${command}, ${output_file_path}.
+                Keep placeholders near the end of the template so the static
+                instructions form a cacheable prompt prefix.
                 If not provided, uses templates from prompt_templates module which
                 auto-detect the appropriate template based on tool name.
             wrapper_config: Configuration dict for ClaudeWrapper. Supported keys:
@@ -197,6 +301,11 @@ def __init__(
         self.wrapper = ClaudeWrapper(default_config)
         self.custom_template = prompt_template
         self.template_config = template_config or {}
+        self.interpretation_cache: "OrderedDict[str, InterpretationResult]" = (
+            OrderedDict()
+        )
+        # Prepared lazily on the first prompt and reused afterwards
+        self._context: Optional[Dict[str, Any]] = None
         logger.debug("ToolOutputInterpreter initialized with ClaudeWrapper")
 
     async def interpret_output(
@@ -241,6 +350,13 @@ async def interpret_output(
                 config=self.template_config,
             )
 
+        cache_key = self._get_cache_key(prompt, output_file_path)
+        cached = self.interpretation_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached interpretation for tool: {tool_name}")
+            self.interpretation_cache.move_to_end(cache_key)
+            return _copy_interpretation(cached)
+
         # Execute via Claude wrapper
         try:
             result = await self._execute_claude_prompt(prompt)
@@ -263,12 +379,19 @@ async def interpret_output(
                 f"Extracted {len(commands)} valid commands from Claude response"
             )
 
-            return InterpretationResult(
+            interpretation = InterpretationResult(
                 success=True,
                 commands=commands,
                 raw_response=raw_response,
                 execution_time=result.get("execution_time", 0.0),
             )
+            if cache_key:
+                self.interpretation_cache[cache_key] = _copy_interpretation(
+                    interpretation
+                )
+                if len(self.interpretation_cache) > INTERPRETATION_CACHE_MAX_ENTRIES:
+                    self.interpretation_cache.popitem(last=False)
+            return interpretation
 
         except Exception as e:
             logger.error(f"Error interpreting tool output: {e}")
@@ -277,6 +400,28 @@ async def interpret_output(
                 error_message=str(e),
             )
 
+    def _get_cache_key(self, prompt: str, output_file_path: Path) -> str:
+        """
+        Build the interpretation cache key for a prompt and its output file.
+
+        Args:
+            prompt: The fully rendered interpretation prompt.
+            output_file_path: Path to the file containing the tool output.
+
+        Returns:
+            Short BLAKE2b hex key, or empty string if the output file
+            cannot be read (the interpretation is then not cached).
+        """
+        try:
+            file_digest = _output_file_digest(output_file_path)
+        except OSError as e:
+            logger.debug(f"Not caching interpretation, cannot hash output: {e}")
+            return ""
+
+        key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16)
+        key.update(file_digest.encode("ascii"))
+        return key.hexdigest()
+
     async def _execute_claude_prompt(self, prompt: str) -> Dict[str, Any]:
         """
         Execute a prompt via the Claude wrapper's internal CLI execution.
@@ -295,22 +440,18 @@ async def _execute_claude_prompt(self, prompt: str) -> Dict[str, Any]:
                 - error (str): Error message or stderr content if failed
                 - execution_time (float): Processing duration in seconds
         """
-        # Create a minimal work item for the wrapper
-        work_item = {
-            "id": "interpreter-task",
-            "type": "interpretation",
-            "title": "Tool Output Interpretation",
-            "description": prompt,
-            "priority": 3,
-            "source": "tool_interpreter",
-        }
-
         # Use legacy execution path for simple prompt execution
         try:
+            # The context does not depend on the prompt, so it is prepared
+            # (context file read/write) once per interpreter
+            if self._context is None:
+                self._context = self.wrapper._prepare_context(
+                    dict(_INTERPRETER_WORK_ITEM), continue_session=False
+                )
+
             # Access the internal CLI execution method
-            context = self.wrapper._prepare_context(work_item, continue_session=False)
             result = await self.wrapper._execute_claude_cli(
-                prompt, context, continue_session=False
+                prompt, self._context, continue_session=False
             )
 
             return {
@@ -333,9 +474,10 @@ def _extract_commands(self, response: str) -> List[ParsedCommand]:
         """
         Extract and parse `sugar add` commands from Claude's response text.
 
-        Scans each line of Claude's response for lines starting with "sugar add ",
-        then parses each matching line into a ParsedCommand. Invalid or malformed
-        commands are logged and skipped.
+        Scans Claude's response for lines starting with "sugar add ", then parses
+        each matching line into a ParsedCommand. Matching lines are found with a
+        single regex pass, so the response is never split into a list of lines.
+        Invalid or malformed commands are logged and skipped.
 
         Args:
             response: The complete raw response text from Claude Code.
@@ -346,24 +488,16 @@ def _extract_commands(self, response: str) -> List[ParsedCommand]:
             Commands that fail validation are excluded from the result.
         """
         commands = []
-        lines = response.split("\n")
-
-        for line in lines:
-            line = line.strip()
-
-            # Skip empty lines and non-command lines
-            if not line:
-                continue
 
-            # Look for lines starting with "sugar add"
-            if line.startswith("sugar add "):
-                parsed = self._parse_command(line)
-                if parsed.valid:
-                    commands.append(parsed)
-                else:
-                    logger.warning(
-                        f"Skipping malformed command: {line} - {parsed.validation_error}"
-                    )
+        for match in _SUGAR_ADD_LINE_RE.finditer(response):
+            line = match.group(1).rstrip()
+            parsed = self._parse_command(line)
+            if parsed.valid:
+                commands.append(parsed)
+            else:
+                logger.warning(
+                    f"Skipping malformed command: {line} - {parsed.validation_error}"
+                )
 
         return commands
 
@@ -420,44 +554,31 @@ def _parse_command(self, command_line: str) -> ParsedCommand:
             if parts[i].startswith("--"):
                 # Process option
                 option = parts[i][2:]
+                spec = _OPTION_HANDLERS.get(option)
 
-                if option == "urgent":
-                    parsed.urgent = True
+                if spec is None:
+                    # Unknown option, skip
+                    logger.debug(f"Unknown option: --{option}")
                     i += 1
-                elif option in ("type", "priority", "description", "status"):
+                    continue
+
+                takes_value, handler = spec
+                value = None
+                if takes_value:
                     if i + 1 >= len(parts):
                         parsed.valid = False
                         parsed.validation_error = f"Option --{option} requires a value"
                         return parsed
-
                     value = parts[i + 1]
-                    if option == "type":
-                        parsed.task_type = value
-                    elif option == "priority":
-                        try:
-                            parsed.priority = int(value)
-                        except ValueError:
-                            parsed.valid = False
-                            parsed.validation_error = (
-                                f"Priority must be an integer, got: {value}"
-                            )
-                            return parsed
-                    elif option == "description":
-                        parsed.description = value
-                    elif option == "status":
-                        if value not in ("pending", "hold"):
-                            parsed.valid = False
-                            parsed.validation_error = (
-                                f"Status must be 'pending' or 'hold', got: {value}"
-                            )
-                            return parsed
-                        parsed.status = value
-
-                    i += 2
-                else:
-                    # Unknown option, skip
-                    logger.debug(f"Unknown option: --{option}")
-                    i += 1
+
+                try:
+                    handler(parsed, value)
+                except ValueError as e:
+                    parsed.valid = False
+                    parsed.validation_error = str(e)
+                    return parsed
+
+                i += 2 if takes_value else 1
             else:
                 # Positional argument (title)
                 if title is None:
@@ -487,8 +608,8 @@ def execute_commands(
         Args:
             commands: List of ParsedCommand objects to execute.
                 Invalid commands are skipped automatically.
-            dry_run: If True, log the commands that would be executed
-                without actually creating tasks. Useful for testing.
+            dry_run: If True, log the commands that would be executed (as one
+                log record) without actually creating tasks. Useful for testing.
 
         Returns:
             Count of successfully created tasks (or would-be-created in dry_run mode).
@@ -497,31 +618,29 @@ def execute_commands(
             Each command execution has a 30-second timeout. Failures are logged
             but don't stop processing of subsequent commands.
         """
-        successful = 0
-
+        valid_commands = []
         for cmd in commands:
-            if not cmd.valid:
+            if cmd.valid:
+                valid_commands.append(cmd)
+            else:
                 logger.warning(f"Skipping invalid command: {cmd.validation_error}")
-                continue
 
-            # Build the command
-            args = ["sugar", "add", cmd.title]
-
-            if cmd.task_type:
-                args.extend(["--type", cmd.task_type])
-            if cmd.priority:
-                args.extend(["--priority", str(cmd.priority)])
-            if cmd.description:
-                args.extend(["--description", cmd.description])
-            if cmd.urgent:
-                args.append("--urgent")
-            if cmd.status and cmd.status != "pending":
-                args.extend(["--status", cmd.status])
-
-            if dry_run:
-                logger.info(f"[DRY RUN] Would execute: {' '.join(args)}")
-                successful += 1
-                continue
+        if dry_run:
+            # Nothing is executed, so only render the commands if they will be
+            # logged, and emit them as a single record
+            if logger.isEnabledFor(logging.INFO) and valid_commands:
+                rendered = "\n  ".join(
+                    shlex.join(self._build_add_args(cmd)) for cmd in valid_commands
+                )
+                logger.info(f"[DRY RUN] Would execute:\n  {rendered}")
+            successful = len(valid_commands)
+            logger.info(f"Successfully created {successful}/{len(commands)} tasks")
+            return successful
+
+        successful = 0
+
+        for cmd in valid_commands:
+            args = self._build_add_args(cmd)
 
             try:
                 result = subprocess.run(
@@ -547,6 +666,109 @@ def execute_commands(
         logger.info(f"Successfully created {successful}/{len(commands)} tasks")
         return successful
 
+    async def add_commands_to_queue(
+        self,
+        commands: List[ParsedCommand],
+        work_queue: WorkQueue,
+    ) -> int:
+        """
+        Create tasks for parsed commands directly in a Sugar work queue.
+
+        In-process alternative to execute_commands() that avoids starting a
+        `sugar add` interpreter per command. Commands go through the same
+        checks and defaults as `sugar add`: the task type must exist in the
+        task_types table, a priority outside 1-5 is rejected, a missing (0)
+        priority becomes 3, urgent commands get priority 5 and a missing
+        description becomes "Task: <title>".
+
+        Args:
+            commands: List of ParsedCommand objects to add.
+                Invalid commands are skipped automatically.
+            work_queue: Initialized WorkQueue to add the tasks to.
+
+        Returns:
+            Count of successfully created tasks.
+        """
+        successful = 0
+
+        try:
+            async with TaskTypeManager(work_queue.db_path) as manager:
+                valid_types = set(await manager.get_task_type_ids())
+        except Exception as e:
+            # Same fallback as the CLI's --type validation
+            logger.warning(f"Could not load task types, using defaults: {e}")
+            valid_types = _FALLBACK_TASK_TYPES
+
+        for cmd in commands:
+            if not cmd.valid:
+                logger.warning(f"Skipping invalid command: {cmd.validation_error}")
+                continue
+
+            if cmd.task_type not in valid_types:
+                logger.error(
+                    f"Failed to create task '{cmd.title}': "
+                    f"unknown task type '{cmd.task_type}'"
+                )
+                continue
+
+            # `sugar add` never sees --priority 0, so it gets the default of 3
+            priority = cmd.priority or 3
+            if not 1 <= priority <= 5:
+                logger.error(
+                    f"Failed to create task '{cmd.title}': "
+                    f"priority {priority} is not in the range 1-5"
+                )
+                continue
+
+            task_data = {
+                "type": cmd.task_type,
+                "title": cmd.title,
+                "description": cmd.description or f"Task: {cmd.title}",
+                "priority": 5 if cmd.urgent else priority,
+                "status": cmd.status,
+                "source": "tool_interpreter",
+                "context": {
+                    "added_via": "tool_interpreter",
+                    "timestamp": datetime.utcnow().isoformat(),
+                },
+            }
+
+            try:
+                await work_queue.add_work(task_data)
+                logger.info(f"Created task: {cmd.title}")
+                successful += 1
+            except Exception as e:
+                logger.error(f"Error creating task '{cmd.title}': {e}")
+
+        logger.info(f"Successfully created {successful}/{len(commands)} tasks")
+        return successful
+
+    @staticmethod
+    def _build_add_args(cmd: ParsedCommand) -> List[str]:
+        """
+        Build the `sugar add` argument list for a parsed command.
+
+        Args:
+            cmd: A valid ParsedCommand.
+
+        Returns:
+            Argument list suitable for subprocess.run (no shell quoting needed).
+        """
+        args = ["sugar", "add", cmd.title]
+        args_append = args.append
+        args_extend = args.extend
+
+        for attr, option, is_flag, skip_value in _ADD_OPTION_SPEC:
+            value = getattr(cmd, attr)
+            if not value or value == skip_value:
+                continue
+            if is_flag:
+                args_append(option)
+            else:
+                args_extend((option, str(value)))
+
+        return args
+
     async def interpret_and_execute(
         self,
         tool_name: str,
@@ -554,6 +776,7 @@ async def interpret_and_execute(
         output_file_path: Path,
         template_type: Optional[str] = None,
         dry_run: bool = False,
+        work_queue: Optional[WorkQueue] = None,
     ) -> Dict[str, Any]:
         """
         Interpret tool output and execute resulting commands in a single operation.
@@ -573,6 +796,8 @@ async def interpret_and_execute(
                 Auto-detected from tool_name if not provided.
             dry_run: If True, parse and validate commands but don't create tasks.
                 Useful for testing interpretation without side effects.
+            work_queue: Optional WorkQueue. When given, tasks are added in-process
+                via add_commands_to_queue() instead of running `sugar add`.
 
         Returns:
             Dict containing:
@@ -595,7 +820,12 @@ async def interpret_and_execute(
                 "commands_found": 0,
             }
 
-        tasks_created = self.execute_commands(result.commands, dry_run=dry_run)
+        if work_queue is not None and not dry_run:
+            tasks_created = await self.add_commands_to_queue(
+                result.commands, work_queue
+            )
+        else:
+            tasks_created = self.execute_commands(result.commands, dry_run=dry_run)
 
         return {
             "success": True,
@@ -4,9 +4,11 @@
 Integrates with the existing WorkQueue storage system.
 """
 
+import asyncio
+import contextlib
 import json
 import logging
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime
 
 import aiosqlite
@@ -15,7 +17,19 @@
 
 
 class TaskTypeManager:
-    """Manages task types in the database"""
+    """Manages task types in the database
+
+    When the caller manages its lifetime (``async with`` or an explicit
+    initialize() followed by close()), all queries share one lazily opened
+    connection. Otherwise each query opens and closes its own connection, so
+    an unmanaged manager never leaves aiosqlite's worker thread running.
+
+    A managed manager also serves single-type lookups from an in-memory copy
+    of the table, loaded on first use and dropped whenever it writes to it or
+    is closed. An unmanaged one may live as long as the process (ClaudeWrapper
+    in the daemon), so it reads the table on every lookup and sees changes
+    made by other processes.
+    """
 
     # Default task types that are created when the table is initialized
     DEFAULT_TASK_TYPES = [
@@ -81,9 +95,147 @@ class TaskTypeManager:
         },
     ]
 
+    # DEFAULT_TASK_TYPES as INSERT parameter tuples, built once at import
+    _DEFAULT_ROWS: Tuple[Tuple, ...] = tuple(
+        (
+            task_type["id"],
+            task_type["name"],
+            task_type["description"],
+            task_type["agent"],
+            task_type["commit_template"],
+            task_type["emoji"],
+            task_type["file_patterns"],
+            task_type["is_default"],
+        )
+        for task_type in DEFAULT_TASK_TYPES
+    )
+
+    _INSERT_SQL = """
+        INSERT INTO task_types
+        (id, name, description, agent, commit_template, emoji, file_patterns, is_default)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+    """
+
+    # Constant UPDATE text so SQLite's statement cache can reuse it for every
+    # call; a NULL parameter keeps the column's current value
+    _UPDATE_SQL = """
+        UPDATE task_types SET
+            name = COALESCE(?, name),
+            description = COALESCE(?, description),
+            agent = COALESCE(?, agent),
+            commit_template = COALESCE(?, commit_template),
+            emoji = COALESCE(?, emoji),
+            file_patterns = COALESCE(?, file_patterns),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = ?
+    """
+
     def __init__(self, db_path: str):
         self.db_path = db_path
         self._initialized = False
+        self._db: Optional[aiosqlite.Connection] = None
+        # Set once the caller has taken responsibility for calling close()
+        self._keep_open = False
+        # Serialises the first open so concurrent callers share one connection
+        self._open_lock = asyncio.Lock()
+        # type_id -> parsed row, loaded lazily; None means "reload on next read"
+        self._cache: Optional[Dict[str, Dict]] = None
+
+    async def __aenter__(self) -> "TaskTypeManager":
+        self._keep_open = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def initialize(self) -> None:
+        """Open the shared connection and ensure the table exists ahead of first use.
+
+        The connection stays open until close() is called.
+        """
+        self._keep_open = True
+        await self._conn()
+
+    async def _open(self) -> aiosqlite.Connection:
+        """Open a new connection, creating the table on the first one."""
+        db = await aiosqlite.connect(self.db_path)
+        db.row_factory = aiosqlite.Row
+        try:
+            await self._ensure_table_exists(db)
+        except Exception:
+            await db.close()
+            raise
+        return db
+
+    async def _conn(self) -> aiosqlite.Connection:
+        """Return the shared connection, opening it on first use.
+
+        Table setup runs once, when the connection is opened, so the hot path
+        is a single attribute check.
+        """
+        if self._db is not None:
+            return self._db
+
+        async with self._open_lock:
+            if self._db is None:
+                self._db = await self._open()
+        return self._db
+
+    @contextlib.asynccontextmanager
+    async def _connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Connection for one operation: the shared one if managed, else a fresh one."""
+        if self._keep_open:
+            yield await self._conn()
+            return
+
+        db = await self._open()
+        try:
+            yield db
+        finally:
+            await db.close()
+
+    async def close(self) -> None:
+        """Close the shared connection. Safe to call multiple times."""
+        self._cache = None
+        self._keep_open = False
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
+    @staticmethod
+    def _row_to_dict(row: aiosqlite.Row, _loads=json.loads) -> Dict:
+        """Convert a task_types row to a dict with file_patterns decoded.
+
+        file_patterns is only ever written via json.dumps, so it is trusted to
+        be valid JSON here; NULL or empty becomes an empty list.
+        """
+        task_type = dict(row)
+        raw_patterns = task_type["file_patterns"]
+        task_type["file_patterns"] = _loads(raw_patterns) if raw_patterns else []
+        return task_type
+
+    async def _get_cache(self) -> Dict[str, Dict]:
+        """Return the type_id -> task type map, loading it with one query if needed.
+
+        Hot read paths check ``self._cache is not None`` first so a warm cache
+        (even an empty one) is a plain dict lookup with no coroutine round trip.
+        """
+        if self._cache is not None:
+            return self._cache
+
+        async with self._connection() as db:
+            cursor = await db.execute("SELECT * FROM task_types")
+
+            # Parse JSON file_patterns once, at load time
+            cache = {}
+            async for row in cursor:
+                task_type = self._row_to_dict(row)
+                cache[task_type["id"]] = task_type
+
+        # Only a managed manager is short-lived enough to keep the copy
+        if self._keep_open:
+            self._cache = cache
+        return cache
 
     async def _ensure_table_exists(self, db) -> None:
         """Ensure the task_types table exists, creating it with defaults if needed.
@@ -129,19 +281,7 @@ async def _ensure_table_exists(self, db) -> None:
                 (id, name, description, agent, commit_template, emoji, file_patterns, is_default)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                [
-                    (
-                        task_type["id"],
-                        task_type["name"],
-                        task_type["description"],
-                        task_type["agent"],
-                        task_type["commit_template"],
-                        task_type["emoji"],
-                        task_type["file_patterns"],
-                        task_type["is_default"],
-                    )
-                    for task_type in self.DEFAULT_TASK_TYPES
-                ],
+                self._DEFAULT_ROWS,
             )
             await db.commit()
 
@@ -149,64 +289,28 @@ async def _ensure_table_exists(self, db) -> None:
 
     async def get_all_task_types(self) -> List[Dict]:
         """Get all task types from the database."""
-        async with aiosqlite.connect(self.db_path) as db:
-            await self._ensure_table_exists(db)
-            db.row_factory = aiosqlite.Row
+        async with self._connection() as db:
             cursor = await db.execute(
                 "SELECT * FROM task_types ORDER BY is_default DESC, name ASC"
             )
-            rows = await cursor.fetchall()
-
-            result = []
-            for row in rows:
-                task_type = dict(row)
-                # Parse JSON file_patterns
-                if task_type.get("file_patterns"):
-                    try:
-                        task_type["file_patterns"] = json.loads(
-                            task_type["file_patterns"]
-                        )
-                    except json.JSONDecodeError:
-                        task_type["file_patterns"] = []
-                else:
-                    task_type["file_patterns"] = []
-                result.append(task_type)
-
-            return result
+            # Iterate the cursor (fetched in chunks) instead of materialising fetchall()
+            return [self._row_to_dict(row) async for row in cursor]
 
     async def get_task_type(self, type_id: str) -> Optional[Dict]:
         """Get a specific task type by ID."""
-        async with aiosqlite.connect(self.db_path) as db:
-            await self._ensure_table_exists(db)
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT * FROM task_types WHERE id = ?", (type_id,)
-            )
-            row = await cursor.fetchone()
-
-            if row:
-                task_type = dict(row)
-                # Parse JSON file_patterns
-                if task_type.get("file_patterns"):
-                    try:
-                        task_type["file_patterns"] = json.loads(
-                            task_type["file_patterns"]
-                        )
-                    except json.JSONDecodeError:
-                        task_type["file_patterns"] = []
-                else:
-                    task_type["file_patterns"] = []
-                return task_type
-
+        cache = self._cache
+        if cache is None:
+            cache = await self._get_cache()
+        task_type = cache.get(type_id)
+        if task_type is None:
             return None
+        # Hand out a copy so callers cannot mutate the cached entry
+        return {**task_type, "file_patterns": list(task_type["file_patterns"])}
 
     async def get_task_type_ids(self) -> List[str]:
         """Get all task type IDs for CLI validation."""
-        async with aiosqlite.connect(self.db_path) as db:
-            await self._ensure_table_exists(db)
-            cursor = await db.execute("SELECT id FROM task_types ORDER BY name ASC")
-            rows = await cursor.fetchall()
-            return [row[0] for row in rows]
+        cache = await self._get_cache()
+        return sorted(cache, key=lambda type_id: cache[type_id]["name"])
 
     async def add_task_type(
         self,
@@ -225,15 +329,10 @@ async def add_task_type(
         if file_patterns is None:
             file_patterns = []
 
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await self._ensure_table_exists(db)
+        async with self._connection() as db:
+            try:
                 await db.execute(
-                    """
-                    INSERT INTO task_types
-                    (id, name, description, agent, commit_template, emoji, file_patterns, is_default)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, 0)
-                """,
+                    self._INSERT_SQL,
                     (
                         type_id,
                         name,
@@ -245,14 +344,64 @@ async def add_task_type(
                     ),
                 )
                 await db.commit()
+                self._cache = None
                 logger.info(f"Added new task type: {type_id}")
                 return True
-        except aiosqlite.IntegrityError:
-            logger.error(f"Task type '{type_id}' already exists")
-            return False
-        except Exception as e:
-            logger.error(f"Error adding task type '{type_id}': {e}")
-            return False
+            except aiosqlite.IntegrityError:
+                await db.rollback()
+                logger.error(f"Task type '{type_id}' already exists")
+                return False
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Error adding task type '{type_id}': {e}")
+                return False
+
+    @staticmethod
+    def _insert_params(task_type: Dict) -> tuple:
+        """Build INSERT parameters from a task type dict, applying add defaults."""
+        type_id = task_type["id"]
+        return (
+            type_id,
+            task_type.get("name", type_id.title()),
+            task_type.get("description"),
+            task_type.get("agent", "general-purpose"),
+            task_type.get("commit_template") or f"{type_id}: {{title}}",
+            task_type.get("emoji"),
+            json.dumps(task_type.get("file_patterns") or []),
+        )
+
+    async def add_task_types_bulk(self, task_types: List[Dict]) -> int:
+        """Add several new task types in one transaction
+
+        All-or-nothing: if any ID already exists, nothing is added.
+        """
+        rows = []
+        for task_type in task_types:
+            if not task_type.get("id"):
+                logger.warning("Skipping task type without ID")
+                continue
+            rows.append(self._insert_params(task_type))
+
+        if not rows:
+            return 0
+
+        async with self._connection() as db:
+            try:
+                await db.executemany(self._INSERT_SQL, rows)
+                await db.commit()
+            except aiosqlite.IntegrityError as e:
+                await db.rollback()
+                logger.error(f"Task types not added, duplicate ID: {e}")
+                return 0
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Error adding task types: {e}")
+                return 0
+            finally:
+                self._cache = None
+
+        logger.info(f"Added {len(rows)} new task types")
+        return len(rows)
 
     async def update_task_type(
         self,
@@ -265,129 +414,101 @@ async def update_task_type(
         file_patterns: List[str] = None,
     ) -> bool:
         """Update an existing task type"""
-        # First check if task type exists
-        existing = await self.get_task_type(type_id)
-        if not existing:
-            logger.error(f"Task type '{type_id}' not found")
-            return False
-
-        updates = []
-        params = []
-
-        if name is not None:
-            updates.append("name = ?")
-            params.append(name)
-        if description is not None:
-            updates.append("description = ?")
-            params.append(description)
-        if agent is not None:
-            updates.append("agent = ?")
-            params.append(agent)
-        if commit_template is not None:
-            updates.append("commit_template = ?")
-            params.append(commit_template)
-        if emoji is not None:
-            updates.append("emoji = ?")
-            params.append(emoji)
-        if file_patterns is not None:
-            updates.append("file_patterns = ?")
-            params.append(json.dumps(file_patterns))
-
-        if not updates:
+        params = (
+            name,
+            description,
+            agent,
+            commit_template,
+            emoji,
+            None if file_patterns is None else json.dumps(file_patterns),
+        )
+        if all(value is None for value in params):
             logger.warning(f"No updates provided for task type '{type_id}'")
             return False
 
-        updates.append("updated_at = CURRENT_TIMESTAMP")
-        params.append(type_id)
-
-        try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await self._ensure_table_exists(db)
-                await db.execute(
-                    f"UPDATE task_types SET {', '.join(updates)} WHERE id = ?",
-                    params,
-                )
+        async with self._connection() as db:
+            try:
+                # rowcount doubles as the existence check
+                cursor = await db.execute(self._UPDATE_SQL, (*params, type_id))
+                if cursor.rowcount == 0:
+                    # Even a no-op UPDATE opens a write transaction; end it so
+                    # the shared connection doesn't keep the database locked
+                    await db.rollback()
+                    logger.error(f"Task type '{type_id}' not found")
+                    return False
                 await db.commit()
+                self._cache = None
                 logger.info(f"Updated task type: {type_id}")
                 return True
-        except Exception as e:
-            logger.error(f"Error updating task type '{type_id}': {e}")
-            return False
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Error updating task type '{type_id}': {e}")
+                return False
 
     async def remove_task_type(self, type_id: str) -> bool:
         """Remove a task type (if not default and no active tasks)"""
-        # Check if task type exists and is not default
-        existing = await self.get_task_type(type_id)
-        if not existing:
-            logger.error(f"Task type '{type_id}' not found")
-            return False
-
-        if existing["is_default"]:
-            logger.error(f"Cannot delete default task type '{type_id}'")
-            return False
-
-        # Check if there are active tasks with this type
-        async with aiosqlite.connect(self.db_path) as db:
-            await self._ensure_table_exists(db)
-            cursor = await db.execute(
-                "SELECT COUNT(*) FROM work_items WHERE type = ? AND status NOT IN ('completed', 'failed')",
-                (type_id,),
-            )
-            active_count = (await cursor.fetchone())[0]
-
-            if active_count > 0:
-                logger.error(
-                    f"Cannot delete task type '{type_id}': {active_count} active tasks exist"
-                )
-                return False
-
+        async with self._connection() as db:
             try:
-                await db.execute("DELETE FROM task_types WHERE id = ?", (type_id,))
-                await db.commit()
-                logger.info(f"Removed task type: {type_id}")
-                return True
+                # Existence, default and active-task checks folded into the DELETE
+                cursor = await db.execute(
+                    """
+                    DELETE FROM task_types
+                    WHERE id = ? AND is_default = 0 AND NOT EXISTS (
+                        SELECT 1 FROM work_items
+                        WHERE type = ? AND status NOT IN ('completed', 'failed')
+                    )
+                """,
+                    (type_id, type_id),
+                )
+                deleted = cursor.rowcount > 0
+                if deleted:
+                    await db.commit()
+                else:
+                    # Release the write transaction the refused DELETE opened
+                    await db.rollback()
             except Exception as e:
+                await db.rollback()
                 logger.error(f"Error removing task type '{type_id}': {e}")
                 return False
 
+        if deleted:
+            self._cache = None
+            logger.info(f"Removed task type: {type_id}")
+            return True
+
+        # Nothing deleted: work out which condition refused it for the log
+        existing = (await self._get_cache()).get(type_id)
+        if not existing:
+            logger.error(f"Task type '{type_id}' not found")
+        elif existing["is_default"]:
+            logger.error(f"Cannot delete default task type '{type_id}'")
+        else:
+            logger.error(f"Cannot delete task type '{type_id}': active tasks exist")
+        return False
+
     async def export_task_types(self) -> List[Dict]:
         """Export all non-default task types for version control"""
-        async with aiosqlite.connect(self.db_path) as db:
-            await self._ensure_table_exists(db)
-            db.row_factory = aiosqlite.Row
+        async with self._connection() as db:
+            # Only the portable columns; timestamps and is_default stay in the DB
             cursor = await db.execute(
-                "SELECT * FROM task_types WHERE is_default = 0 ORDER BY name ASC"
+                """
+                SELECT id, name, description, agent, commit_template, emoji, file_patterns
+                FROM task_types WHERE is_default = 0 ORDER BY name ASC
+            """
             )
-            rows = await cursor.fetchall()
-
-            result = []
-            for row in rows:
-                task_type = dict(row)
-                # Remove database-specific fields
-                task_type.pop("created_at", None)
-                task_type.pop("updated_at", None)
-                task_type.pop("is_default", None)
-
-                # Parse JSON file_patterns
-                if task_type.get("file_patterns"):
-                    try:
-                        task_type["file_patterns"] = json.loads(
-                            task_type["file_patterns"]
-                        )
-                    except json.JSONDecodeError:
-                        task_type["file_patterns"] = []
-                else:
-                    task_type["file_patterns"] = []
-
-                result.append(task_type)
-
-            return result
+            return [self._row_to_dict(row) async for row in cursor]
 
     async def import_task_types(
         self, task_types: List[Dict], overwrite: bool = False
     ) -> int:
-        """Import task types from external source"""
-        imported_count = 0
+        """Import task types from external source
+
+        New types are inserted and (with overwrite) existing ones updated in a
+        single transaction, one executemany per statement.
+        """
+        existing_ids = set(await self._get_cache())
+        to_insert = []
+        to_update = []
 
         for task_type in task_types:
             type_id = task_type.get("id")
@@ -395,48 +516,64 @@ async def import_task_types(
                 logger.warning("Skipping task type without ID")
                 continue
 
-            # Check if already exists
-            existing = await self.get_task_type(type_id)
-            if existing and not overwrite:
-                logger.warning(f"Task type '{type_id}' already exists, skipping")
-                continue
-
-            if existing and overwrite:
-                # Update existing
-                success = await self.update_task_type(
-                    type_id,
-                    name=task_type.get("name"),
-                    description=task_type.get("description"),
-                    agent=task_type.get("agent"),
-                    commit_template=task_type.get("commit_template"),
-                    emoji=task_type.get("emoji"),
-                    file_patterns=task_type.get("file_patterns", []),
+            if type_id in existing_ids:
+                if not overwrite:
+                    logger.warning(f"Task type '{type_id}' already exists, skipping")
+                    continue
+
+                file_patterns = task_type.get("file_patterns", [])
+                values = (
+                    task_type.get("name"),
+                    task_type.get("description"),
+                    task_type.get("agent"),
+                    task_type.get("commit_template"),
+                    task_type.get("emoji"),
+                    None if file_patterns is None else json.dumps(file_patterns),
                 )
+                if all(value is None for value in values):
+                    logger.warning(f"No updates provided for task type '{type_id}'")
+                    continue
+                to_update.append((*values, type_id))
             else:
-                # Add new
-                success = await self.add_task_type(
-                    type_id,
-                    name=task_type.get("name", type_id.title()),
-                    description=task_type.get("description"),
-                    agent=task_type.get("agent", "general-purpose"),
-                    commit_template=task_type.get("commit_template"),
-                    emoji=task_type.get("emoji"),
-                    file_patterns=task_type.get("file_patterns", []),
-                )
+                to_insert.append(self._insert_params(task_type))
+                # A repeated ID later in the same batch is treated as existing
+                existing_ids.add(type_id)
 
-            if success:
-                imported_count += 1
+        if not to_insert and not to_update:
+            return 0
 
-        return imported_count
+        async with self._connection() as db:
+            try:
+                if to_insert:
+                    await db.executemany(self._INSERT_SQL, to_insert)
+                if to_update:
+                    await db.executemany(self._UPDATE_SQL, to_update)
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Error importing task types: {e}")
+                return 0
+            finally:
+                self._cache = None
+
+        logger.info(
+            f"Imported {len(to_insert)} new and {len(to_update)} updated task types"
+        )
+        return len(to_insert) + len(to_update)
 
     async def validate_task_type_id(self, type_id: str) -> bool:
         """Validate that a task type ID exists"""
-        existing = await self.get_task_type(type_id)
-        return existing is not None
+        cache = self._cache
+        if cache is None:
+            cache = await self._get_cache()
+        return type_id in cache
 
     async def get_agent_for_type(self, type_id: str) -> str:
         """Get the agent configured for a task type"""
-        task_type = await self.get_task_type(type_id)
+        cache = self._cache
+        if cache is None:
+            cache = await self._get_cache()
+        task_type = cache.get(type_id)
         return (
             task_type.get("agent", "general-purpose")
             if task_type
@@ -445,7 +582,10 @@ async def get_agent_for_type(self, type_id: str) -> str:
 
     async def get_commit_template_for_type(self, type_id: str) -> str:
         """Get the commit template for a task type"""
-        task_type = await self.get_task_type(type_id)
+        cache = self._cache
+        if cache is None:
+            cache = await self._get_cache()
+        task_type = cache.get(type_id)
         return (
             task_type.get("commit_template", f"{type_id}: {{title}}")
             if task_type
@@ -454,5 +594,8 @@ async def get_commit_template_for_type(self, type_id: str) -> str:
 
     async def get_file_patterns_for_type(self, type_id: str) -> List[str]:
         """Get the file patterns for a task type"""
-        task_type = await self.get_task_type(type_id)
-        return task_type.get("file_patterns", []) if task_type else []
+        cache = self._cache
+        if cache is None:
+            cache = await self._get_cache()
+        task_type = cache.get(type_id)
+        return list(task_type.get("file_patterns", [])) if task_type else []
@@ -70,6 +70,15 @@ async def initialize(self):
             """
             )
 
+            # Supports per-type lookups such as TaskTypeManager.remove_task_type's
+            # active-task check
+            await db.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_work_items_type_status
+                ON work_items (type, status)
+            """
+            )
+
             # Migrate existing databases to add timing columns and task types table
             await self._migrate_timing_columns(db)
             await self._migrate_task_types_table(db)
@@ -141,24 +150,14 @@ async def _migrate_task_types_table(self, db):
                 )
 
                 # Insert default task types (use shared defaults from TaskTypeManager)
-                for task_type in TaskTypeManager.DEFAULT_TASK_TYPES:
-                    await db.execute(
-                        """
-                        INSERT INTO task_types
-                        (id, name, description, agent, commit_template, emoji, file_patterns, is_default)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                        (
-                            task_type["id"],
-                            task_type["name"],
-                            task_type["description"],
-                            task_type["agent"],
-                            task_type["commit_template"],
-                            task_type["emoji"],
-                            task_type["file_patterns"],
-                            task_type["is_default"],
-                        ),
-                    )
+                await db.executemany(
+                    """
+                    INSERT INTO task_types
+                    (id, name, description, agent, commit_template, emoji, file_patterns, is_default)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    TaskTypeManager._DEFAULT_ROWS,
+                )
 
                 logger.info("Created task_types table and populated with default types")
 
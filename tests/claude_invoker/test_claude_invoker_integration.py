@@ -11,8 +11,6 @@
 """
 
 import pytest
-import tempfile
-from pathlib import Path
 from unittest.mock import patch, AsyncMock
 
 from sugar.quality.claude_invoker import ToolOutputInterpreter
@@ -27,25 +25,19 @@ class TestIntegration:
     - Command parsing edge cases: Various input formats that stress-test the parser
     """
 
-    def setup_method(self):
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def output_file(cls, tmp_path_factory):
         """
         Create a temporary JSON file simulating eslint output.
 
         The JSON format matches typical eslint --format json output structure
         with errorCount and warningCount fields that the interpreter would
-        analyze to generate task recommendations.
+        analyze to generate task recommendations. No test writes to it, so it
+        is created once for the class under pytest's managed temp directory.
         """
-        self.temp_file = tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        )
-        self.temp_file.write('{"errorCount": 23, "warningCount": 15}')
-        self.temp_file.close()
-        self.output_path = Path(self.temp_file.name)
-
-    def teardown_method(self):
-        """Remove temporary test file created in setup_method."""
-        if self.output_path.exists():
-            self.output_path.unlink()
+        cls.output_path = tmp_path_factory.mktemp("eslint_output") / "output.json"
+        cls.output_path.write_text('{"errorCount": 23, "warningCount": 15}')
 
     @pytest.mark.asyncio
     async def test_full_interpretation_flow(self):
@@ -93,26 +85,9 @@ async def test_full_interpretation_flow(self):
             assert result["commands_found"] == 3
             assert result["tasks_created"] == 3
 
-    def test_command_parsing_edge_cases(self):
-        """
-        Verify _parse_command handles unusual but valid input formats.
-
-        Tests three edge cases that could break naive parsing:
-
-        1. Escaped quotes in description: Ensures shlex-based parsing correctly
-           handles escaped double quotes within argument values.
-
-        2. Multiple consecutive spaces: Verifies whitespace normalization works
-           and doesn't create empty tokens or misalign argument parsing.
-
-        3. Empty title validation: Confirms the parser rejects commands with
-           empty string titles, marking them as invalid.
-
-        Each test case is a tuple of (command_string, expected_validity, expected_title).
-        """
-        interpreter = ToolOutputInterpreter()
-
-        test_cases = [
+    @pytest.mark.parametrize(
+        "cmd_str,expected_valid,expected_title",
+        [
             # Case 1: Command with escaped quotes in description
             # Tests shlex handling of backslash-escaped quotes
             (
@@ -134,10 +109,30 @@ def test_command_parsing_edge_cases(self):
                 False,
                 None,
             ),
-        ]
+        ],
+        ids=["escaped-quotes", "multiple-spaces", "empty-title"],
+    )
+    def test_command_parsing_edge_cases(self, cmd_str, expected_valid, expected_title):
+        """
+        Verify _parse_command handles unusual but valid input formats.
+
+        Covers three edge cases that could break naive parsing:
+
+        1. Escaped quotes in description: Ensures shlex-based parsing correctly
+           handles escaped double quotes within argument values.
+
+        2. Multiple consecutive spaces: Verifies whitespace normalization works
+           and doesn't create empty tokens or misalign argument parsing.
+
+        3. Empty title validation: Confirms the parser rejects commands with
+           empty string titles, marking them as invalid.
+
+        Each case runs as its own parametrized test, so one failure does not
+        hide the others.
+        """
+        interpreter = ToolOutputInterpreter()
 
-        for cmd_str, expected_valid, expected_title in test_cases:
-            cmd = interpreter._parse_command(cmd_str)
-            assert cmd.valid == expected_valid, f"Failed for: {cmd_str}"
-            if expected_valid:
-                assert cmd.title == expected_title, f"Title mismatch for: {cmd_str}"
+        cmd = interpreter._parse_command(cmd_str)
+        assert cmd.valid == expected_valid
+        if expected_valid:
+            assert cmd.title == expected_title
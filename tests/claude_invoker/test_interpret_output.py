@@ -3,8 +3,6 @@
 """
 
 import pytest
-import tempfile
-from pathlib import Path
 from unittest.mock import patch, AsyncMock
 
 from sugar.quality.claude_invoker import ToolOutputInterpreter
@@ -13,21 +11,17 @@
 class TestInterpretOutput:
     """Tests for the interpret_output method"""
 
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def output_file(cls, tmp_path_factory):
+        """Create the tool output file once for the whole class (read-only)"""
+        cls.output_path = tmp_path_factory.mktemp("tool_output") / "output.txt"
+        cls.output_path.write_text("10 problems found")
+
     def setup_method(self):
         """Set up test interpreter with mocked wrapper"""
+        # Per test: the interpreter keeps an interpretation cache
         self.interpreter = ToolOutputInterpreter()
-        # Create a temp file for testing
-        self.temp_file = tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        )
-        self.temp_file.write("10 problems found")
-        self.temp_file.close()
-        self.output_path = Path(self.temp_file.name)
-
-    def teardown_method(self):
-        """Clean up temp files"""
-        if self.output_path.exists():
-            self.output_path.unlink()
 
     @pytest.mark.asyncio
     async def test_interpret_output_success(self):
@@ -120,25 +114,109 @@ async def test_interpret_output_exception_handling(self):
             assert result.success is False
             assert "Unexpected error" in result.error_message
 
+    @pytest.mark.asyncio
+    async def test_interpret_output_reuses_cached_result(self, tmp_path):
+        """Test identical output is only sent to Claude once"""
+        # Own file: this test rewrites it, so it can't use the shared one
+        output_path = tmp_path / "output.txt"
+        output_path.write_text("10 problems found")
+
+        with patch.object(
+            self.interpreter, "_execute_claude_prompt", new_callable=AsyncMock
+        ) as mock_exec:
+            mock_exec.return_value = {
+                "success": True,
+                "output": 'sugar add "Fix bug" --type bug_fix',
+                "error": "",
+                "execution_time": 1.0,
+            }
+
+            first = await self.interpreter.interpret_output(
+                tool_name="eslint",
+                command="eslint src/",
+                output_file_path=output_path,
+            )
+            second = await self.interpreter.interpret_output(
+                tool_name="eslint",
+                command="eslint src/",
+                output_file_path=output_path,
+            )
+
+            assert second == first
+            assert mock_exec.call_count == 1
+
+            # Each caller gets its own copy; changing one must not leak
+            first.commands.append(first.commands[0])
+            second.commands[0].priority = 1
+            third = await self.interpreter.interpret_output(
+                tool_name="eslint",
+                command="eslint src/",
+                output_file_path=output_path,
+            )
+            assert len(third.commands) == 1
+            assert third.commands[0].priority == 3
+            assert mock_exec.call_count == 1
+
+            # Changed output content must miss the cache
+            output_path.write_text("11 problems found")
+            await self.interpreter.interpret_output(
+                tool_name="eslint",
+                command="eslint src/",
+                output_file_path=output_path,
+            )
+            assert mock_exec.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_interpretation_cache_is_bounded(self, tmp_path):
+        """Test the cache evicts the least recently used interpretation"""
+        output_path = tmp_path / "output.txt"
+        output_path.write_text("10 problems found")
+
+        max_entries = "sugar.quality.claude_invoker.INTERPRETATION_CACHE_MAX_ENTRIES"
+        with patch(max_entries, 2):
+            with patch.object(
+                self.interpreter, "_execute_claude_prompt", new_callable=AsyncMock
+            ) as mock_exec:
+                mock_exec.return_value = {
+                    "success": True,
+                    "output": 'sugar add "Fix bug" --type bug_fix',
+                    "error": "",
+                    "execution_time": 1.0,
+                }
+
+                async def interpret(tool_name):
+                    await self.interpreter.interpret_output(
+                        tool_name=tool_name,
+                        command=f"{tool_name} src/",
+                        output_file_path=output_path,
+                    )
+
+                await interpret("eslint")
+                await interpret("ruff")
+                await interpret("eslint")  # Hit: ruff is now least recently used
+                await interpret("mypy")  # Evicts ruff
+                assert len(self.interpreter.interpretation_cache) == 2
+                assert mock_exec.call_count == 3
+
+                await interpret("eslint")
+                assert mock_exec.call_count == 3
+                await interpret("ruff")
+                assert mock_exec.call_count == 4
+
 
 class TestInterpretAndExecute:
     """Tests for the interpret_and_execute convenience method"""
 
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def output_file(cls, tmp_path_factory):
+        """Create the tool output file once for the whole class (read-only)"""
+        cls.output_path = tmp_path_factory.mktemp("tool_output") / "output.txt"
+        cls.output_path.write_text("20 problems")
+
     def setup_method(self):
         """Set up test interpreter"""
         self.interpreter = ToolOutputInterpreter()
-        # Create a temp file for testing
-        self.temp_file = tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        )
-        self.temp_file.write("20 problems")
-        self.temp_file.close()
-        self.output_path = Path(self.temp_file.name)
-
-    def teardown_method(self):
-        """Clean up temp files"""
-        if self.output_path.exists():
-            self.output_path.unlink()
 
     @pytest.mark.asyncio
     async def test_interpret_and_execute_success(self):
@@ -14,6 +14,17 @@
 from click.testing import CliRunner
 
 
+def pytest_configure(config):
+    """Register the custom markers.
+
+    pytest.ini's [tool:pytest] header is not read by pytest, so its markers
+    list is not applied; register them here so -m selection works cleanly.
+    """
+    config.addinivalue_line("markers", "unit: Unit tests")
+    config.addinivalue_line("markers", "integration: Integration tests")
+    config.addinivalue_line("markers", "slow: Slow running tests")
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests"""
@@ -0,0 +1,57 @@
+"""
+Pytest fixtures for discovery module tests.
+"""
+
+import sys
+from unittest.mock import DEFAULT, patch
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # optional; async tests fall back to asyncio's default loop
+    uvloop = None
+
+from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
+
+# SugarLoop collaborators that would touch the database, Claude or git
+SUGAR_LOOP_DEPENDENCIES = (
+    "WorkQueue",
+    "ClaudeWrapper",
+    "FeedbackProcessor",
+    "AdaptiveScheduler",
+    "GitOperations",
+    "WorkflowOrchestrator",
+)
+
+
+@pytest.fixture(scope="module")
+def empty_discovery():
+    """ExternalToolDiscovery with no tools, built once per test module"""
+    return ExternalToolDiscovery({"enabled": True, "tools": []})
+
+
+@pytest.fixture
+def discovery(empty_discovery):
+    """The shared no-tools discovery with its duplicate tracking reset per test"""
+    empty_discovery._processed_hashes.clear()
+    return empty_discovery
+
+
+@pytest.fixture
+def sugar_loop_patches():
+    """Yield the SugarLoop class with its heavy dependencies patched"""
+    from sugar.core.loop import SugarLoop
+
+    with patch.multiple(
+        "sugar.core.loop", **dict.fromkeys(SUGAR_LOOP_DEPENDENCIES, DEFAULT)
+    ):
+        yield SugarLoop
+
+
+if uvloop is not None and sys.platform != "win32":
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run the async discovery tests on uvloop where it is installed"""
+        return uvloop.EventLoopPolicy()
@@ -12,16 +12,79 @@
 - Claude interpretation mode (when enabled)
 """
 
+import re
 import pytest
 import pytest_asyncio
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock, AsyncMock
-from dataclasses import dataclass
+from unittest.mock import Mock, patch, MagicMock, AsyncMock, PropertyMock
+from dataclasses import dataclass, replace
 from typing import Optional
 
+from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
 
-@dataclass
+# Async tests in this module share one event loop instead of one loop per test
+ASYNC_MODULE_LOOP = pytest.mark.asyncio(loop_scope="module")
+
+# Minimal SugarLoop configs with only external tool discovery switched on or off
+ENABLED_YAML = """
+sugar:
+  dry_run: true
+  discovery:
+    error_logs:
+      enabled: false
+    github:
+      enabled: false
+    code_quality:
+      enabled: false
+    test_coverage:
+      enabled: false
+    external_tools:
+      enabled: true
+      tools:
+        - name: ruff
+          command: ruff check .
+  storage:
+    database: ":memory:"
+  claude:
+    model: claude-3-5-sonnet-20241022
+"""
+
+DISABLED_YAML = """
+sugar:
+  dry_run: true
+  discovery:
+    error_logs:
+      enabled: false
+    github:
+      enabled: false
+    code_quality:
+      enabled: false
+    test_coverage:
+      enabled: false
+    external_tools:
+      enabled: false
+  storage:
+    database: ":memory:"
+  claude:
+    model: claude-3-5-sonnet-20241022
+"""
+
+
+@pytest.fixture(scope="session")
+def config_paths(tmp_path_factory):
+    """Write the SugarLoop configs once per session, keyed by scenario"""
+    config_dir = tmp_path_factory.mktemp("cfg")
+    paths = {
+        "enabled": config_dir / "enabled.yaml",
+        "disabled": config_dir / "disabled.yaml",
+    }
+    paths["enabled"].write_text(ENABLED_YAML)
+    paths["disabled"].write_text(DISABLED_YAML)
+    return paths
+
+
+@dataclass(slots=True, frozen=True)
 class MockToolResult:
     """Mock ToolResult for testing."""
 
@@ -46,13 +109,50 @@ def has_output(self) -> bool:
         return bool(self._stdout.strip() or self.stderr.strip())
 
 
+# Prototype results; tests vary individual fields via dataclasses.replace
+_BASE_RUFF = MockToolResult(
+    name="ruff",
+    command="ruff check .",
+    output_path=None,
+    stderr="",
+    exit_code=1,
+    success=False,
+)
+
+_BASE_NONEXISTENT = MockToolResult(
+    name="nonexistent",
+    command="nonexistent_tool check",
+    output_path=None,
+    stderr="",
+    exit_code=127,
+    success=False,
+    tool_not_found=True,
+)
+
+
+class FakeOrchestrator:
+    """Stand-in for ToolOrchestrator that returns preset results."""
+
+    next_results: list = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def execute_all(self, timeout_per_tool=None):
+        return type(self).next_results
+
+    async def execute_all_async(self, timeout_per_tool=None):
+        return self.execute_all(timeout_per_tool)
+
+    def cleanup(self, wait=True):
+        pass
+
+
 class TestExternalToolDiscoveryInitialization:
     """Test ExternalToolDiscovery initialization and configuration."""
 
     def test_initialization_with_empty_config(self):
         """Discovery should initialize with empty config."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
         config = {}
         discovery = ExternalToolDiscovery(config)
 
@@ -62,8 +162,6 @@ def test_initialization_with_empty_config(self):
 
     def test_initialization_with_disabled_config(self):
         """Discovery should have no tools when disabled."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
         config = {
             "enabled": False,
             "tools": [{"name": "ruff", "command": "ruff check"}],
@@ -74,8 +172,6 @@ def test_initialization_with_disabled_config(self):
 
     def test_initialization_with_tools_configured(self):
         """Discovery should parse tool configurations."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
         config = {
             "enabled": True,
             "tools": [
@@ -92,8 +188,6 @@ def test_initialization_with_tools_configured(self):
 
     def test_initialization_with_custom_options(self):
         """Discovery should accept custom configuration options."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
         config = {
             "enabled": True,
             "tools": [],
@@ -111,177 +205,75 @@ def test_initialization_with_custom_options(self):
 class TestExternalToolDiscoveryDiscover:
     """Test the discover() method."""
 
-    @pytest.mark.asyncio
-    async def test_discover_returns_empty_when_no_tools(self):
-        """Discover should return empty list when no tools configured."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
+    pytestmark = ASYNC_MODULE_LOOP
 
-        config = {"enabled": True, "tools": []}
-        discovery = ExternalToolDiscovery(config)
+    @pytest.fixture(autouse=True)
+    def fake_orchestrator(self, monkeypatch):
+        """Swap ToolOrchestrator for FakeOrchestrator with no preset results."""
+        FakeOrchestrator.next_results = []
+        monkeypatch.setattr(
+            "sugar.discovery.external_tool_discovery.ToolOrchestrator",
+            FakeOrchestrator,
+        )
+        return FakeOrchestrator
 
+    async def test_discover_returns_empty_when_no_tools(self, discovery):
+        """Discover should return empty list when no tools configured."""
         work_items = await discovery.discover()
 
         assert work_items == []
 
-    @pytest.mark.asyncio
-    async def test_discover_processes_tool_with_issues(self):
-        """Discover should create work items from tool with non-zero exit code."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
+    @pytest.mark.parametrize(
+        "result, expected_count",
+        [
+            (
+                replace(
+                    _BASE_RUFF,
+                    duration_seconds=1.5,
+                    _stdout="src/main.py:10:5: E501 line too long",
+                ),
+                1,
+            ),
+            (_BASE_NONEXISTENT, 0),
+            (
+                replace(
+                    _BASE_RUFF, exit_code=-1, timed_out=True, duration_seconds=120.0
+                ),
+                0,
+            ),
+            (
+                replace(_BASE_RUFF, exit_code=0, success=True, duration_seconds=0.5),
+                0,
+            ),
+        ],
+        ids=["tool_with_issues", "tool_not_found", "timed_out", "exit_code_zero"],
+    )
+    async def test_discover_tool_outcomes(
+        self, fake_orchestrator, result, expected_count
+    ):
+        """Discover should only create work items for tools that reported issues."""
         config = {
             "enabled": True,
             "tools": [{"name": "ruff", "command": "ruff check ."}],
         }
         discovery = ExternalToolDiscovery(config)
 
-        mock_result = MockToolResult(
-            name="ruff",
-            command="ruff check .",
-            output_path=None,
-            stderr="",
-            exit_code=1,
-            success=False,
-            duration_seconds=1.5,
-            _stdout="src/main.py:10:5: E501 line too long\nsrc/utils.py:20:1: F401 unused import",
-        )
-
-        with patch.object(
-            discovery, "_process_tool_result", new_callable=AsyncMock
-        ) as mock_process:
-            mock_process.return_value = [
-                {
-                    "id": "test-id",
-                    "type": "refactor",
-                    "title": "Fix issues found by ruff",
-                    "priority": 3,
-                }
-            ]
-
-            # Patch the ToolOrchestrator
-            with patch(
-                "sugar.discovery.external_tool_discovery.ToolOrchestrator"
-            ) as MockOrchestrator:
-                mock_orch = MockOrchestrator.return_value
-                mock_orch.execute_all.return_value = [mock_result]
-
-                work_items = await discovery.discover()
-
-                assert len(work_items) == 1
-                mock_process.assert_called_once_with(mock_result)
-
-    @pytest.mark.asyncio
-    async def test_discover_skips_tool_not_found(self):
-        """Discover should skip tools that are not found."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
-        config = {
-            "enabled": True,
-            "tools": [{"name": "nonexistent", "command": "nonexistent_tool check"}],
-        }
-        discovery = ExternalToolDiscovery(config)
-
-        mock_result = MockToolResult(
-            name="nonexistent",
-            command="nonexistent_tool check",
-            output_path=None,
-            stderr="",
-            exit_code=127,
-            success=False,
-            tool_not_found=True,
-        )
-
-        with patch(
-            "sugar.discovery.external_tool_discovery.ToolOrchestrator"
-        ) as MockOrchestrator:
-            mock_orch = MockOrchestrator.return_value
-            mock_orch.execute_all.return_value = [mock_result]
-
-            work_items = await discovery.discover()
-
-            assert work_items == []
-
-    @pytest.mark.asyncio
-    async def test_discover_skips_timed_out_tools(self):
-        """Discover should skip tools that timed out."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
-        config = {
-            "enabled": True,
-            "tools": [{"name": "slow_tool", "command": "slow_tool check"}],
-        }
-        discovery = ExternalToolDiscovery(config)
-
-        mock_result = MockToolResult(
-            name="slow_tool",
-            command="slow_tool check",
-            output_path=None,
-            stderr="",
-            exit_code=-1,
-            success=False,
-            timed_out=True,
-            duration_seconds=120.0,
-        )
+        fake_orchestrator.next_results = [result]
 
-        with patch(
-            "sugar.discovery.external_tool_discovery.ToolOrchestrator"
-        ) as MockOrchestrator:
-            mock_orch = MockOrchestrator.return_value
-            mock_orch.execute_all.return_value = [mock_result]
-
-            work_items = await discovery.discover()
-
-            assert work_items == []
-
-    @pytest.mark.asyncio
-    async def test_discover_skips_exit_code_zero(self):
-        """Discover should not create work items for successful tools (exit code 0)."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
-        config = {
-            "enabled": True,
-            "tools": [{"name": "ruff", "command": "ruff check ."}],
-        }
-        discovery = ExternalToolDiscovery(config)
-
-        mock_result = MockToolResult(
-            name="ruff",
-            command="ruff check .",
-            output_path=None,
-            stderr="",
-            exit_code=0,
-            success=True,
-            duration_seconds=0.5,
-        )
-
-        with patch(
-            "sugar.discovery.external_tool_discovery.ToolOrchestrator"
-        ) as MockOrchestrator:
-            mock_orch = MockOrchestrator.return_value
-            mock_orch.execute_all.return_value = [mock_result]
-
-            work_items = await discovery.discover()
+        work_items = await discovery.discover()
 
-            assert work_items == []
+        assert len(work_items) == expected_count
 
 
 class TestWorkItemCreation:
     """Test work item creation from tool results."""
 
-    @pytest.mark.asyncio
-    async def test_parse_tool_output_creates_work_item(self):
-        """Parse should create work item with correct structure."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
-        config = {"enabled": True, "tools": []}
-        discovery = ExternalToolDiscovery(config)
+    pytestmark = ASYNC_MODULE_LOOP
 
-        mock_result = MockToolResult(
-            name="ruff",
-            command="ruff check .",
-            output_path=None,
-            stderr="",
-            exit_code=1,
-            success=False,
+    async def test_parse_tool_output_creates_work_item(self, discovery):
+        """Parse should create work item with correct structure."""
+        mock_result = replace(
+            _BASE_RUFF,
             duration_seconds=1.5,
             _stdout="src/main.py:10:5: E501 line too long",
         )
@@ -298,23 +290,22 @@ async def test_parse_tool_output_creates_work_item(self):
         assert item["context"]["tool_name"] == "ruff"
         assert item["context"]["exit_code"] == 1
 
-    @pytest.mark.asyncio
-    async def test_parse_tool_output_skips_duplicates(self):
-        """Parse should skip duplicate work items."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
+    async def test_parse_tool_output_reads_stdout_once(self, discovery):
+        """Parse should read the tool's output file only once."""
+        mock_result = replace(_BASE_RUFF, _stdout="x" * 600)
 
-        config = {"enabled": True, "tools": []}
-        discovery = ExternalToolDiscovery(config)
+        with patch.object(
+            MockToolResult, "stdout", new_callable=PropertyMock
+        ) as mock_stdout:
+            mock_stdout.return_value = mock_result._stdout
+            work_items = await discovery._parse_tool_output(mock_result)
 
-        mock_result = MockToolResult(
-            name="ruff",
-            command="ruff check .",
-            output_path=None,
-            stderr="",
-            exit_code=1,
-            success=False,
-            _stdout="same output",
-        )
+        assert mock_stdout.call_count == 1
+        assert work_items[0]["context"]["output_preview"] == "x" * 500 + "..."
+
+    async def test_parse_tool_output_skips_duplicates(self, discovery):
+        """Parse should skip duplicate work items."""
+        mock_result = replace(_BASE_RUFF, _stdout="same output")
 
         # First call should create work item
         work_items_1 = await discovery._parse_tool_output(mock_result)
@@ -324,11 +315,8 @@ async def test_parse_tool_output_skips_duplicates(self):
         work_items_2 = await discovery._parse_tool_output(mock_result)
         assert len(work_items_2) == 0
 
-    @pytest.mark.asyncio
     async def test_process_tool_result_limits_work_items(self):
         """Process should limit work items per tool."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
         config = {"enabled": True, "tools": [], "max_tasks_per_tool": 2}
         discovery = ExternalToolDiscovery(config)
 
@@ -340,15 +328,7 @@ async def test_process_tool_result_limits_work_items(self):
                 {"id": f"id-{i}", "title": f"Item {i}"} for i in range(10)
             ]
 
-            mock_result = MockToolResult(
-                name="ruff",
-                command="ruff check .",
-                output_path=None,
-                stderr="",
-                exit_code=1,
-                success=False,
-                _stdout="lots of output",
-            )
+            mock_result = replace(_BASE_RUFF, _stdout="lots of output")
 
             work_items = await discovery._process_tool_result(mock_result)
 
@@ -358,20 +338,11 @@ async def test_process_tool_result_limits_work_items(self):
 class TestDescriptionGeneration:
     """Test description generation for work items."""
 
-    def test_generate_description_includes_command(self):
+    def test_generate_description_includes_command(self, discovery):
         """Description should include the tool command."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
-        config = {"enabled": True, "tools": []}
-        discovery = ExternalToolDiscovery(config)
-
-        mock_result = MockToolResult(
-            name="ruff",
+        mock_result = replace(
+            _BASE_RUFF,
             command="ruff check . --format json",
-            output_path=None,
-            stderr="",
-            exit_code=1,
-            success=False,
             duration_seconds=1.5,
             _stdout="error output",
         )
@@ -382,22 +353,9 @@ def test_generate_description_includes_command(self):
         assert "Exit Code:** 1" in description
         assert "1.50s" in description
 
-    def test_generate_description_includes_output_preview(self):
+    def test_generate_description_includes_output_preview(self, discovery):
         """Description should include output preview."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
-        config = {"enabled": True, "tools": []}
-        discovery = ExternalToolDiscovery(config)
-
-        mock_result = MockToolResult(
-            name="ruff",
-            command="ruff check .",
-            output_path=None,
-            stderr="",
-            exit_code=1,
-            success=False,
-            _stdout="line 1\nline 2\nline 3",
-        )
+        mock_result = replace(_BASE_RUFF, _stdout="line 1\nline 2\nline 3")
 
         description = discovery._generate_description(mock_result)
 
@@ -408,13 +366,8 @@ def test_generate_description_includes_output_preview(self):
 class TestSugarAddCommandParsing:
     """Test parsing of sugar add commands from Claude output."""
 
-    def test_parse_sugar_add_basic_command(self):
+    def test_parse_sugar_add_basic_command(self, discovery):
         """Should parse basic sugar add command."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
-        config = {"enabled": True, "tools": []}
-        discovery = ExternalToolDiscovery(config)
-
         claude_output = 'sugar add "Fix linting errors in main.py"'
 
         work_items = discovery._parse_sugar_add_commands(claude_output, "ruff")
@@ -423,13 +376,8 @@ def test_parse_sugar_add_basic_command(self):
         assert work_items[0]["title"] == "Fix linting errors in main.py"
         assert work_items[0]["type"] == "refactor"
 
-    def test_parse_sugar_add_with_type_and_priority(self):
+    def test_parse_sugar_add_with_type_and_priority(self, discovery):
         """Should parse sugar add command with type and priority."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
-        config = {"enabled": True, "tools": []}
-        discovery = ExternalToolDiscovery(config)
-
         claude_output = 'sugar add "Fix type errors" --type=bugfix --priority=4'
 
         work_items = discovery._parse_sugar_add_commands(claude_output, "mypy")
@@ -439,13 +387,8 @@ def test_parse_sugar_add_with_type_and_priority(self):
         assert work_items[0]["type"] == "bugfix"
         assert work_items[0]["priority"] == 4
 
-    def test_parse_multiple_sugar_add_commands(self):
+    def test_parse_multiple_sugar_add_commands(self, discovery):
         """Should parse multiple sugar add commands."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
-        config = {"enabled": True, "tools": []}
-        discovery = ExternalToolDiscovery(config)
-
         claude_output = """
         Based on the ruff output, I recommend:
         sugar add "Fix unused imports in utils.py" --type=refactor --priority=2
@@ -458,15 +401,22 @@ def test_parse_multiple_sugar_add_commands(self):
         assert work_items[0]["title"] == "Fix unused imports in utils.py"
         assert work_items[1]["title"] == "Fix line length issues in main.py"
 
+    def test_sugar_add_regex_is_precompiled(self):
+        """The sugar add pattern should be compiled once at import time."""
+        from sugar.discovery import external_tool_discovery
+
+        pattern = external_tool_discovery._SUGAR_ADD_RE
+        assert isinstance(pattern, re.Pattern)
+        assert pattern.flags & re.IGNORECASE
+
 
 class TestHealthCheck:
     """Test health check functionality."""
 
-    @pytest.mark.asyncio
+    pytestmark = ASYNC_MODULE_LOOP
+
     async def test_health_check_returns_status(self):
         """Health check should return component status."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
         config = {
             "enabled": True,
             "tools": [{"name": "ruff", "command": "ruff check ."}],
@@ -483,11 +433,8 @@ async def test_health_check_returns_status(self):
         assert health["max_tasks_per_tool"] == 25
         assert health["default_timeout"] == 60
 
-    @pytest.mark.asyncio
     async def test_health_check_when_disabled(self):
         """Health check should indicate disabled state."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
         config = {"enabled": False}
         discovery = ExternalToolDiscovery(config)
 
@@ -500,96 +447,21 @@ async def test_health_check_when_disabled(self):
 class TestSugarLoopIntegration:
     """Test integration with SugarLoop."""
 
-    def test_external_tool_discovery_added_to_modules(self, tmp_path):
-        """ExternalToolDiscovery should be added to discovery modules when enabled."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
-        # Create a minimal config file
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(
-            """
-sugar:
-  dry_run: true
-  discovery:
-    error_logs:
-      enabled: false
-    github:
-      enabled: false
-    code_quality:
-      enabled: false
-    test_coverage:
-      enabled: false
-    external_tools:
-      enabled: true
-      tools:
-        - name: ruff
-          command: ruff check .
-  storage:
-    database: ":memory:"
-  claude:
-    model: claude-3-5-sonnet-20241022
-"""
-        )
-
-        # Patch dependencies to avoid actual initialization
-        with patch("sugar.core.loop.WorkQueue"):
-            with patch("sugar.core.loop.ClaudeWrapper"):
-                with patch("sugar.core.loop.FeedbackProcessor"):
-                    with patch("sugar.core.loop.AdaptiveScheduler"):
-                        with patch("sugar.core.loop.GitOperations"):
-                            with patch("sugar.core.loop.WorkflowOrchestrator"):
-                                from sugar.core.loop import SugarLoop
-
-                                loop = SugarLoop(str(config_file))
-
-                                # Check that ExternalToolDiscovery was added
-                                external_tool_modules = [
-                                    m
-                                    for m in loop.discovery_modules
-                                    if isinstance(m, ExternalToolDiscovery)
-                                ]
-                                assert len(external_tool_modules) == 1
-
-    def test_external_tool_discovery_not_added_when_disabled(self, tmp_path):
-        """ExternalToolDiscovery should not be added when disabled."""
-        from sugar.discovery.external_tool_discovery import ExternalToolDiscovery
-
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(
-            """
-sugar:
-  dry_run: true
-  discovery:
-    error_logs:
-      enabled: false
-    github:
-      enabled: false
-    code_quality:
-      enabled: false
-    test_coverage:
-      enabled: false
-    external_tools:
-      enabled: false
-  storage:
-    database: ":memory:"
-  claude:
-    model: claude-3-5-sonnet-20241022
-"""
-        )
-
-        with patch("sugar.core.loop.WorkQueue"):
-            with patch("sugar.core.loop.ClaudeWrapper"):
-                with patch("sugar.core.loop.FeedbackProcessor"):
-                    with patch("sugar.core.loop.AdaptiveScheduler"):
-                        with patch("sugar.core.loop.GitOperations"):
-                            with patch("sugar.core.loop.WorkflowOrchestrator"):
-                                from sugar.core.loop import SugarLoop
-
-                                loop = SugarLoop(str(config_file))
-
-                                external_tool_modules = [
-                                    m
-                                    for m in loop.discovery_modules
-                                    if isinstance(m, ExternalToolDiscovery)
-                                ]
-                                assert len(external_tool_modules) == 0
+    @pytest.mark.parametrize(
+        "enabled, expected_count",
+        [(True, 1), (False, 0)],
+        ids=["enabled", "disabled"],
+    )
+    def test_external_tool_discovery_in_modules(
+        self, config_paths, sugar_loop_patches, enabled, expected_count
+    ):
+        """ExternalToolDiscovery should only be in discovery modules when enabled."""
+        config_file = config_paths["enabled" if enabled else "disabled"]
+
+        # Dependencies are patched by sugar_loop_patches
+        loop = sugar_loop_patches(str(config_file))
+
+        external_tool_modules = [
+            m for m in loop.discovery_modules if isinstance(m, ExternalToolDiscovery)
+        ]
+        assert len(external_tool_modules) == expected_count
@@ -0,0 +1,40 @@
+"""
+Pytest fixtures for ToolOrchestrator tests.
+"""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+
+def _make_process(returncode: int = 0, stderr: bytes = b"") -> Mock:
+    """Fake subprocess.Popen instance whose communicate() returns immediately"""
+    process = Mock(returncode=returncode)
+    process.communicate.return_value = (None, stderr)
+    return process
+
+
+@pytest.fixture
+def make_process():
+    """Factory for fake Popen processes with a given exit code and stderr"""
+    return _make_process
+
+
+@pytest.fixture
+def mock_popen():
+    """Patch subprocess.Popen with a process that exits 0 without stderr"""
+    with patch("subprocess.Popen") as mock_popen:
+        mock_popen.return_value = _make_process()
+        yield mock_popen
+
+
+@pytest.fixture(scope="session")
+def temp_dir(tmp_path_factory) -> Path:
+    """One working directory shared by every orchestrator test.
+
+    Overrides the per-test temp_dir from tests/conftest.py. These tests only
+    pass it as working_dir and never write into it; a test that needs a
+    directory of its own should use tmp_path instead.
+    """
+    return tmp_path_factory.mktemp("orchestrator")
@@ -6,27 +6,44 @@
 
 import signal
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
 from sugar.discovery.external_tool_config import ExternalToolConfig
 from sugar.discovery.orchestrator import ToolOrchestrator
 
+# The orchestrator only reads its tool configs, so one instance serves every test
+ECHO_TOOL = ExternalToolConfig(name="echo", command="echo hello")
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _signal_guard():
+    """Restore the SIGINT/SIGTERM handlers every ToolOrchestrator replaces"""
+    original_sigint = signal.getsignal(signal.SIGINT)
+    original_sigterm = signal.getsignal(signal.SIGTERM)
+    yield
+    signal.signal(signal.SIGINT, original_sigint)
+    signal.signal(signal.SIGTERM, original_sigterm)
+
+
+@pytest.fixture
+def orchestrator(temp_dir: Path):
+    """Single-tool orchestrator whose temp dir is always cleaned up afterwards"""
+    orchestrator = ToolOrchestrator([ECHO_TOOL], working_dir=temp_dir)
+    yield orchestrator
+    orchestrator.cleanup()
+
 
 class TestToolOrchestratorCleanup:
     """Tests for cleanup functionality"""
 
-    def test_cleanup_removes_temp_dir(self, temp_dir: Path):
+    def test_cleanup_removes_temp_dir(self, orchestrator: ToolOrchestrator, mock_popen):
         """Test that cleanup removes the temp directory"""
-        tool = ExternalToolConfig(name="echo", command="echo hello")
-        orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
-
         # Execute a tool to create the temp dir
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(stderr="", returncode=0)
-            orchestrator.execute_tool(tool)
+        orchestrator.execute_tool(ECHO_TOOL)
 
         # Temp dir should exist
         assert orchestrator.temp_dir is not None
@@ -40,15 +57,10 @@ def test_cleanup_removes_temp_dir(self, temp_dir: Path):
         assert orchestrator.temp_dir is None
         assert not temp_dir_path.exists()
 
-    def test_cleanup_is_idempotent(self, temp_dir: Path):
+    def test_cleanup_is_idempotent(self, orchestrator: ToolOrchestrator, mock_popen):
         """Test that cleanup can be called multiple times safely"""
-        tool = ExternalToolConfig(name="echo", command="echo hello")
-        orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
-
         # Execute a tool to create the temp dir
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(stderr="", returncode=0)
-            orchestrator.execute_tool(tool)
+        orchestrator.execute_tool(ECHO_TOOL)
 
         # Multiple cleanup calls should not raise
         orchestrator.cleanup()
@@ -57,6 +69,19 @@ def test_cleanup_is_idempotent(self, temp_dir: Path):
 
         assert orchestrator.temp_dir is None
 
+    def test_cleanup_without_wait_removes_in_background(
+        self, orchestrator: ToolOrchestrator
+    ):
+        """Test that cleanup(wait=False) resets temp_dir and removes it off-thread"""
+        temp_dir_path = orchestrator._ensure_temp_dir()
+
+        orchestrator.cleanup(wait=False)
+
+        # The attribute is reset synchronously; the rmtree runs in the background
+        assert orchestrator.temp_dir is None
+        orchestrator._cleanup_future.result(timeout=5)
+        assert not temp_dir_path.exists()
+
     def test_cleanup_on_no_temp_dir(self, temp_dir: Path):
         """Test that cleanup handles case where no temp dir was created"""
         orchestrator = ToolOrchestrator([], working_dir=temp_dir)
@@ -68,11 +93,8 @@ def test_cleanup_on_no_temp_dir(self, temp_dir: Path):
         orchestrator.cleanup()
         assert orchestrator.temp_dir is None
 
-    def test_ensure_temp_dir_creates_dir(self, temp_dir: Path):
+    def test_ensure_temp_dir_creates_dir(self, orchestrator: ToolOrchestrator):
         """Test that _ensure_temp_dir creates the directory"""
-        tool = ExternalToolConfig(name="echo", command="echo hello")
-        orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
-
         assert orchestrator.temp_dir is None
 
         result_dir = orchestrator._ensure_temp_dir()
@@ -82,35 +104,43 @@ def test_ensure_temp_dir_creates_dir(self, temp_dir: Path):
         assert result_dir.exists()
         assert "discover_" in result_dir.name
 
-        # Cleanup
-        orchestrator.cleanup()
-
-    def test_ensure_temp_dir_reuses_existing(self, temp_dir: Path):
+    def test_ensure_temp_dir_reuses_existing(self, orchestrator: ToolOrchestrator):
         """Test that _ensure_temp_dir reuses existing directory"""
-        tool = ExternalToolConfig(name="echo", command="echo hello")
-        orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
-
-        # Create temp dir
-        first_dir = orchestrator._ensure_temp_dir()
+        with patch(
+            "sugar.discovery.orchestrator.tempfile.mkdtemp", wraps=tempfile.mkdtemp
+        ) as mock_mkdtemp:
+            # Create temp dir
+            first_dir = orchestrator._ensure_temp_dir()
 
-        # Call again
-        second_dir = orchestrator._ensure_temp_dir()
+            # Call again
+            second_dir = orchestrator._ensure_temp_dir()
 
-        # Should be the same directory
+        # Should be the same directory, created only once
         assert first_dir == second_dir
-
-        # Cleanup
-        orchestrator.cleanup()
+        assert mock_mkdtemp.call_count == 1
+
+    def test_ensure_temp_dir_concurrent_calls_share_one_dir(
+        self, orchestrator: ToolOrchestrator
+    ):
+        """Test that racing worker threads create the temp dir only once"""
+        with patch(
+            "sugar.discovery.orchestrator.tempfile.mkdtemp", wraps=tempfile.mkdtemp
+        ) as mock_mkdtemp:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                dirs = list(
+                    pool.map(lambda _: orchestrator._ensure_temp_dir(), range(8))
+                )
+
+        assert len(set(dirs)) == 1
+        assert mock_mkdtemp.call_count == 1
 
     def test_signal_handlers_registered(self, temp_dir: Path):
         """Test that signal handlers are registered on init"""
-        tool = ExternalToolConfig(name="echo", command="echo hello")
-
         # Capture original handlers
         original_sigint = signal.getsignal(signal.SIGINT)
         original_sigterm = signal.getsignal(signal.SIGTERM)
 
-        orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
+        orchestrator = ToolOrchestrator([ECHO_TOOL], working_dir=temp_dir)
 
         # New handlers should be the orchestrator's handler
         current_sigint = signal.getsignal(signal.SIGINT)
@@ -123,35 +153,21 @@ def test_signal_handlers_registered(self, temp_dir: Path):
         assert orchestrator._original_sigint_handler == original_sigint
         assert orchestrator._original_sigterm_handler == original_sigterm
 
-        # Restore handlers (cleanup would normally do this on signal)
-        signal.signal(signal.SIGINT, original_sigint)
-        signal.signal(signal.SIGTERM, original_sigterm)
-
-    def test_decode_stderr_with_string(self, temp_dir: Path):
-        """Test _decode_stderr with string input"""
-        tool = ExternalToolConfig(name="echo", command="echo hello")
-        orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
-
-        result = orchestrator._decode_stderr("error message")
-        assert result == "error message"
-
-    def test_decode_stderr_with_bytes(self, temp_dir: Path):
-        """Test _decode_stderr with bytes input"""
-        tool = ExternalToolConfig(name="echo", command="echo hello")
-        orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
-
-        result = orchestrator._decode_stderr(b"error message")
-        assert result == "error message"
-
-    def test_decode_stderr_with_none(self, temp_dir: Path):
-        """Test _decode_stderr with None input"""
-        tool = ExternalToolConfig(name="echo", command="echo hello")
-        orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
-
-        result = orchestrator._decode_stderr(None)
-        assert result == ""
-
-    def test_output_files_cleaned_up(self, temp_dir: Path):
+    @pytest.mark.parametrize(
+        "stderr, expected",
+        [
+            ("error message", "error message"),
+            (b"error message", "error message"),
+            (None, ""),
+        ],
+        ids=["string", "bytes", "none"],
+    )
+    def test_decode_stderr(self, stderr, expected):
+        """Test _decode_stderr with string, bytes and None input"""
+        # Static method: no orchestrator (and no signal handlers) needed
+        assert ToolOrchestrator._decode_stderr(stderr) == expected
+
+    def test_output_files_cleaned_up(self, temp_dir: Path, mock_popen):
         """Test that output files are cleaned up with temp dir"""
         tools = [
             ExternalToolConfig(name="tool1", command="echo one"),
@@ -159,20 +175,17 @@ def test_output_files_cleaned_up(self, temp_dir: Path):
         ]
         orchestrator = ToolOrchestrator(tools, working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                Mock(stderr="", returncode=0),
-                Mock(stderr="", returncode=0),
-            ]
-            results = orchestrator.execute_all()
+        results = orchestrator.execute_all()
 
-        # Collect output paths
+        # Collect output paths; they all live under the orchestrator's temp dir
+        temp_dir_path = orchestrator.temp_dir
         output_paths = [r.output_path for r in results]
         assert all(p is not None for p in output_paths)
+        assert all(p.parent == temp_dir_path for p in output_paths)
         assert all(p.exists() for p in output_paths)
 
         # Cleanup
         orchestrator.cleanup()
 
-        # All output files should be gone
-        assert all(not p.exists() for p in output_paths)
+        # Removing the temp dir removes every output file in it
+        assert not temp_dir_path.exists()
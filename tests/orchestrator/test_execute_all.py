@@ -1,16 +1,19 @@
 """
 Tests for ToolOrchestrator.execute_all method.
 
-Tests the execution of multiple external tools in sequence.
+Tests the execution of multiple external tools, sequentially or in parallel.
 """
 
+import os
+import threading
+import time
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
-from sugar.discovery.external_tool_config import ExternalToolConfig
-from sugar.discovery.orchestrator import ToolOrchestrator
+from sugar.discovery.external_tool_config import ExternalToolConfig, expand_env_vars
+from sugar.discovery.orchestrator import PATH_INDEX_MIN_TOOLS, ToolOrchestrator
 
 
 class TestToolOrchestratorExecuteAll:
@@ -21,8 +24,11 @@ def test_execute_all_empty_tools(self, temp_dir: Path):
         orchestrator = ToolOrchestrator([], working_dir=temp_dir)
         results = orchestrator.execute_all()
         assert results == []
+        # No lazy state is created for a no-op run
+        assert orchestrator.temp_dir is None
+        assert orchestrator._pool is None
 
-    def test_execute_all_multiple_tools(self, temp_dir: Path):
+    def test_execute_all_multiple_tools(self, temp_dir: Path, mock_popen):
         """Test execute_all with multiple tools"""
         tools = [
             ExternalToolConfig(name="tool1", command="echo one"),
@@ -31,13 +37,7 @@ def test_execute_all_multiple_tools(self, temp_dir: Path):
         ]
         orchestrator = ToolOrchestrator(tools, working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                Mock(stderr="", returncode=0),
-                Mock(stderr="", returncode=0),
-                Mock(stderr="", returncode=0),
-            ]
-            results = orchestrator.execute_all()
+        results = orchestrator.execute_all()
 
         assert len(results) == 3
         assert results[0].name == "tool1"
@@ -51,7 +51,7 @@ def test_execute_all_multiple_tools(self, temp_dir: Path):
         # Cleanup
         orchestrator.cleanup()
 
-    def test_execute_all_continues_after_failure(self, temp_dir: Path):
+    def test_execute_all_continues_after_failure(self, temp_dir: Path, mock_popen):
         """Test that execute_all continues after a tool failure"""
         tools = [
             ExternalToolConfig(name="good1", command="echo good1"),
@@ -60,20 +60,13 @@ def test_execute_all_continues_after_failure(self, temp_dir: Path):
         ]
         orchestrator = ToolOrchestrator(tools, working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
-            with patch("shutil.which") as mock_which:
-                # First tool exists, second doesn't, third exists
-                mock_which.side_effect = [
-                    "/usr/bin/echo",  # good1 exists
-                    None,  # bad doesn't exist
-                    "/usr/bin/echo",  # good2 exists
-                ]
-                mock_run.side_effect = [
-                    Mock(stderr="", returncode=0),
-                    # bad_tool never reaches subprocess
-                    Mock(stderr="", returncode=0),
-                ]
-                results = orchestrator.execute_all()
+        with patch("shutil.which") as mock_which:
+            # Tools run concurrently, so answer by executable, not call order:
+            # echo exists, bad_tool doesn't (and never reaches subprocess)
+            mock_which.side_effect = lambda exe: (
+                "/usr/bin/echo" if exe == "echo" else None
+            )
+            results = orchestrator.execute_all()
 
         assert len(results) == 3
         assert results[0].success is True
@@ -84,7 +77,9 @@ def test_execute_all_continues_after_failure(self, temp_dir: Path):
         # Cleanup
         orchestrator.cleanup()
 
-    def test_execute_all_with_mixed_exit_codes(self, temp_dir: Path):
+    def test_execute_all_with_mixed_exit_codes(
+        self, temp_dir: Path, mock_popen, make_process
+    ):
         """Test execute_all with tools having different exit codes"""
         tools = [
             ExternalToolConfig(name="linter1", command="linter1 ."),
@@ -92,13 +87,15 @@ def test_execute_all_with_mixed_exit_codes(self, temp_dir: Path):
         ]
         orchestrator = ToolOrchestrator(tools, working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
-            with patch("shutil.which", return_value="/usr/bin/linter"):
-                mock_run.side_effect = [
-                    Mock(stderr="", returncode=0),
-                    Mock(stderr="", returncode=1),
-                ]
-                results = orchestrator.execute_all()
+        exit_codes = {"linter1_output.txt": 0, "linter2_output.txt": 1}
+
+        with patch("shutil.which", return_value="/usr/bin/linter"):
+            # Key responses by each tool's output file since tools may run in
+            # any order (and the command may be a string or an argv list)
+            mock_popen.side_effect = lambda command, **kwargs: make_process(
+                returncode=exit_codes[Path(kwargs["stdout"].name).name]
+            )
+            results = orchestrator.execute_all()
 
         # Both should be marked as success (tool ran, captured output)
         assert results[0].success is True
@@ -109,24 +106,22 @@ def test_execute_all_with_mixed_exit_codes(self, temp_dir: Path):
         # Cleanup
         orchestrator.cleanup()
 
-    def test_execute_all_custom_timeout(self, temp_dir: Path):
+    def test_execute_all_custom_timeout(self, temp_dir: Path, mock_popen):
         """Test execute_all with custom timeout per tool"""
         tools = [ExternalToolConfig(name="tool", command="echo test")]
         orchestrator = ToolOrchestrator(
             tools, working_dir=temp_dir, default_timeout=300
         )
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(stderr="", returncode=0)
-            orchestrator.execute_all(timeout_per_tool=60)
+        orchestrator.execute_all(timeout_per_tool=60)
 
-        call_kwargs = mock_run.call_args[1]
+        call_kwargs = mock_popen.return_value.communicate.call_args[1]
         assert call_kwargs["timeout"] == 60
 
         # Cleanup
         orchestrator.cleanup()
 
-    def test_execute_all_shares_temp_dir(self, temp_dir: Path):
+    def test_execute_all_shares_temp_dir(self, temp_dir: Path, mock_popen):
         """Test that all tools share the same temp directory"""
         tools = [
             ExternalToolConfig(name="tool1", command="echo one"),
@@ -134,12 +129,7 @@ def test_execute_all_shares_temp_dir(self, temp_dir: Path):
         ]
         orchestrator = ToolOrchestrator(tools, working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = [
-                Mock(stderr="", returncode=0),
-                Mock(stderr="", returncode=0),
-            ]
-            results = orchestrator.execute_all()
+        results = orchestrator.execute_all()
 
         # All output files should be in the same temp directory
         assert results[0].output_path.parent == results[1].output_path.parent
@@ -147,3 +137,194 @@ def test_execute_all_shares_temp_dir(self, temp_dir: Path):
 
         # Cleanup
         orchestrator.cleanup()
+
+    def test_execute_all_runs_sequentially_with_one_worker(
+        self, temp_dir: Path, mock_popen
+    ):
+        """Test that max_workers=1 runs tools in order without a thread pool"""
+        tools = [
+            ExternalToolConfig(name="tool1", command="echo one"),
+            ExternalToolConfig(name="tool2", command="echo two"),
+        ]
+        orchestrator = ToolOrchestrator(tools, working_dir=temp_dir, max_workers=1)
+
+        results = orchestrator.execute_all()
+
+        assert [r.name for r in results] == ["tool1", "tool2"]
+        assert [
+            Path(c.kwargs["stdout"].name).name for c in mock_popen.call_args_list
+        ] == ["tool1_output.txt", "tool2_output.txt"]
+        assert orchestrator._pool is None
+
+        # Cleanup
+        orchestrator.cleanup()
+
+    def test_execute_all_reuses_pool_until_cleanup(self, temp_dir: Path, mock_popen):
+        """Test that the worker pool persists across calls until cleanup"""
+        tools = [
+            ExternalToolConfig(name="tool1", command="echo one"),
+            ExternalToolConfig(name="tool2", command="echo two"),
+        ]
+        orchestrator = ToolOrchestrator(tools, working_dir=temp_dir, max_workers=2)
+
+        orchestrator.execute_all()
+        pool = orchestrator._pool
+        results = orchestrator.execute_all()
+
+        assert pool is not None
+        assert orchestrator._pool is pool
+        assert [r.name for r in results] == ["tool1", "tool2"]
+
+        orchestrator.cleanup()
+
+        assert orchestrator._pool is None
+
+    def test_execute_all_shares_env_snapshot(self, temp_dir: Path, mock_popen):
+        """Test that every tool in a run gets the same environment snapshot"""
+        tools = [
+            ExternalToolConfig(name="tool1", command="echo one"),
+            ExternalToolConfig(name="tool2", command="echo two"),
+        ]
+        orchestrator = ToolOrchestrator(tools, working_dir=temp_dir)
+
+        with patch.dict(os.environ, {"MY_FLAG": "--verbose"}):
+            orchestrator.execute_all()
+
+        envs = [c.kwargs["env"] for c in mock_popen.call_args_list]
+        assert envs[0] is envs[1]
+        assert envs[0]["MY_FLAG"] == "--verbose"
+
+        # Cleanup
+        orchestrator.cleanup()
+
+    def test_execute_all_caches_expanded_commands(self, temp_dir: Path, mock_popen):
+        """Test that commands are expanded once per environment across runs"""
+        tools = [
+            ExternalToolConfig(name="tool1", command="echo $MY_FLAG"),
+            ExternalToolConfig(name="tool2", command="echo two"),
+        ]
+        orchestrator = ToolOrchestrator(tools, working_dir=temp_dir)
+
+        with patch.dict(os.environ, {"MY_FLAG": "--verbose"}):
+            with patch(
+                "sugar.discovery.orchestrator.expand_env_vars",
+                wraps=expand_env_vars,
+            ) as mock_expand:
+                orchestrator.execute_all()
+                results = orchestrator.execute_all()
+                assert mock_expand.call_count == 2
+                assert results[0].command == "echo --verbose"
+
+                # A changed environment is a new fingerprint, so it re-expands
+                os.environ["MY_FLAG"] = "--quiet"
+                results = orchestrator.execute_all()
+                assert mock_expand.call_count == 4
+                assert results[0].command == "echo --quiet"
+
+        # Cleanup
+        orchestrator.cleanup()
+
+    def test_execute_all_indexes_path_for_many_tools(
+        self, temp_dir: Path, tmp_path: Path, mock_popen
+    ):
+        """Test that large runs resolve executables from one PATH listing"""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        (bin_dir / "mytool").touch()
+        tools = [
+            ExternalToolConfig(name=f"tool{i}", command=f"mytool {i}")
+            for i in range(PATH_INDEX_MIN_TOOLS)
+        ]
+        orchestrator = ToolOrchestrator(tools, working_dir=temp_dir)
+
+        with patch.dict(os.environ, {"PATH": str(bin_dir)}):
+            with patch("shutil.which", return_value=None) as mock_which:
+                results = orchestrator.execute_all()
+
+        assert not any(r.tool_not_found for r in results)
+        mock_which.assert_not_called()
+        # The index only lives for the duration of the run
+        assert orchestrator._path_index is None
+
+        # Cleanup
+        orchestrator.cleanup()
+
+    def test_build_path_index_skips_missing_dirs(self, tmp_path: Path):
+        """Test that the PATH index lists existing directories and skips the rest"""
+        (tmp_path / "mytool").touch()
+        path = os.pathsep.join([str(tmp_path / "missing"), str(tmp_path)])
+
+        index = ToolOrchestrator._build_path_index({"PATH": path})
+
+        assert index == frozenset({"mytool"})
+
+    @pytest.mark.skipif(os.name != "posix", reason="uses POSIX sleep")
+    def test_execute_all_reaps_stragglers(self, temp_dir: Path):
+        """Test that a slow tool is killed once the rest of the run is done"""
+        tools = [
+            ExternalToolConfig(name="fast", command="sleep 0"),
+            ExternalToolConfig(name="slow", command="sleep 30"),
+        ]
+        orchestrator = ToolOrchestrator(tools, working_dir=temp_dir)
+
+        start = time.monotonic()
+        results = orchestrator.execute_all(straggler_timeout=0.2, straggler_limit=1)
+        elapsed = time.monotonic() - start
+
+        assert [r.name for r in results] == ["fast", "slow"]
+        assert results[0].success is True
+        assert results[1].timed_out is True
+        assert "0.2 seconds" in results[1].error_message
+        assert elapsed < 10
+        # Straggler bookkeeping does not leak into the next run
+        assert orchestrator._stragglers == {}
+        assert orchestrator._processes == {}
+
+        # Cleanup
+        orchestrator.cleanup()
+
+    def test_execute_all_without_straggler_limit_waits_for_all(
+        self, temp_dir: Path, mock_popen
+    ):
+        """Test that straggler_limit=0 never reaps a tool"""
+        tools = [
+            ExternalToolConfig(name="tool1", command="echo one"),
+            ExternalToolConfig(name="tool2", command="echo two"),
+        ]
+        orchestrator = ToolOrchestrator(tools, working_dir=temp_dir)
+
+        results = orchestrator.execute_all(straggler_timeout=0)
+
+        assert all(r.success for r in results)
+        assert not any(r.timed_out for r in results)
+
+        # Cleanup
+        orchestrator.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_execute_all_async_runs_off_event_loop(
+        self, temp_dir: Path, mock_popen
+    ):
+        """Test that execute_all_async runs the tools on a worker thread"""
+        tools = [
+            ExternalToolConfig(name="tool1", command="echo one"),
+            ExternalToolConfig(name="tool2", command="echo two"),
+        ]
+        orchestrator = ToolOrchestrator(tools, working_dir=temp_dir)
+        run_threads = []
+        execute_all = orchestrator.execute_all
+
+        def record_thread(*args):
+            run_threads.append(threading.get_ident())
+            return execute_all(*args)
+
+        with patch.object(orchestrator, "execute_all", side_effect=record_thread):
+            results = await orchestrator.execute_all_async(timeout_per_tool=30)
+
+        assert [r.name for r in results] == ["tool1", "tool2"]
+        assert all(r.success for r in results)
+        assert run_threads and run_threads[0] != threading.get_ident()
+        assert mock_popen.return_value.communicate.call_args[1]["timeout"] == 30
+
+        # Cleanup
+        orchestrator.cleanup()
@@ -4,31 +4,28 @@
 Tests the execution of individual external tools via subprocess.
 """
 
+import os
+import shlex
+import signal
 import subprocess
 from pathlib import Path
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import patch
 
 import pytest
 
 from sugar.discovery.external_tool_config import ExternalToolConfig
-from sugar.discovery.orchestrator import ToolOrchestrator
+from sugar.discovery.orchestrator import ToolOrchestrator, _split_command
 
 
 class TestToolOrchestratorExecuteTool:
     """Tests for execute_tool method"""
 
-    def test_execute_tool_success(self, temp_dir: Path):
+    def test_execute_tool_success(self, temp_dir: Path, mock_popen):
         """Test successful tool execution"""
         tool = ExternalToolConfig(name="echo", command="echo hello")
         orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
-            # Mock the subprocess to return successfully
-            mock_run.return_value = Mock(
-                stderr="",
-                returncode=0,
-            )
-            result = orchestrator.execute_tool(tool)
+        result = orchestrator.execute_tool(tool)
 
         assert result.name == "echo"
         assert result.stderr == ""
@@ -43,17 +40,14 @@ def test_execute_tool_success(self, temp_dir: Path):
         # Cleanup
         orchestrator.cleanup()
 
-    def test_execute_tool_with_findings(self, temp_dir: Path):
+    def test_execute_tool_with_findings(self, temp_dir: Path, mock_popen, make_process):
         """Test tool execution with non-zero exit (findings)"""
         tool = ExternalToolConfig(name="eslint", command="npx eslint .")
         orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(
-                stderr="",
-                returncode=1,  # Linters exit 1 when they find issues
-            )
-            result = orchestrator.execute_tool(tool)
+        # Linters exit 1 when they find issues
+        mock_popen.return_value = make_process(returncode=1)
+        result = orchestrator.execute_tool(tool)
 
         # Success should be True because the tool ran successfully
         # (non-zero exit just means issues were found)
@@ -64,19 +58,44 @@ def test_execute_tool_with_findings(self, temp_dir: Path):
         # Cleanup
         orchestrator.cleanup()
 
-    def test_execute_tool_timeout(self, temp_dir: Path):
+    def test_execute_tool_decodes_stderr_bytes(
+        self, temp_dir: Path, mock_popen, make_process
+    ):
+        """Test that raw stderr bytes are decoded once, replacing invalid UTF-8"""
+        tool = ExternalToolConfig(name="echo", command="echo hello")
+        orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
+
+        mock_popen.return_value = make_process(stderr=b"warning: caf\xc3\xa9 \xff\n")
+        result = orchestrator.execute_tool(tool)
+
+        assert result.stderr == "warning: caf\u00e9 \ufffd\n"
+        # stderr is piped as bytes; there is no text-mode decoding per read
+        assert mock_popen.call_args.kwargs["stderr"] == subprocess.PIPE
+        assert not mock_popen.call_args.kwargs.get("text", False)
+
+        # Cleanup
+        orchestrator.cleanup()
+
+    def test_execute_tool_timeout(self, temp_dir: Path, mock_popen):
         """Test tool execution timeout"""
         tool = ExternalToolConfig(name="slow", command="sleep 100")
         orchestrator = ToolOrchestrator([tool], working_dir=temp_dir, default_timeout=1)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired(cmd="sleep 100", timeout=1)
+        process = mock_popen.return_value
+        process.pid = 12345
+        process.communicate.side_effect = [
+            subprocess.TimeoutExpired(cmd="sleep 100", timeout=1),
+            (None, b""),
+        ]
+        with patch("sugar.discovery.orchestrator.os.killpg") as mock_killpg:
             result = orchestrator.execute_tool(tool)
 
         assert result.success is False
         assert result.timed_out is True
         assert result.exit_code == -1
         assert "timed out" in result.error_message
+        # The whole process group is killed, not just the shell
+        mock_killpg.assert_called_once_with(12345, signal.SIGKILL)
 
         # Cleanup
         orchestrator.cleanup()
@@ -101,14 +120,30 @@ def test_execute_tool_not_found(self, temp_dir: Path):
         # Cleanup
         orchestrator.cleanup()
 
+    def test_execute_tool_caches_which_lookup(self, temp_dir: Path, mock_popen):
+        """Test that PATH is searched once per executable until cleanup"""
+        tool = ExternalToolConfig(name="test", command="test cmd")
+        orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
+
+        with patch("shutil.which", return_value="/usr/bin/test") as mock_which:
+            orchestrator.execute_tool(tool)
+            orchestrator.execute_tool(tool)
+            assert mock_which.call_count == 1
+
+            orchestrator.cleanup()
+            orchestrator.execute_tool(tool)
+            assert mock_which.call_count == 2
+
+        # Cleanup
+        orchestrator.cleanup()
+
     def test_execute_tool_os_error(self, temp_dir: Path):
         """Test tool execution with OS error"""
         tool = ExternalToolConfig(name="test", command="test cmd")
         orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
+        with patch("subprocess.Popen", side_effect=OSError("Permission denied")):
             with patch("shutil.which", return_value="/usr/bin/test"):
-                mock_run.side_effect = OSError("Permission denied")
                 result = orchestrator.execute_tool(tool)
 
         assert result.success is False
@@ -122,9 +157,8 @@ def test_execute_tool_unexpected_error(self, temp_dir: Path):
         tool = ExternalToolConfig(name="test", command="test cmd")
         orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
+        with patch("subprocess.Popen", side_effect=RuntimeError("Unexpected!")):
             with patch("shutil.which", return_value="/usr/bin/test"):
-                mock_run.side_effect = RuntimeError("Unexpected!")
                 result = orchestrator.execute_tool(tool)
 
         assert result.success is False
@@ -133,58 +167,104 @@ def test_execute_tool_unexpected_error(self, temp_dir: Path):
         # Cleanup
         orchestrator.cleanup()
 
-    def test_execute_tool_custom_timeout(self, temp_dir: Path):
+    def test_execute_tool_custom_timeout(self, temp_dir: Path, mock_popen):
         """Test tool execution with custom timeout override"""
         tool = ExternalToolConfig(name="echo", command="echo hello")
         orchestrator = ToolOrchestrator(
             [tool], working_dir=temp_dir, default_timeout=300
         )
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(stderr="", returncode=0)
-            orchestrator.execute_tool(tool, timeout=60)
+        orchestrator.execute_tool(tool, timeout=60)
 
-        # Verify subprocess was called with the overridden timeout
-        call_kwargs = mock_run.call_args[1]
+        # Verify the process was waited on with the overridden timeout
+        call_kwargs = mock_popen.return_value.communicate.call_args[1]
         assert call_kwargs["timeout"] == 60
 
         # Cleanup
         orchestrator.cleanup()
 
-    def test_execute_tool_uses_shell(self, temp_dir: Path):
-        """Test that tool execution uses shell mode"""
-        tool = ExternalToolConfig(name="echo", command="echo hello")
+    @pytest.mark.skipif(os.name != "posix", reason="argv splitting is POSIX-only")
+    def test_execute_tool_runs_simple_command_without_shell(
+        self, temp_dir: Path, mock_popen
+    ):
+        """Test that a command without shell syntax is run directly as argv"""
+        tool = ExternalToolConfig(name="echo", command="echo 'hello world'")
         orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(stderr="", returncode=0)
-            orchestrator.execute_tool(tool)
+        orchestrator.execute_tool(tool)
 
-        call_kwargs = mock_run.call_args[1]
-        assert call_kwargs["shell"] is True
+        assert mock_popen.call_args.args[0] == ("echo", "hello world")
+        call_kwargs = mock_popen.call_args[1]
+        assert call_kwargs["shell"] is False
         # Now we use stdout=file instead of capture_output
         assert "stdout" in call_kwargs
-        assert call_kwargs["text"] is True
+        # Output goes to disk as raw bytes, with no text-mode decoding
+        assert not call_kwargs.get("text", False)
+        assert "b" in call_kwargs["stdout"].mode
+        # Each tool gets its own process group so a timeout can kill it whole
+        assert call_kwargs["start_new_session"] is True
+
+        # Cleanup
+        orchestrator.cleanup()
+
+    @pytest.mark.skipif(os.name != "posix", reason="argv splitting is POSIX-only")
+    def test_execute_tool_caches_argv(self, temp_dir: Path, mock_popen):
+        """Test that a repeated command is split into argv only once"""
+        tool = ExternalToolConfig(name="echo", command="echo argv-cache")
+        orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
+        _split_command.cache_clear()
+
+        with patch(
+            "sugar.discovery.orchestrator.shlex.split", wraps=shlex.split
+        ) as mock_split:
+            orchestrator.execute_tool(tool)
+            orchestrator.execute_tool(tool)
+            # The cache outlives cleanup() and is shared by new orchestrators
+            orchestrator.cleanup()
+            other = ToolOrchestrator([tool], working_dir=temp_dir)
+            other.execute_tool(tool)
+
+        assert mock_split.call_count == 1
+        assert mock_popen.call_args.args[0] == ("echo", "argv-cache")
+
+        # Cleanup
+        other.cleanup()
+
+    @pytest.mark.parametrize(
+        "command",
+        ["echo one && echo two", "ls *.py", "echo hi > out.txt", "FOO=1 env"],
+        ids=["and_list", "glob", "redirect", "assignment"],
+    )
+    def test_execute_tool_uses_shell_for_shell_syntax(
+        self, temp_dir: Path, mock_popen, command
+    ):
+        """Test that commands with shell syntax still run through the shell"""
+        tool = ExternalToolConfig(name="shelly", command=command)
+        orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
+
+        with patch("shutil.which", return_value="/usr/bin/tool"):
+            orchestrator.execute_tool(tool)
+
+        assert mock_popen.call_args.args[0] == command
+        assert mock_popen.call_args.kwargs["shell"] is True
 
         # Cleanup
         orchestrator.cleanup()
 
-    def test_execute_tool_uses_working_dir(self, temp_dir: Path):
+    def test_execute_tool_uses_working_dir(self, temp_dir: Path, mock_popen):
         """Test that tool execution uses specified working directory"""
         tool = ExternalToolConfig(name="pwd", command="pwd")
         orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(stderr="", returncode=0)
-            orchestrator.execute_tool(tool)
+        orchestrator.execute_tool(tool)
 
-        call_kwargs = mock_run.call_args[1]
+        call_kwargs = mock_popen.call_args[1]
         assert call_kwargs["cwd"] == temp_dir
 
         # Cleanup
         orchestrator.cleanup()
 
-    def test_execute_tool_with_env_vars(self, temp_dir: Path):
+    def test_execute_tool_with_env_vars(self, temp_dir: Path, mock_popen):
         """Test tool execution with environment variables in command"""
         import os
 
@@ -192,10 +272,8 @@ def test_execute_tool_with_env_vars(self, temp_dir: Path):
             tool = ExternalToolConfig(name="test", command="test $MY_FLAG")
             orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
 
-            with patch("subprocess.run") as mock_run:
-                with patch("shutil.which", return_value="/usr/bin/test"):
-                    mock_run.return_value = Mock(stderr="", returncode=0)
-                    result = orchestrator.execute_tool(tool)
+            with patch("shutil.which", return_value="/usr/bin/test"):
+                result = orchestrator.execute_tool(tool)
 
             # Verify command was expanded
             assert result.command == "test --verbose"
@@ -203,16 +281,14 @@ def test_execute_tool_with_env_vars(self, temp_dir: Path):
             # Cleanup
             orchestrator.cleanup()
 
-    def test_execute_tool_creates_temp_dir(self, temp_dir: Path):
+    def test_execute_tool_creates_temp_dir(self, temp_dir: Path, mock_popen):
         """Test that execute_tool creates a temp directory for output"""
         tool = ExternalToolConfig(name="echo", command="echo hello")
         orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
 
         assert orchestrator.temp_dir is None
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(stderr="", returncode=0)
-            result = orchestrator.execute_tool(tool)
+        result = orchestrator.execute_tool(tool)
 
         # Temp dir should now exist
         assert orchestrator.temp_dir is not None
@@ -224,14 +300,12 @@ def test_execute_tool_creates_temp_dir(self, temp_dir: Path):
         orchestrator.cleanup()
         assert orchestrator.temp_dir is None
 
-    def test_execute_tool_output_file_naming(self, temp_dir: Path):
+    def test_execute_tool_output_file_naming(self, temp_dir: Path, mock_popen):
         """Test that output files are named after the tool"""
         tool = ExternalToolConfig(name="myeslint", command="npx eslint .")
         orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(stderr="", returncode=0)
-            result = orchestrator.execute_tool(tool)
+        result = orchestrator.execute_tool(tool)
 
         assert result.output_path is not None
         assert "myeslint" in result.output_path.name
@@ -8,14 +8,57 @@
 
 import json
 import logging
-import tempfile
+import mmap
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
 
 from sugar.discovery.orchestrator import ToolResult
 
 
+def _nested_json(depth: int) -> str:
+    """Serialize {"level": 0, "nested": {"level": 1, ...}} nested depth deep"""
+    nested = current = {"level": 0}
+    for i in range(1, depth):
+        current["nested"] = {"level": i}
+        current = current["nested"]
+    return json.dumps(nested)
+
+
+# Test payloads, serialized once at import rather than on every test run
+LARGE_JSON_OBJECT = json.dumps(  # about 100KB
+    {f"key_{i}": f"value_{i}" * 100 for i in range(500)}
+)
+LARGE_JSON_ARRAY = json.dumps(  # about 50KB
+    [{"item": i, "data": "x" * 100} for i in range(500)]
+)
+NESTED_JSON = _nested_json(50)
+UNICODE_JSON = json.dumps(
+    {
+        "emoji": "test",
+        "japanese": "test",
+        "arabic": "test",
+        "chinese": "test",
+    }
+)
+ESCAPED_JSON = json.dumps(
+    {
+        "newline": "line1\nline2",
+        "tab": "col1\tcol2",
+        "quote": 'He said "hello"',
+        "backslash": "path\\to\\file",
+    }
+)
+
+
+@pytest.fixture
+def warning_caplog(caplog):
+    """caplog set to capture the orchestrator's warnings for one test"""
+    caplog.set_level(logging.WARNING, logger="sugar.discovery.orchestrator")
+    return caplog
+
+
 def create_tool_result_with_output(
     name: str,
     command: str,
@@ -28,19 +71,15 @@ def create_tool_result_with_output(
     timed_out: bool = False,
     tool_not_found: bool = False,
 ) -> ToolResult:
-    """Helper to create ToolResult with stdout content written to a temp file."""
-    if stdout_content:
-        tmp = tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt")
-        tmp.write(stdout_content)
-        tmp.close()
-        output_path = Path(tmp.name)
-    else:
-        output_path = None
+    """Helper to create ToolResult whose stdout is held in memory.
 
+    JSON validation only needs the text, so there is no temp file to write
+    and re-read for each case.
+    """
     return ToolResult(
         name=name,
         command=command,
-        output_path=output_path,
+        output_path=None,
         stderr=stderr,
         exit_code=exit_code,
         success=success,
@@ -48,6 +87,7 @@ def create_tool_result_with_output(
         error_message=error_message,
         timed_out=timed_out,
         tool_not_found=tool_not_found,
+        _stdout_override=stdout_content or None,
     )
 
 
@@ -115,6 +155,49 @@ def test_is_json_output_with_valid_json_null(self):
         assert result.json_parse_error is None
 
 
+class TestScalarJsonOutput:
+    """Tests for bare literal and integer output, which skips the parser"""
+
+    @pytest.mark.parametrize(
+        "content",
+        ["true", " false\n", "null", "0", "-0", "42\n", "-1234567890123456789012"],
+    )
+    def test_scalar_is_valid_without_parser(self, content):
+        """Test that bare literals and integers are valid without parsing"""
+        fake_jiter = Mock()
+        result = create_tool_result_with_output(
+            name="test_tool",
+            command="cmd",
+            stdout_content=content,
+        )
+
+        with (
+            patch("sugar.discovery.orchestrator.JITER_AVAILABLE", True),
+            patch("sugar.discovery.orchestrator.jiter", fake_jiter, create=True),
+        ):
+            assert result.is_json_output is True
+
+        fake_jiter.from_json.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "content", ["007", "--1", "-", "1\u00b2", "\u0663", "\x0btrue", "True", "1.5e3"]
+    )
+    def test_scalar_lookalikes_match_json_loads(self, content):
+        """Test that near-miss scalars get the same verdict as json.loads"""
+        try:
+            json.loads(content)
+            expected = True
+        except json.JSONDecodeError:
+            expected = False
+        result = create_tool_result_with_output(
+            name="test_tool",
+            command="cmd",
+            stdout_content=content,
+        )
+
+        assert result.is_json_output is expected
+
+
 class TestInvalidJsonHandling:
     """Tests for invalid JSON output handling"""
 
@@ -159,30 +242,41 @@ def test_is_json_output_with_malformed_json_single_quotes(self):
         assert result.is_json_output is False
         assert result.json_parse_error is not None
 
-    def test_invalid_json_logs_warning(self, caplog):
+    def test_invalid_json_logs_warning(self, warning_caplog):
         """Test that invalid JSON logs a warning"""
-        with caplog.at_level(logging.WARNING):
+        result = create_tool_result_with_output(
+            name="my_tool",
+            command="cmd",
+            stdout_content="invalid json content",
+        )
+        _ = result.is_json_output  # Trigger validation
+
+        assert "my_tool" in warning_caplog.text
+        assert "not valid JSON" in warning_caplog.text
+
+    def test_invalid_json_without_warning_logging(self, caplog):
+        """Test that invalid JSON is still recorded when warnings are filtered"""
+        with caplog.at_level(logging.ERROR, logger="sugar.discovery.orchestrator"):
             result = create_tool_result_with_output(
-                name="my_tool",
+                name="test_tool",
                 command="cmd",
-                stdout_content="invalid json content",
+                stdout_content="[not valid json",
             )
-            _ = result.is_json_output  # Trigger validation
+            assert result.is_json_output is False
 
-        assert "my_tool" in caplog.text
-        assert "not valid JSON" in caplog.text
+        assert "Expecting value" in result.json_parse_error
+        assert caplog.records == []
 
-    def test_valid_json_does_not_log_warning(self, caplog):
+    def test_valid_json_does_not_log_warning(self, warning_caplog):
         """Test that valid JSON does not log a warning"""
-        with caplog.at_level(logging.WARNING):
-            result = create_tool_result_with_output(
-                name="my_tool",
-                command="cmd",
-                stdout_content='{"valid": true}',
-            )
-            _ = result.is_json_output  # Trigger validation
+        result = create_tool_result_with_output(
+            name="my_tool",
+            command="cmd",
+            stdout_content='{"valid": true}',
+        )
+        _ = result.is_json_output  # Trigger validation
 
-        assert "not valid JSON" not in caplog.text
+        assert "not valid JSON" not in warning_caplog.text
 
     def test_invalid_json_proceeds_without_exception(self):
         """Test that invalid JSON doesn't raise exception, just returns False"""
@@ -197,6 +291,92 @@ def test_invalid_json_proceeds_without_exception(self):
         assert is_json is False
         assert error is not None
 
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '{"key": "value"} trailing text',
+            '\n  {"key": "value"}\n trailing text\n',
+            '\n  {"key": \n',
+            "\n\n  <?xml version='1.0'?>\n",
+        ],
+        ids=["trailing-data", "padded-trailing-data", "padded-truncated", "padded-xml"],
+    )
+    def test_invalid_json_reports_same_error_as_json_loads(self, content):
+        """Test that invalid output fails like json.loads does on the raw text"""
+        result = create_tool_result_with_output(
+            name="test_tool",
+            command="cmd",
+            stdout_content=content,
+        )
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            json.loads(content)
+
+        assert result.is_json_output is False
+        assert result.json_parse_error == str(exc_info.value)
+
+    def test_jiter_rejection_reports_stdlib_error(self):
+        """Test that output jiter rejects still gets json's error message"""
+        fake_jiter = Mock()
+        fake_jiter.from_json.side_effect = ValueError("expected value at line 1")
+        result = create_tool_result_with_output(
+            name="test_tool",
+            command="cmd",
+            stdout_content='{"key": value}',
+        )
+
+        with (
+            patch("sugar.discovery.orchestrator.JITER_AVAILABLE", True),
+            patch("sugar.discovery.orchestrator.jiter", fake_jiter, create=True),
+        ):
+            assert result.is_json_output is False
+
+        fake_jiter.from_json.assert_called_once()
+        assert "Expecting value" in result.json_parse_error
+
+    def test_non_json_first_character_skips_parser(self):
+        """Test that output which cannot start a JSON value is never parsed"""
+        fake_jiter = Mock()
+        result = create_tool_result_with_output(
+            name="test_tool",
+            command="cmd",
+            stdout_content="\x1b[31merror\x1b[0m: something went wrong",
+        )
+
+        with (
+            patch("sugar.discovery.orchestrator.JITER_AVAILABLE", True),
+            patch("sugar.discovery.orchestrator.jiter", fake_jiter, create=True),
+        ):
+            assert result.is_json_output is False
+
+        fake_jiter.from_json.assert_not_called()
+        assert result.json_parse_error == "Expecting value: line 1 column 1 (char 0)"
+
+    @pytest.mark.parametrize(
+        "content, is_json",
+        [("NaN", True), ('{"key": value}', False)],
+        ids=["stdlib-only-json", "not-json"],
+    )
+    def test_orjson_rejection_falls_back_to_stdlib(self, content, is_json):
+        """Test that output orjson rejects is judged by the stdlib parser"""
+        fake_orjson = Mock(JSONDecodeError=ValueError)
+        fake_orjson.loads.side_effect = ValueError("unexpected character")
+        result = create_tool_result_with_output(
+            name="test_tool",
+            command="cmd",
+            stdout_content=content,
+        )
+
+        with (
+            patch("sugar.discovery.orchestrator.JITER_AVAILABLE", False),
+            patch("sugar.discovery.orchestrator.ORJSON_AVAILABLE", True),
+            patch("sugar.discovery.orchestrator.orjson", fake_orjson, create=True),
+        ):
+            assert result.is_json_output is is_json
+
+        fake_orjson.loads.assert_called_once_with(content)
+        if not is_json:
+            assert "Expecting value" in result.json_parse_error
+
 
 class TestEmptyOutputHandling:
     """Tests for empty output handling"""
@@ -231,17 +411,16 @@ def test_is_json_output_with_json_and_leading_whitespace(self):
         assert result.is_json_output is True
         assert result.json_parse_error is None
 
-    def test_empty_output_does_not_log_warning(self, caplog):
+    def test_empty_output_does_not_log_warning(self, warning_caplog):
         """Test that empty output does not log a warning"""
-        with caplog.at_level(logging.WARNING):
-            result = create_tool_result_with_output(
-                name="test",
-                command="cmd",
-                stdout_content="",
-            )
-            _ = result.is_json_output  # Trigger validation
+        result = create_tool_result_with_output(
+            name="test",
+            command="cmd",
+            stdout_content="",
+        )
+        _ = result.is_json_output  # Trigger validation
 
-        assert "not valid JSON" not in caplog.text
+        assert "not valid JSON" not in warning_caplog.text
 
     def test_no_output_file(self):
         """Test is_json_output when output_path is None"""
@@ -262,14 +441,10 @@ class TestLargeJsonOutput:
 
     def test_large_json_object(self):
         """Test is_json_output with a large JSON object"""
-        # Create a large JSON object (about 100KB)
-        large_data = {f"key_{i}": f"value_{i}" * 100 for i in range(500)}
-        large_json = json.dumps(large_data)
-
         result = create_tool_result_with_output(
             name="large_json_tool",
             command="cmd",
-            stdout_content=large_json,
+            stdout_content=LARGE_JSON_OBJECT,
         )
         assert result.is_json_output is True
         assert result.json_parse_error is None
@@ -277,86 +452,119 @@ def test_large_json_object(self):
 
     def test_large_json_array(self):
         """Test is_json_output with a large JSON array"""
-        # Create a large JSON array (about 50KB)
-        large_array = [{"item": i, "data": "x" * 100} for i in range(500)]
-        large_json = json.dumps(large_array)
-
         result = create_tool_result_with_output(
             name="large_array_tool",
             command="cmd",
-            stdout_content=large_json,
+            stdout_content=LARGE_JSON_ARRAY,
         )
         assert result.is_json_output is True
         assert result.json_parse_error is None
 
+    @pytest.mark.parametrize(
+        "size, mapped", [(1000, False), (200_000, True)], ids=["small", "large"]
+    )
+    def test_output_file_validation_maps_only_large_files(
+        self, tmp_path: Path, size, mapped
+    ):
+        """Test that large output files are memory-mapped for validation"""
+        output_file = tmp_path / "output.json"
+        output_file.write_text(json.dumps(["x" * size]) + "\r\n")
+        result = ToolResult(
+            name="large_json_tool",
+            command="cmd",
+            output_path=output_file,
+            stderr="",
+            exit_code=0,
+            success=True,
+        )
+
+        with patch(
+            "sugar.discovery.orchestrator.mmap.mmap", wraps=mmap.mmap
+        ) as mock_mmap:
+            assert result.is_json_output is True
+
+        assert mock_mmap.called is mapped
+
+    def test_large_non_json_file_reads_only_prefix(self, tmp_path: Path):
+        """Test that output which cannot start JSON is rejected from its prefix"""
+        content = "\n  src/app.py:1:1: E501 line too long\n" * 10_000
+        output_file = tmp_path / "output.txt"
+        output_file.write_text(content)
+        result = ToolResult(
+            name="linter",
+            command="cmd",
+            output_path=output_file,
+            stderr="",
+            exit_code=1,
+            success=True,
+        )
+        with pytest.raises(json.JSONDecodeError) as exc_info:
+            json.loads(content)
+
+        with patch(
+            "sugar.discovery.orchestrator.mmap.mmap", wraps=mmap.mmap
+        ) as mock_mmap:
+            assert result.is_json_output is False
+
+        mock_mmap.assert_not_called()
+        assert result.json_parse_error == str(exc_info.value)
+
+    def test_json_string_longer_than_prefix_is_valid(self, tmp_path: Path):
+        """Test that a string cut off by the prefix boundary is not rejected"""
+        output_file = tmp_path / "output.json"
+        output_file.write_text(json.dumps("x" * 10_000))
+        result = ToolResult(
+            name="json_tool",
+            command="cmd",
+            output_path=output_file,
+            stderr="",
+            exit_code=0,
+            success=True,
+        )
+
+        assert result.is_json_output is True
+
     def test_deeply_nested_json(self):
         """Test is_json_output with deeply nested JSON structure"""
-        # Create a deeply nested JSON structure
-        nested = {"level": 0}
-        current = nested
-        for i in range(1, 50):
-            current["nested"] = {"level": i}
-            current = current["nested"]
-        nested_json = json.dumps(nested)
-
         result = create_tool_result_with_output(
             name="nested_json_tool",
             command="cmd",
-            stdout_content=nested_json,
+            stdout_content=NESTED_JSON,
         )
         assert result.is_json_output is True
         assert result.json_parse_error is None
 
-    def test_large_invalid_json_truncates_in_warning(self, caplog):
+    def test_large_invalid_json_truncates_in_warning(self, warning_caplog):
         """Test that large invalid output is truncated in warning message"""
         large_invalid = "x" * 200  # Invalid JSON, > 100 chars
 
-        with caplog.at_level(logging.WARNING):
-            result = create_tool_result_with_output(
-                name="test_tool",
-                command="cmd",
-                stdout_content=large_invalid,
-            )
-            _ = result.is_json_output  # Trigger validation
+        result = create_tool_result_with_output(
+            name="test_tool",
+            command="cmd",
+            stdout_content=large_invalid,
+        )
+        _ = result.is_json_output  # Trigger validation
 
         # Warning should contain truncated output (first 100 chars + "...")
-        assert "..." in caplog.text
-        assert "x" * 100 in caplog.text  # First 100 chars should be present
+        assert "..." in warning_caplog.text
+        assert "x" * 100 in warning_caplog.text  # First 100 chars should be present
 
     def test_json_with_unicode_characters(self):
         """Test is_json_output with JSON containing unicode characters"""
-        unicode_json = json.dumps(
-            {
-                "emoji": "test",
-                "japanese": "test",
-                "arabic": "test",
-                "chinese": "test",
-            }
-        )
-
         result = create_tool_result_with_output(
             name="unicode_tool",
             command="cmd",
-            stdout_content=unicode_json,
+            stdout_content=UNICODE_JSON,
         )
         assert result.is_json_output is True
         assert result.json_parse_error is None
 
     def test_json_with_escaped_characters(self):
         """Test is_json_output with JSON containing escaped characters"""
-        escaped_json = json.dumps(
-            {
-                "newline": "line1\nline2",
-                "tab": "col1\tcol2",
-                "quote": 'He said "hello"',
-                "backslash": "path\\to\\file",
-            }
-        )
-
         result = create_tool_result_with_output(
             name="escaped_tool",
             command="cmd",
-            stdout_content=escaped_json,
+            stdout_content=ESCAPED_JSON,
         )
         assert result.is_json_output is True
         assert result.json_parse_error is None
@@ -500,10 +708,10 @@ def test_json_validation_is_cached(self):
         )
         # First access
         assert result.is_json_output is True
-        assert result._json_validated is True
+        assert result._json_validation == (True, None)
 
         # Modify the cached value (testing cache behavior)
-        result._is_json_output = False
+        result._json_validation = (False, None)
 
         # Second access should return cached value
         assert result.is_json_output is False
@@ -517,7 +725,7 @@ def test_json_parse_error_uses_cached_validation(self):
         )
         # Access is_json_output first
         _ = result.is_json_output
-        cached_error = result._json_parse_error
+        cached_error = result._json_validation[1]
 
         # Accessing json_parse_error should use cached result
         assert result.json_parse_error == cached_error
@@ -530,13 +738,13 @@ def test_validation_not_triggered_until_property_access(self):
             stdout_content="some content",
         )
         # Before accessing any JSON property
-        assert result._json_validated is False
+        assert result._json_validation is None
 
         # Trigger validation
         _ = result.is_json_output
 
         # After accessing JSON property
-        assert result._json_validated is True
+        assert result._json_validation is not None
 
 
 class TestToDictWithJsonFields:
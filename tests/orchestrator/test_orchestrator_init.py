@@ -62,3 +62,16 @@ def test_get_tool_count(self, temp_dir):
         ]
         orchestrator = ToolOrchestrator(tools, working_dir=temp_dir)
         assert orchestrator.get_tool_count() == 2
+
+    def test_tool_list_is_frozen_at_init(self, temp_dir):
+        """Test that the tool list is copied to a tuple and names are a fresh list"""
+        tools = [ExternalToolConfig(name="ruff", command="ruff check .")]
+        orchestrator = ToolOrchestrator(tools, working_dir=temp_dir)
+
+        tools.append(ExternalToolConfig(name="eslint", command="npx eslint ."))
+        names = orchestrator.get_tool_names()
+        names.append("mypy")
+
+        assert orchestrator.external_tools == (tools[0],)
+        assert orchestrator.get_tool_names() == ["ruff"]
+        assert orchestrator.get_tool_count() == 1
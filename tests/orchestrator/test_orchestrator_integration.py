@@ -10,6 +10,7 @@
 from sugar.discovery.orchestrator import ToolOrchestrator
 
 
+@pytest.mark.integration
 class TestToolOrchestratorIntegration:
     """Integration tests for ToolOrchestrator"""
 
@@ -4,8 +4,10 @@
 Tests the ToolResult dataclass that holds the results of external tool execution.
 """
 
+import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -54,6 +56,18 @@ def test_tool_result_defaults(self, tmp_path: Path):
         assert result.timed_out is False
         assert result.tool_not_found is False
 
+    def test_tool_result_uses_slots(self):
+        """Test that ToolResult instances carry no per-instance __dict__"""
+        result = ToolResult(
+            name="test",
+            command="test cmd",
+            output_path=None,
+            stderr="",
+            exit_code=0,
+            success=True,
+        )
+        assert not hasattr(result, "__dict__")
+
     def test_has_output_with_stdout(self, tmp_path: Path):
         """Test has_output property with stdout"""
         output_file = tmp_path / "output.txt"
@@ -146,6 +160,54 @@ def test_stdout_property_reads_file(self, tmp_path: Path):
         output_file.write_text("modified content")
         assert result.stdout == "modified content"
 
+    def test_stdout_reads_unchanged_file_once(self, tmp_path: Path):
+        """Test that repeat stdout reads of an unchanged file hit the cache"""
+        output_file = tmp_path / "output.txt"
+        output_file.write_text("content")
+        result = ToolResult(
+            name="test",
+            command="cmd",
+            output_path=output_file,
+            stderr="",
+            exit_code=0,
+            success=True,
+        )
+
+        with patch.object(
+            Path, "read_text", autospec=True, side_effect=Path.read_text
+        ) as spy:
+            assert result.stdout == "content"
+            assert result.stdout == "content"
+            assert spy.call_count == 1
+
+            # Same size, new mtime: the file is read again
+            output_file.write_text("changed")
+            os.utime(output_file, ns=(0, 0))
+            assert result.stdout == "changed"
+            assert spy.call_count == 2
+
+            result.invalidate_stdout_cache()
+            assert result.stdout == "changed"
+            assert spy.call_count == 3
+
+    def test_stdout_does_not_cache_large_files(self, tmp_path: Path):
+        """Test that outputs above STDOUT_CACHE_MAX_BYTES are not kept in memory"""
+        output_file = tmp_path / "output.txt"
+        output_file.write_text("x" * 11)
+        result = ToolResult(
+            name="test",
+            command="cmd",
+            output_path=output_file,
+            stderr="",
+            exit_code=0,
+            success=True,
+        )
+
+        with patch("sugar.discovery.orchestrator.STDOUT_CACHE_MAX_BYTES", 10):
+            assert result.stdout == "x" * 11
+
+        assert result._stdout_cache is None
+
     def test_stdout_property_handles_missing_file(self, tmp_path: Path):
         """Test that stdout property returns empty string if file is deleted"""
         output_file = tmp_path / "output.txt"
@@ -165,6 +227,42 @@ def test_stdout_property_handles_missing_file(self, tmp_path: Path):
         output_file.unlink()
         assert result.stdout == ""
 
+    def test_stdout_size_stats_file(self, tmp_path: Path):
+        """Test that stdout_size reports the output file size in bytes"""
+        output_file = tmp_path / "output.txt"
+        output_file.write_bytes(b"12345")
+
+        result = ToolResult(
+            name="test",
+            command="cmd",
+            output_path=output_file,
+            stderr="",
+            exit_code=0,
+            success=True,
+        )
+        assert result.stdout_size == 5
+
+        # Missing file reports zero
+        output_file.unlink()
+        assert result.stdout_size == 0
+
+    def test_stdout_override_skips_output_file(self, tmp_path: Path):
+        """Test that an in-memory stdout is used instead of the output file"""
+        output_file = tmp_path / "output.txt"
+        output_file.write_text("from file")
+
+        result = ToolResult(
+            name="test",
+            command="cmd",
+            output_path=output_file,
+            stderr="",
+            exit_code=0,
+            success=True,
+            _stdout_override="caf\u00e9",
+        )
+        assert result.stdout == "caf\u00e9"
+        assert result.stdout_size == 5  # UTF-8 bytes, not characters
+
     def test_to_dict(self, tmp_path: Path):
         """Test to_dict serialization"""
         output_file = tmp_path / "output.txt"
@@ -8,7 +8,6 @@
 import pytest
 import pytest_asyncio
 import asyncio
-import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from dataclasses import asdict
@@ -20,12 +19,11 @@
 )
 
 
-def create_temp_output_file(content: str) -> Path:
-    """Helper to create a temporary file with the given content."""
-    tmp = tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt")
-    tmp.write(content)
-    tmp.close()
-    return Path(tmp.name)
+def create_temp_output_file(tmp_path: Path, content: str) -> Path:
+    """Helper to write a tool output file under pytest's tmp_path."""
+    output_file = tmp_path / "output.txt"
+    output_file.write_text(content)
+    return output_file
 
 
 class TestParsedCommand:
@@ -266,6 +264,14 @@ def test_extract_ignores_non_command_lines(self):
         assert len(commands) == 1
         assert commands[0].title == "Fix bug"
 
+    def test_extract_handles_indented_and_crlf_lines(self):
+        """Test that indentation and Windows line endings are tolerated"""
+        response = 'Tasks:\r\n    sugar add "Fix bug" --type bug_fix\r\n\tsugar add "Add test"\r\n'
+
+        commands = self.interpreter._extract_commands(response)
+        assert [c.title for c in commands] == ["Fix bug", "Add test"]
+        assert commands[0].raw_command == 'sugar add "Fix bug" --type bug_fix'
+
     def test_extract_handles_empty_response(self):
         """Test extraction from empty response"""
         commands = self.interpreter._extract_commands("")
@@ -320,6 +326,25 @@ def test_execute_skips_invalid_commands(self):
         count = self.interpreter.execute_commands(commands, dry_run=True)
         assert count == 2
 
+    @patch("subprocess.run")
+    def test_execute_dry_run_logs_once_without_subprocess(self, mock_run, caplog):
+        """Test dry run never spawns processes and logs all commands together"""
+        commands = [
+            ParsedCommand(title="Task 1", description="it's broken"),
+            ParsedCommand(title="Task 2", urgent=True, status="hold"),
+        ]
+
+        with caplog.at_level("INFO", logger="sugar.quality.claude_invoker"):
+            count = self.interpreter.execute_commands(commands, dry_run=True)
+
+        assert count == 2
+        mock_run.assert_not_called()
+        dry_run_records = [r for r in caplog.records if "[DRY RUN]" in r.message]
+        assert len(dry_run_records) == 1
+        message = dry_run_records[0].message
+        assert "--description 'it'\"'\"'s broken'" in message
+        assert "sugar add 'Task 2' --type bug_fix --priority 3 --urgent" in message
+
     @patch("subprocess.run")
     def test_execute_real_commands(self, mock_run):
         """Test executing real sugar add commands"""
@@ -404,9 +429,9 @@ def setup_method(self):
         self.interpreter = ToolOutputInterpreter()
 
     @pytest.mark.asyncio
-    async def test_interpret_output_success(self):
+    async def test_interpret_output_success(self, tmp_path):
         """Test successful interpretation of tool output"""
-        output_file = create_temp_output_file("10 problems found")
+        output_file = create_temp_output_file(tmp_path, "10 problems found")
 
         # Mock the internal Claude execution
         with patch.object(
@@ -431,9 +456,9 @@ async def test_interpret_output_success(self):
             assert result.execution_time == 1.5
 
     @pytest.mark.asyncio
-    async def test_interpret_output_failure(self):
+    async def test_interpret_output_failure(self, tmp_path):
         """Test failed interpretation"""
-        output_file = create_temp_output_file("output")
+        output_file = create_temp_output_file(tmp_path, "output")
 
         with patch.object(
             self.interpreter, "_execute_claude_prompt", new_callable=AsyncMock
@@ -455,9 +480,9 @@ async def test_interpret_output_failure(self):
             assert "Claude CLI not available" in result.error_message
 
     @pytest.mark.asyncio
-    async def test_interpret_output_with_custom_template(self):
+    async def test_interpret_output_with_custom_template(self, tmp_path):
         """Test interpretation with custom template"""
-        output_file = create_temp_output_file("test output")
+        output_file = create_temp_output_file(tmp_path, "test output")
         custom_template = "Analyze: ${tool_name}\nFile: ${output_file_path}"
         interpreter = ToolOutputInterpreter(prompt_template=custom_template)
 
@@ -483,9 +508,9 @@ async def test_interpret_output_with_custom_template(self):
             assert str(output_file) in call_args
 
     @pytest.mark.asyncio
-    async def test_interpret_output_exception_handling(self):
+    async def test_interpret_output_exception_handling(self, tmp_path):
         """Test exception handling during interpretation"""
-        output_file = create_temp_output_file("output")
+        output_file = create_temp_output_file(tmp_path, "output")
 
         with patch.object(
             self.interpreter, "_execute_claude_prompt", new_callable=AsyncMock
@@ -501,6 +526,30 @@ async def test_interpret_output_exception_handling(self):
             assert result.success is False
             assert "Unexpected error" in result.error_message
 
+    @pytest.mark.asyncio
+    async def test_execute_claude_prompt_prepares_context_once(self):
+        """Test the wrapper context is prepared once and reused across prompts"""
+        wrapper = self.interpreter.wrapper
+        with (
+            patch.object(
+                wrapper, "_prepare_context", return_value={"ccal_session": True}
+            ) as mock_prepare,
+            patch.object(
+                wrapper, "_execute_claude_cli", new_callable=AsyncMock
+            ) as mock_cli,
+        ):
+            mock_cli.return_value = {"success": True, "stdout": "ok"}
+
+            await self.interpreter._execute_claude_prompt("first prompt")
+            result = await self.interpreter._execute_claude_prompt("second prompt")
+
+            assert result["success"] is True
+            assert mock_prepare.call_count == 1
+            assert [c.args[0] for c in mock_cli.call_args_list] == [
+                "first prompt",
+                "second prompt",
+            ]
+
 
 class TestInterpretAndExecute:
     """Tests for the interpret_and_execute convenience method"""
@@ -510,9 +559,9 @@ def setup_method(self):
         self.interpreter = ToolOutputInterpreter()
 
     @pytest.mark.asyncio
-    async def test_interpret_and_execute_success(self):
+    async def test_interpret_and_execute_success(self, tmp_path):
         """Test successful interpretation and execution"""
-        output_file = create_temp_output_file("20 problems")
+        output_file = create_temp_output_file(tmp_path, "20 problems")
 
         with patch.object(
             self.interpreter, "_execute_claude_prompt", new_callable=AsyncMock
@@ -538,9 +587,83 @@ async def test_interpret_and_execute_success(self):
             assert result["dry_run"] is True
 
     @pytest.mark.asyncio
-    async def test_interpret_and_execute_interpretation_failure(self):
+    @patch("subprocess.run")
+    async def test_interpret_and_execute_with_work_queue(
+        self, mock_run, mock_work_queue, tmp_path
+    ):
+        """Test tasks are added in-process when a work queue is given"""
+        output_file = create_temp_output_file(tmp_path, "2 problems")
+
+        with patch.object(
+            self.interpreter, "_execute_claude_prompt", new_callable=AsyncMock
+        ) as mock_prompt:
+            mock_prompt.return_value = {
+                "success": True,
+                "output": """sugar add "Task 1" --type bug_fix --urgent
+sugar add "Task 2" --type feature --status hold --description "Details"
+""",
+                "error": "",
+                "execution_time": 2.0,
+            }
+
+            result = await self.interpreter.interpret_and_execute(
+                tool_name="eslint",
+                command="eslint src/",
+                output_file_path=output_file,
+                work_queue=mock_work_queue,
+            )
+
+        assert result["success"] is True
+        assert result["tasks_created"] == 2
+        mock_run.assert_not_called()
+
+        tasks = {t["title"]: t for t in await mock_work_queue.get_recent_work()}
+        assert tasks["Task 1"]["priority"] == 5
+        assert tasks["Task 1"]["description"] == "Task: Task 1"
+        assert tasks["Task 2"]["status"] == "hold"
+        assert tasks["Task 2"]["description"] == "Details"
+        assert tasks["Task 2"]["source"] == "tool_interpreter"
+
+    @pytest.mark.asyncio
+    async def test_add_commands_to_queue_rejects_unknown_type(self, mock_work_queue):
+        """Test that an unknown task type is not written to the queue"""
+        commands = [
+            ParsedCommand(title="Known", task_type="feature"),
+            ParsedCommand(title="Unknown", task_type="not_a_type"),
+        ]
+
+        created = await self.interpreter.add_commands_to_queue(
+            commands, mock_work_queue
+        )
+
+        assert created == 1
+        titles = [t["title"] for t in await mock_work_queue.get_recent_work()]
+        assert titles == ["Known"]
+
+    @pytest.mark.asyncio
+    async def test_add_commands_to_queue_checks_priority(self, mock_work_queue):
+        """Test priorities outside 1-5 are rejected and 0 becomes the default 3"""
+        commands = [
+            ParsedCommand(title="Too high", priority=7),
+            ParsedCommand(title="Negative", priority=-1),
+            ParsedCommand(title="Unset", priority=0),
+            ParsedCommand(title="Urgent", priority=0, urgent=True),
+        ]
+
+        created = await self.interpreter.add_commands_to_queue(
+            commands, mock_work_queue
+        )
+
+        assert created == 2
+        tasks = {t["title"]: t for t in await mock_work_queue.get_recent_work()}
+        assert set(tasks) == {"Unset", "Urgent"}
+        assert tasks["Unset"]["priority"] == 3
+        assert tasks["Urgent"]["priority"] == 5
+
+    @pytest.mark.asyncio
+    async def test_interpret_and_execute_interpretation_failure(self, tmp_path):
         """Test handling of interpretation failure"""
-        output_file = create_temp_output_file("output")
+        output_file = create_temp_output_file(tmp_path, "output")
 
         with patch.object(
             self.interpreter, "_execute_claude_prompt", new_callable=AsyncMock
@@ -566,10 +689,12 @@ class TestIntegration:
     """Integration tests that test multiple components together"""
 
     @pytest.mark.asyncio
-    async def test_full_interpretation_flow(self):
+    async def test_full_interpretation_flow(self, tmp_path):
         """Test the full flow from raw output to task commands"""
         interpreter = ToolOutputInterpreter()
-        output_file = create_temp_output_file('{"errorCount": 23, "warningCount": 15}')
+        output_file = create_temp_output_file(
+            tmp_path, '{"errorCount": 23, "warningCount": 15}'
+        )
 
         # Mock Claude response with realistic output
         mock_response = """Based on the eslint output, I've identified the following tasks:
@@ -601,11 +726,9 @@ async def test_full_interpretation_flow(self):
             assert result["commands_found"] == 3
             assert result["tasks_created"] == 3
 
-    def test_command_parsing_edge_cases(self):
-        """Test command parsing with various edge cases"""
-        interpreter = ToolOutputInterpreter()
-
-        test_cases = [
+    @pytest.mark.parametrize(
+        "cmd_str,expected_valid,expected_title",
+        [
             # Command with escaped quotes in description
             (
                 'sugar add "Task" --description "Fix the \\"important\\" bug"',
@@ -624,10 +747,13 @@ def test_command_parsing_edge_cases(self):
                 False,
                 None,
             ),
-        ]
+        ],
+    )
+    def test_command_parsing_edge_cases(self, cmd_str, expected_valid, expected_title):
+        """Test command parsing with various edge cases"""
+        interpreter = ToolOutputInterpreter()
 
-        for cmd_str, expected_valid, expected_title in test_cases:
-            cmd = interpreter._parse_command(cmd_str)
-            assert cmd.valid == expected_valid, f"Failed for: {cmd_str}"
-            if expected_valid:
-                assert cmd.title == expected_title, f"Title mismatch for: {cmd_str}"
+        cmd = interpreter._parse_command(cmd_str)
+        assert cmd.valid == expected_valid
+        if expected_valid:
+            assert cmd.title == expected_title
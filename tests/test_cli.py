@@ -891,6 +891,7 @@ def test_list_task_types_table_format(self, mock_manager_class, cli_runner):
         """Test listing task types in table format"""
         mock_manager = MagicMock()
         mock_manager_class.return_value = mock_manager
+        mock_manager.__aenter__.return_value = mock_manager
         mock_manager.get_all_task_types = AsyncMock(
             return_value=[
                 {
@@ -931,6 +932,7 @@ def test_list_task_types_json_format(self, mock_manager_class, cli_runner):
         """Test listing task types in JSON format"""
         mock_manager = MagicMock()
         mock_manager_class.return_value = mock_manager
+        mock_manager.__aenter__.return_value = mock_manager
         mock_manager.get_all_task_types = AsyncMock(
             return_value=[
                 {
@@ -962,6 +964,7 @@ def test_list_task_types_empty(self, mock_manager_class, cli_runner):
         """Test listing task types when none exist"""
         mock_manager = MagicMock()
         mock_manager_class.return_value = mock_manager
+        mock_manager.__aenter__.return_value = mock_manager
         mock_manager.get_all_task_types = AsyncMock(return_value=[])
 
         with cli_runner.isolated_filesystem():
@@ -979,6 +982,7 @@ def test_add_task_type_success(self, mock_manager_class, cli_runner):
         """Test adding a new task type successfully"""
         mock_manager = MagicMock()
         mock_manager_class.return_value = mock_manager
+        mock_manager.__aenter__.return_value = mock_manager
         mock_manager.add_task_type = AsyncMock(return_value=True)
 
         with cli_runner.isolated_filesystem():
@@ -1010,6 +1014,7 @@ def test_add_task_type_already_exists(self, mock_manager_class, cli_runner):
         """Test adding a task type that already exists"""
         mock_manager = MagicMock()
         mock_manager_class.return_value = mock_manager
+        mock_manager.__aenter__.return_value = mock_manager
         mock_manager.add_task_type = AsyncMock(return_value=False)
 
         with cli_runner.isolated_filesystem():
@@ -20,6 +20,13 @@
 from sugar.main import cli
 
 
+def _fake_process(stderr: bytes = b"", returncode: int = 0) -> MagicMock:
+    """Fake subprocess.Popen instance for the orchestrator's tool runs"""
+    process = MagicMock(returncode=returncode)
+    process.communicate.return_value = (None, stderr)
+    return process
+
+
 class TestParseSugarAddCommands:
     """Tests for parsing sugar add commands from Claude's output"""
 
@@ -336,7 +343,7 @@ def test_discover_dry_run_header(
 
     @patch("sugar.storage.work_queue.WorkQueue")
     @patch("sugar.executor.claude_wrapper.ClaudeWrapper")
-    @patch("subprocess.run")
+    @patch("subprocess.Popen")
     def test_discover_dry_run_shows_prompt_preview(
         self, mock_subprocess, mock_claude_class, mock_queue_class, cli_runner
     ):
@@ -350,8 +357,8 @@ def test_discover_dry_run_shows_prompt_preview(
         def subprocess_side_effect(*args, **kwargs):
             stdout_file = kwargs.get("stdout")
             if stdout_file and hasattr(stdout_file, "write"):
-                stdout_file.write("Tool output line 1\nTool output line 2\n")
-            return MagicMock(stderr="", returncode=0)
+                stdout_file.write(b"Tool output line 1\nTool output line 2\n")
+            return _fake_process()
 
         mock_subprocess.side_effect = subprocess_side_effect
 
@@ -390,7 +397,7 @@ class TestDiscoverTimeout:
 
     @patch("sugar.storage.work_queue.WorkQueue")
     @patch("sugar.executor.claude_wrapper.ClaudeWrapper")
-    @patch("subprocess.run")
+    @patch("subprocess.Popen")
     def test_discover_custom_timeout(
         self, mock_subprocess, mock_claude_class, mock_queue_class, cli_runner
     ):
@@ -402,8 +409,8 @@ def test_discover_custom_timeout(
         def subprocess_side_effect(*args, **kwargs):
             stdout_file = kwargs.get("stdout")
             if stdout_file and hasattr(stdout_file, "write"):
-                stdout_file.write("output")
-            return MagicMock(stderr="", returncode=0)
+                stdout_file.write(b"output")
+            return _fake_process()
 
         mock_subprocess.side_effect = subprocess_side_effect
 
@@ -476,7 +483,7 @@ class TestDiscoverIntegrationWithOrchestrator:
 
     @patch("sugar.storage.work_queue.WorkQueue")
     @patch("sugar.executor.claude_wrapper.ClaudeWrapper")
-    @patch("subprocess.run")
+    @patch("subprocess.Popen")
     def test_discover_tool_success(
         self, mock_subprocess, mock_claude_class, mock_queue_class, cli_runner
     ):
@@ -489,8 +496,8 @@ def test_discover_tool_success(
         def subprocess_side_effect(*args, **kwargs):
             stdout_file = kwargs.get("stdout")
             if stdout_file and hasattr(stdout_file, "write"):
-                stdout_file.write('{"errors": []}')
-            return MagicMock(stderr="", returncode=0)
+                stdout_file.write(b'{"errors": []}')
+            return _fake_process()
 
         mock_subprocess.side_effect = subprocess_side_effect
 
@@ -525,7 +532,7 @@ def subprocess_side_effect(*args, **kwargs):
 
     @patch("sugar.storage.work_queue.WorkQueue")
     @patch("sugar.executor.claude_wrapper.ClaudeWrapper")
-    @patch("subprocess.run")
+    @patch("subprocess.Popen")
     @patch("shutil.which")
     def test_discover_tool_not_found_graceful(
         self,
@@ -602,16 +609,17 @@ def _setup_mock_subprocess(
     ):
         """Setup mock subprocess with configurable output.
 
-        Writes stdout to the file handle passed to subprocess.run since
+        Writes stdout to the file handle passed to subprocess.Popen since
         the orchestrator now writes output to files instead of capturing.
+        The handle is opened in binary mode, like the fd a real tool writes to.
         """
 
         def subprocess_side_effect(*args, **kwargs):
             # Write stdout to the file handle if provided
             stdout_file = kwargs.get("stdout")
             if stdout_file and hasattr(stdout_file, "write"):
-                stdout_file.write(stdout)
-            return MagicMock(stderr=stderr, returncode=returncode)
+                stdout_file.write(stdout.encode())
+            return _fake_process(stderr.encode(), returncode)
 
         mock_subprocess.side_effect = subprocess_side_effect
 
@@ -637,7 +645,7 @@ def _write_config_file(self, config):
 
     @patch("sugar.storage.work_queue.WorkQueue")
     @patch("sugar.executor.claude_wrapper.ClaudeWrapper")
-    @patch("subprocess.run")
+    @patch("subprocess.Popen")
     def test_discover_creates_tasks_from_claude_output(
         self, mock_subprocess, mock_claude_class, mock_queue_class, cli_runner
     ):
@@ -683,7 +691,7 @@ def _verify_task(
 
     @patch("sugar.storage.work_queue.WorkQueue")
     @patch("sugar.executor.claude_wrapper.ClaudeWrapper")
-    @patch("subprocess.run")
+    @patch("subprocess.Popen")
     def test_discover_handles_claude_failure(
         self, mock_subprocess, mock_claude_class, mock_queue_class, cli_runner
     ):
@@ -701,7 +709,7 @@ def test_discover_handles_claude_failure(
 
     @patch("sugar.storage.work_queue.WorkQueue")
     @patch("sugar.executor.claude_wrapper.ClaudeWrapper")
-    @patch("subprocess.run")
+    @patch("subprocess.Popen")
     def test_discover_handles_claude_exception(
         self, mock_subprocess, mock_claude_class, mock_queue_class, cli_runner
     ):
@@ -719,7 +727,7 @@ def test_discover_handles_claude_exception(
 
     @patch("sugar.storage.work_queue.WorkQueue")
     @patch("sugar.executor.claude_wrapper.ClaudeWrapper")
-    @patch("subprocess.run")
+    @patch("subprocess.Popen")
     def test_discover_handles_no_issues_found(
         self, mock_subprocess, mock_claude_class, mock_queue_class, cli_runner
     ):
@@ -745,7 +753,7 @@ class TestDiscoverMultipleTools:
 
     @patch("sugar.storage.work_queue.WorkQueue")
     @patch("sugar.executor.claude_wrapper.ClaudeWrapper")
-    @patch("subprocess.run")
+    @patch("subprocess.Popen")
     def test_discover_runs_all_tools(
         self, mock_subprocess, mock_claude_class, mock_queue_class, cli_runner
     ):
@@ -763,9 +771,9 @@ def test_discover_runs_all_tools(
 
         # Return different outputs for each tool
         mock_subprocess.side_effect = [
-            MagicMock(stdout="eslint output", stderr="", returncode=0),
-            MagicMock(stdout="ruff output", stderr="", returncode=0),
-            MagicMock(stdout="mypy output", stderr="", returncode=0),
+            _fake_process(),
+            _fake_process(),
+            _fake_process(),
         ]
 
         with cli_runner.isolated_filesystem():
@@ -799,7 +807,7 @@ def test_discover_runs_all_tools(
 
     @patch("sugar.storage.work_queue.WorkQueue")
     @patch("sugar.executor.claude_wrapper.ClaudeWrapper")
-    @patch("subprocess.run")
+    @patch("subprocess.Popen")
     @patch("shutil.which")
     def test_discover_continues_after_one_tool_fails(
         self,
@@ -830,9 +838,9 @@ def which_side_effect(cmd):
         mock_which.side_effect = which_side_effect
 
         mock_subprocess.side_effect = [
-            MagicMock(stdout="eslint output", stderr="", returncode=0),
+            _fake_process(),
             # bad_tool never reaches subprocess because which returns None
-            MagicMock(stdout="ruff output", stderr="", returncode=0),
+            _fake_process(),
         ]
 
         with cli_runner.isolated_filesystem():
@@ -8,6 +8,7 @@
 - discovery.external_tools config structure
 """
 
+import dataclasses
 import os
 from unittest.mock import patch
 
@@ -34,6 +35,13 @@ def test_external_tool_config_creation(self):
         assert tool.name == "eslint"
         assert tool.command == "npx eslint ."
 
+    def test_external_tool_config_is_frozen(self):
+        """Test that ExternalToolConfig cannot be modified after creation"""
+        tool = ExternalToolConfig(name="eslint", command="npx eslint .")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            tool.command = "npx eslint --fix ."
+        assert not hasattr(tool, "__dict__")
+
     def test_get_expanded_command_no_vars(self):
         """Test command expansion with no environment variables"""
         tool = ExternalToolConfig(name="eslint", command="npx eslint . --format json")
@@ -5,9 +5,11 @@
 and captures their raw output via subprocess.
 """
 
+import os
 import subprocess
 import tempfile
 from pathlib import Path
+from typing import List
 from unittest.mock import Mock, patch, MagicMock
 
 import pytest
@@ -20,6 +22,47 @@
 from sugar.discovery.external_tool_config import ExternalToolConfig
 
 
+def _mock_process(returncode: int = 0, stderr: bytes = b"") -> Mock:
+    """Create a fake subprocess.Popen instance that exits immediately"""
+    process = Mock(returncode=returncode)
+    process.communicate.return_value = (None, stderr)
+    return process
+
+
+# Descriptors of the anonymous output files below, closed after this module
+_OUTPUT_FDS: List[int] = []
+
+
+def _write_output_file(content: str) -> Path:
+    """Write content to a temp file for a ToolResult to read back.
+
+    On Linux the file is an unnamed O_TMPFILE inode reached through
+    /proc/self/fd, so no directory entry is created or left behind.
+    Elsewhere, or if the temp filesystem lacks O_TMPFILE, a named temp
+    file is used.
+    """
+    if hasattr(os, "O_TMPFILE") and os.path.isdir("/proc/self/fd"):
+        try:
+            fd = os.open(tempfile.gettempdir(), os.O_TMPFILE | os.O_RDWR, 0o600)
+        except OSError:
+            pass
+        else:
+            _OUTPUT_FDS.append(fd)
+            os.write(fd, content.encode("utf-8"))
+            return Path(f"/proc/self/fd/{fd}")
+    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as tmp:
+        tmp.write(content)
+    return Path(tmp.name)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _close_output_files():
+    """Close the O_TMPFILE descriptors once the module's tests are done"""
+    yield
+    while _OUTPUT_FDS:
+        os.close(_OUTPUT_FDS.pop())
+
+
 def create_tool_result_with_output(
     name: str,
     command: str,
@@ -33,14 +76,7 @@ def create_tool_result_with_output(
     tool_not_found: bool = False,
 ) -> ToolResult:
     """Helper to create ToolResult with stdout content written to a temp file."""
-    # Create a temp file with the stdout content
-    if stdout_content:
-        tmp = tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt")
-        tmp.write(stdout_content)
-        tmp.close()
-        output_path = Path(tmp.name)
-    else:
-        output_path = None
+    output_path = _write_output_file(stdout_content) if stdout_content else None
 
     return ToolResult(
         name=name,
@@ -300,8 +336,7 @@ def test_json_validation_caching(self):
         # First access
         assert result.is_json_output is True
         # Modify the cached value (normally not possible, but for testing)
-        result._is_json_output = False
-        result._json_validated = True  # Already validated
+        result._json_validation = (False, None)
         # Second access should return cached value
         assert result.is_json_output is False
 
@@ -458,9 +493,14 @@ def test_execute_tool_timeout(self, temp_dir):
         tool = ExternalToolConfig(name="slow", command="sleep 100")
         orchestrator = ToolOrchestrator([tool], working_dir=temp_dir, default_timeout=1)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired(cmd="sleep 100", timeout=1)
-            result = orchestrator.execute_tool(tool)
+        process = _mock_process()
+        process.communicate.side_effect = [
+            subprocess.TimeoutExpired(cmd="sleep 100", timeout=1),
+            (None, b""),
+        ]
+        with patch("subprocess.Popen", return_value=process):
+            with patch("sugar.discovery.orchestrator.os.killpg"):
+                result = orchestrator.execute_tool(tool)
 
         assert result.success is False
         assert result.timed_out is True
@@ -487,9 +527,8 @@ def test_execute_tool_os_error(self, temp_dir):
         tool = ExternalToolConfig(name="test", command="test cmd")
         orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
+        with patch("subprocess.Popen", side_effect=OSError("Permission denied")):
             with patch("shutil.which", return_value="/usr/bin/test"):
-                mock_run.side_effect = OSError("Permission denied")
                 result = orchestrator.execute_tool(tool)
 
         assert result.success is False
@@ -500,9 +539,8 @@ def test_execute_tool_unexpected_error(self, temp_dir):
         tool = ExternalToolConfig(name="test", command="test cmd")
         orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
+        with patch("subprocess.Popen", side_effect=RuntimeError("Unexpected!")):
             with patch("shutil.which", return_value="/usr/bin/test"):
-                mock_run.side_effect = RuntimeError("Unexpected!")
                 result = orchestrator.execute_tool(tool)
 
         assert result.success is False
@@ -515,12 +553,12 @@ def test_execute_tool_custom_timeout(self, temp_dir):
             [tool], working_dir=temp_dir, default_timeout=300
         )
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(stdout="hello\n", stderr="", returncode=0)
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value = _mock_process()
             orchestrator.execute_tool(tool, timeout=60)
 
-        # Verify subprocess was called with the overridden timeout
-        call_kwargs = mock_run.call_args[1]
+        # Verify the process was waited on with the overridden timeout
+        call_kwargs = mock_popen.return_value.communicate.call_args[1]
         assert call_kwargs["timeout"] == 60
 
     def test_execute_tool_uses_shell(self, temp_dir):
@@ -538,14 +576,14 @@ def test_execute_tool_uses_working_dir(self, temp_dir):
         tool = ExternalToolConfig(name="echo", command="echo test")
         orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
+        with patch("subprocess.Popen") as mock_popen:
             with patch("shutil.which", return_value="/usr/bin/echo"):
-                mock_run.return_value = Mock(stdout="test", stderr="", returncode=0)
+                mock_popen.return_value = _mock_process()
                 orchestrator.execute_tool(tool)
 
         # Verify working directory was passed to subprocess
-        mock_run.assert_called_once()
-        call_kwargs = mock_run.call_args[1]
+        mock_popen.assert_called_once()
+        call_kwargs = mock_popen.call_args[1]
         assert call_kwargs["cwd"] == temp_dir
 
     def test_execute_tool_with_env_vars(self, temp_dir):
@@ -556,9 +594,9 @@ def test_execute_tool_with_env_vars(self, temp_dir):
             tool = ExternalToolConfig(name="test", command="test $MY_FLAG")
             orchestrator = ToolOrchestrator([tool], working_dir=temp_dir)
 
-            with patch("subprocess.run") as mock_run:
+            with patch("subprocess.Popen") as mock_popen:
                 with patch("shutil.which", return_value="/usr/bin/test"):
-                    mock_run.return_value = Mock(stdout="", stderr="", returncode=0)
+                    mock_popen.return_value = _mock_process()
                     result = orchestrator.execute_tool(tool)
 
             # Verify command was expanded
@@ -602,19 +640,15 @@ def test_execute_all_continues_after_failure(self, temp_dir):
         ]
         orchestrator = ToolOrchestrator(tools, working_dir=temp_dir)
 
-        with patch("subprocess.run") as mock_run:
+        with patch("subprocess.Popen") as mock_popen:
             with patch("shutil.which") as mock_which:
-                # First tool exists, second doesn't, third exists
-                mock_which.side_effect = [
-                    "/usr/bin/echo",  # good1 exists
-                    None,  # bad doesn't exist
-                    "/usr/bin/echo",  # good2 exists
-                ]
-                mock_run.side_effect = [
-                    Mock(stdout="good1\n", stderr="", returncode=0),
-                    # bad_tool never reaches subprocess
-                    Mock(stdout="good2\n", stderr="", returncode=0),
-                ]
+                # Tools run concurrently, so answer by executable, not call order:
+                # echo exists, bad_tool doesn't
+                mock_which.side_effect = lambda exe: (
+                    "/usr/bin/echo" if exe == "echo" else None
+                )
+                # bad_tool never reaches subprocess
+                mock_popen.return_value = _mock_process()
                 results = orchestrator.execute_all()
 
         assert len(results) == 3
@@ -646,11 +680,11 @@ def test_execute_all_custom_timeout(self, temp_dir):
             tools, working_dir=temp_dir, default_timeout=300
         )
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(stdout="test\n", stderr="", returncode=0)
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value = _mock_process()
             orchestrator.execute_all(timeout_per_tool=60)
 
-        call_kwargs = mock_run.call_args[1]
+        call_kwargs = mock_popen.return_value.communicate.call_args[1]
         assert call_kwargs["timeout"] == 60
 
 
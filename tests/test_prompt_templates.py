@@ -621,6 +621,13 @@ def test_default_template_has_sugar_cli_reference(self):
         assert "--urgent" in DEFAULT_TOOL_INTERPRETATION_TEMPLATE
         assert "--status [pending|hold]" in DEFAULT_TOOL_INTERPRETATION_TEMPLATE
 
+    def test_builtin_templates_put_dynamic_values_last(self):
+        """Test that placeholders only appear after the static instructions"""
+        for template in PromptTemplateManager.TEMPLATE_TYPES.values():
+            first_placeholder = template.index("${")
+            assert "## Important Notes" in template[:first_placeholder]
+            assert "## " not in template[first_placeholder:].split("\n", 3)[-1]
+
     def test_default_template_has_grouping_instructions(self):
         """Test that default template has grouping instructions"""
         assert "Grouping Strategy" in DEFAULT_TOOL_INTERPRETATION_TEMPLATE
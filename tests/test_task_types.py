@@ -107,7 +107,7 @@ def task_type_manager(temp_sugar_env):
     Args:
         temp_sugar_env: The temporary environment fixture providing db_path
 
-    Returns:
+    Yields:
         TaskTypeManager: Initialized manager ready for testing CRUD operations
     """
     db_path = str(temp_sugar_env["db_path"])
@@ -116,7 +116,10 @@ def task_type_manager(temp_sugar_env):
     # Initialize the database with default types via WorkQueue
     asyncio.run(_init_database(db_path))
 
-    return manager
+    yield manager
+
+    # Release the manager's shared connection
+    asyncio.run(manager.close())
 
 
 async def _init_database(db_path: str) -> None:
@@ -271,6 +274,51 @@ async def test_update_nonexistent_task_type(self, task_type_manager):
         success = await task_type_manager.update_task_type("nonexistent", name="Test")
         assert success is False
 
+    @pytest.mark.asyncio
+    async def test_remove_task_type_reports_refusal_reason(
+        self, task_type_manager, caplog
+    ):
+        """
+        Test that a refused removal logs why nothing was deleted.
+
+        The checks run inside a single DELETE, so the reason is reconstructed
+        afterwards for missing and default task types.
+        """
+        assert await task_type_manager.remove_task_type("nonexistent") is False
+        assert "Task type 'nonexistent' not found" in caplog.text
+
+        assert await task_type_manager.remove_task_type("bug_fix") is False
+        assert "Cannot delete default task type 'bug_fix'" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_noop_writes_do_not_lock_database(self, temp_sugar_env):
+        """
+        Test that an UPDATE or DELETE matching no rows ends its transaction.
+
+        On the shared connection a dangling write transaction would make every
+        other connection's writes fail with "database is locked".
+        """
+        import sqlite3
+
+        db_path = str(temp_sugar_env["db_path"])
+        await _init_database(db_path)
+
+        async with TaskTypeManager(db_path) as manager:
+            assert await manager.update_task_type("nope", name="Nope") is False
+            assert not manager._db.in_transaction
+            assert await manager.remove_task_type("bug_fix") is False
+            assert not manager._db.in_transaction
+
+            # timeout=0: fail at once instead of waiting out a held lock
+            other = sqlite3.connect(db_path, timeout=0)
+            try:
+                other.execute(
+                    "INSERT INTO task_types (id, name) VALUES ('other', 'Other')"
+                )
+                other.commit()
+            finally:
+                other.close()
+
     @pytest.mark.asyncio
     async def test_remove_custom_task_type(self, task_type_manager):
         """
@@ -459,6 +507,18 @@ async def test_export_import_task_types(self, task_type_manager):
         # Default types should NOT be included in export
         assert not any(t["id"] == "feature" for t in exported)
 
+        # Database-specific fields are not exported
+        for exported_type in exported:
+            assert set(exported_type) == {
+                "id",
+                "name",
+                "description",
+                "agent",
+                "commit_template",
+                "emoji",
+                "file_patterns",
+            }
+
         # Simulate backup restore scenario: remove then re-import
         await task_type_manager.remove_task_type("custom1")
         await task_type_manager.remove_task_type("custom2")
@@ -537,6 +597,267 @@ async def test_import_task_types_skips_entries_without_id(self, task_type_manage
         # Only the valid entry should exist
         assert await task_type_manager.get_task_type("valid_import") is not None
 
+    @pytest.mark.asyncio
+    async def test_import_task_types_mixed_batch(self, task_type_manager):
+        """
+        Test import_task_types() with new and existing types in one batch.
+
+        Inserts and updates are applied together; fields missing from an
+        update keep their stored values, and a repeated ID is treated as
+        already existing.
+        """
+        await task_type_manager.add_task_type(
+            "batch_existing", "Existing", agent="tech-lead", emoji="🔴"
+        )
+
+        import_data = [
+            {"id": "batch_new", "name": "Batch New", "file_patterns": ["src/"]},
+            {"id": "batch_existing", "name": "Renamed"},
+            {"id": "batch_new", "name": "Duplicate"},
+        ]
+
+        imported_count = await task_type_manager.import_task_types(
+            import_data, overwrite=False
+        )
+        assert imported_count == 1
+
+        new_type = await task_type_manager.get_task_type("batch_new")
+        assert new_type["name"] == "Batch New"
+        assert new_type["commit_template"] == "batch_new: {title}"
+        assert new_type["file_patterns"] == ["src/"]
+
+        imported_count = await task_type_manager.import_task_types(
+            import_data, overwrite=True
+        )
+        assert imported_count == 3
+
+        existing = await task_type_manager.get_task_type("batch_existing")
+        assert existing["name"] == "Renamed"
+        assert existing["agent"] == "tech-lead"
+        assert existing["emoji"] == "🔴"
+        assert (await task_type_manager.get_task_type("batch_new"))[
+            "name"
+        ] == "Duplicate"
+
+    @pytest.mark.asyncio
+    async def test_add_task_types_bulk(self, task_type_manager):
+        """
+        Test add_task_types_bulk() inserts all rows in a single transaction.
+
+        A duplicate ID anywhere in the batch rolls back the whole batch.
+        """
+        added = await task_type_manager.add_task_types_bulk(
+            [
+                {"id": "bulk_one", "name": "Bulk One", "agent": "tech-lead"},
+                {"id": "bulk_two", "file_patterns": ["docs/"]},
+                {"name": "No ID"},
+            ]
+        )
+        assert added == 2
+
+        bulk_two = await task_type_manager.get_task_type("bulk_two")
+        assert bulk_two["name"] == "Bulk_Two"
+        assert bulk_two["agent"] == "general-purpose"
+        assert bulk_two["commit_template"] == "bulk_two: {title}"
+        assert bulk_two["file_patterns"] == ["docs/"]
+        assert bulk_two["is_default"] == 0
+
+        added = await task_type_manager.add_task_types_bulk(
+            [{"id": "bulk_three"}, {"id": "bulk_one"}]
+        )
+        assert added == 0
+        assert await task_type_manager.get_task_type("bulk_three") is None
+
+    @pytest.mark.asyncio
+    async def test_connection_reused_until_closed(self, temp_sugar_env):
+        """
+        Test that a managed manager shares one connection until close() is called.
+
+        Closing releases the connection; later calls fall back to per-call
+        connections instead of reopening a shared one.
+        """
+        db_path = str(temp_sugar_env["db_path"])
+        await _init_database(db_path)
+        manager = TaskTypeManager(db_path)
+
+        async with manager:
+            await manager.get_all_task_types()
+            connection = manager._db
+            assert connection is not None
+
+            await manager.add_task_type("reuse_test", "Reuse Test")
+            await manager.get_task_type("reuse_test")
+            assert manager._db is connection
+
+        assert manager._db is None
+        await manager.close()  # Safe to call twice
+
+        assert await manager.get_task_type("reuse_test") is not None
+        assert manager._db is None
+
+    @pytest.mark.asyncio
+    async def test_unmanaged_manager_keeps_no_connection(self, task_type_manager):
+        """
+        Test that a manager used without async with/close() holds no connection.
+
+        Each call opens and closes its own connection, so nothing is left open
+        for a caller that never closes the manager.
+        """
+        await task_type_manager.get_all_task_types()
+        await task_type_manager.add_task_type("unmanaged_test", "Unmanaged Test")
+        assert await task_type_manager.get_agent_for_type("bug_fix") == "tech-lead"
+
+        assert task_type_manager._db is None
+
+    def test_unmanaged_manager_does_not_block_exit(self, temp_sugar_env):
+        """
+        Test that a process using an unclosed manager exits normally.
+
+        A connection left open keeps aiosqlite's non-daemon worker thread alive,
+        which would hang interpreter shutdown.
+        """
+        import subprocess
+        import sys
+
+        db_path = str(temp_sugar_env["db_path"])
+        asyncio.run(_init_database(db_path))
+        script = (
+            "import asyncio, sys\n"
+            "from sugar.storage.task_type_manager import TaskTypeManager\n"
+            "manager = TaskTypeManager(sys.argv[1])\n"
+            "print(asyncio.run(manager.get_agent_for_type('bug_fix')))\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script, db_path],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            cwd=Path(__file__).parent.parent,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "tech-lead"
+
+    @pytest.mark.asyncio
+    async def test_accessors_skip_loader_when_cache_warm(self, task_type_manager):
+        """
+        Test that per-type accessors read a warm cache without calling the loader.
+        """
+        # Only a managed manager keeps the cache
+        await task_type_manager.initialize()
+        await task_type_manager.get_task_type_ids()
+
+        with patch.object(task_type_manager, "_get_cache") as mock_loader:
+            assert await task_type_manager.validate_task_type_id("feature")
+            assert await task_type_manager.get_agent_for_type("bug_fix") == "tech-lead"
+            assert (
+                await task_type_manager.get_commit_template_for_type("test")
+                == "test: {title}"
+            )
+            assert await task_type_manager.get_file_patterns_for_type("test") == [
+                "tests/"
+            ]
+            assert (await task_type_manager.get_task_type("chore"))["name"] == "Chore"
+
+        mock_loader.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_accessors_trust_empty_warm_cache(self, task_type_manager):
+        """
+        Test that an empty but loaded cache is not treated as a cold one.
+        """
+        await task_type_manager.initialize()
+        task_type_manager._cache = {}
+
+        with patch.object(task_type_manager, "_get_cache") as mock_loader:
+            assert not await task_type_manager.validate_task_type_id("feature")
+            assert (
+                await task_type_manager.get_agent_for_type("bug_fix")
+                == "general-purpose"
+            )
+            assert await task_type_manager.get_task_type("chore") is None
+
+        mock_loader.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_open_one_connection(self, temp_sugar_env):
+        """
+        Test that concurrent first calls share a single opened connection.
+
+        The open/setup path is guarded by a lock, so racing callers must not
+        each open (and leak) their own connection.
+        """
+        import aiosqlite
+
+        await _init_database(str(temp_sugar_env["db_path"]))
+
+        async with TaskTypeManager(str(temp_sugar_env["db_path"])) as manager:
+            with patch(
+                "sugar.storage.task_type_manager.aiosqlite.connect",
+                wraps=aiosqlite.connect,
+            ) as mock_connect:
+                results = await asyncio.gather(
+                    manager.initialize(),
+                    manager.validate_task_type_id("bug_fix"),
+                    manager.get_task_type_ids(),
+                )
+
+            assert mock_connect.call_count == 1
+            assert results[1] is True
+            assert len(results[2]) == 6
+
+    @pytest.mark.asyncio
+    async def test_lookup_cache_invalidated_on_write(self, task_type_manager):
+        """
+        Test that single-type lookups are cached and refreshed after writes.
+
+        Add, update and remove must each drop the cache so later reads see
+        the change, and returned dicts must not alias the cached entries.
+        """
+        # Only a managed manager keeps the cache
+        await task_type_manager.initialize()
+        assert await task_type_manager.validate_task_type_id("bug_fix")
+        assert task_type_manager._cache is not None
+
+        await task_type_manager.add_task_type(
+            "cache_test", "Cache Test", file_patterns=["a.py"]
+        )
+        assert task_type_manager._cache is None
+        assert await task_type_manager.validate_task_type_id("cache_test")
+
+        fetched = await task_type_manager.get_task_type("cache_test")
+        fetched["file_patterns"].append("mutated.py")
+        assert await task_type_manager.get_file_patterns_for_type("cache_test") == [
+            "a.py"
+        ]
+
+        await task_type_manager.update_task_type("cache_test", agent="tech-lead")
+        assert await task_type_manager.get_agent_for_type("cache_test") == "tech-lead"
+
+        await task_type_manager.remove_task_type("cache_test")
+        assert not await task_type_manager.validate_task_type_id("cache_test")
+        assert "cache_test" not in await task_type_manager.get_task_type_ids()
+
+    @pytest.mark.asyncio
+    async def test_unmanaged_manager_sees_other_managers_writes(
+        self, task_type_manager
+    ):
+        """
+        Test that an unmanaged manager reads changes made through another one.
+
+        ClaudeWrapper keeps one unmanaged manager for the daemon's lifetime, so
+        task-type edits from a separate `sugar task-type` run must show up
+        without a restart.
+        """
+        assert await task_type_manager.get_agent_for_type("bug_fix") == "tech-lead"
+
+        async with TaskTypeManager(task_type_manager.db_path) as other:
+            assert await other.update_task_type("bug_fix", agent="code-reviewer")
+
+        assert await task_type_manager.get_agent_for_type("bug_fix") == "code-reviewer"
+        assert task_type_manager._cache is None
+
     @pytest.mark.asyncio
     async def test_cannot_remove_task_type_with_active_tasks(self, task_type_manager):
         """
@@ -1187,6 +1508,27 @@ def test_migration_is_idempotent(self, temp_sugar_env):
         task_types = asyncio.run(manager.get_all_task_types())
         assert len(task_types) == 6
 
+    def test_work_items_type_status_index_created(self, temp_sugar_env):
+        """
+        Test that WorkQueue.initialize() indexes work_items by (type, status).
+
+        remove_task_type() probes for active tasks of a type; the index keeps
+        that lookup from scanning the whole work_items table.
+        """
+        import sqlite3
+
+        db_path = str(temp_sugar_env["db_path"])
+        asyncio.run(WorkQueue(db_path).initialize())
+
+        with sqlite3.connect(db_path) as conn:
+            columns = [
+                row[2]
+                for row in conn.execute(
+                    "PRAGMA index_info('idx_work_items_type_status')"
+                )
+            ]
+        assert columns == ["type", "status"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])